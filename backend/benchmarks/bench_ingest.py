@@ -0,0 +1,51 @@
+"""
+Film ingest throughput for a few batch sizes.
+
+    python -m benchmarks.bench_ingest [rows]
+
+Streams a generated NDJSON catalog into /unified/bulk/films/ingest on a
+fresh SQLite database per run and prints the rows/s from the report.
+"""
+import json
+import sys
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.db.models import Base
+from src.db.postgres import get_db
+from src.main import app
+from src.services.film_search import film_search
+
+def _body(rows: int):
+    for i in range(rows):
+        yield (json.dumps({
+            "title": f"Film {i}",
+            "description": f"Generated film number {i} for the ingest benchmark",
+            "release_year": 1980 + i % 40,
+            "rental_rate": "2.99",
+            "length": 60 + i % 120,
+            "rating": "PG",
+        }) + "\n").encode()
+
+def main(rows: int = 100000):
+    print(f"{rows} films")
+    for batch_size in (100, 1000, 5000):
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        Base.metadata.create_all(bind=engine)
+        film_search.ensure_index(engine)
+        Session = sessionmaker(bind=engine)
+        app.dependency_overrides[get_db] = lambda: Session()
+        report = TestClient(app).post(
+            "/unified/bulk/films/ingest",
+            params={"batch_size": batch_size, "return_ids": False},
+            content=_body(rows),
+            headers={"Content-Type": "application/x-ndjson"},
+        ).json()
+        print(f"  batch {batch_size:5}  {report['inserted']} inserted  {report['rows_per_second']:10.0f} rows/s")
+    app.dependency_overrides.clear()
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,99 @@
+"""
+Login throughput and read latency during a login burst.
+
+    python -m benchmarks.bench_login [logins] [concurrency] [rounds]
+
+Runs the real /auth/login endpoint through TestClient against an in-memory
+SQLite database while a reader keeps calling /films/. "inline" hashes on
+the request threadpool like the old code; "pool" uses the bounded bcrypt pool
+(PASSWORD_HASH_WORKERS / PASSWORD_HASH_MAX_PENDING), so some logins may be
+shed with a 503.
+"""
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from starlette.concurrency import run_in_threadpool
+
+from src.core.config import settings
+from src.core.security import password_hasher, pwd_context
+from src.db.models import Base, Film, User
+from src.main import app
+from src.db.postgres import get_db
+
+def _client(rounds: int) -> TestClient:
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine)
+    with Session() as session:
+        pwd_context.update(bcrypt__rounds=rounds)
+        session.add(User(first_name="Bench", last_name="User", email="bench@example.com",
+                         password_hash=pwd_context.hash("secret")))
+        session.add_all([Film(film_id=i, title=f"Film {i}") for i in range(1, 200)])
+        session.commit()
+
+    def override_get_db():
+        db = Session()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    return TestClient(app)
+
+def _run(client: TestClient, logins: int, concurrency: int) -> dict:
+    read_latencies = []
+    done = threading.Event()
+
+    def reader():
+        while not done.is_set():
+            started = time.perf_counter()
+            client.get("/api/v1/films/", params={"limit": 50})
+            read_latencies.append(time.perf_counter() - started)
+
+    def login(_):
+        return client.post("/api/v1/auth/login", data={"username": "bench@example.com", "password": "secret"}).status_code
+
+    reader_thread = threading.Thread(target=reader)
+    reader_thread.start()
+    started = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as pool:
+        statuses = list(pool.map(login, range(logins)))
+    elapsed = time.perf_counter() - started
+    done.set()
+    reader_thread.join()
+
+    read_latencies.sort()
+    return {
+        "ok": statuses.count(200),
+        "shed": statuses.count(503),
+        "logins_per_s": statuses.count(200) / elapsed,
+        "read_p50_ms": statistics.median(read_latencies) * 1000,
+        "read_p95_ms": read_latencies[int(len(read_latencies) * 0.95)] * 1000,
+    }
+
+def main(logins: int = 64, concurrency: int = 32, rounds: int = settings.password_bcrypt_rounds):
+    client = _client(rounds)
+    pooled_run = password_hasher._run_async
+
+    # Old behaviour: hash on the request threadpool, like the former sync endpoints
+    password_hasher._run_async = run_in_threadpool
+    inline = _run(client, logins, concurrency)
+    password_hasher._run_async = pooled_run
+    pooled = _run(client, logins, concurrency)
+
+    print(f"{logins} logins, {concurrency} concurrent, bcrypt rounds {rounds}, "
+          f"pool {password_hasher.max_workers} workers / {password_hasher.max_pending} pending")
+    for name, result in (("inline", inline), ("pool", pooled)):
+        print(f"  {name:7} {result['ok']:4} ok {result['shed']:4} shed  {result['logins_per_s']:7.1f} logins/s  "
+              f"reads p50 {result['read_p50_ms']:7.1f} ms  p95 {result['read_p95_ms']:7.1f} ms")
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:4]))
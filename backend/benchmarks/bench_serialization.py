@@ -0,0 +1,80 @@
+"""
+Compare the default list response path with RowSerializer.
+
+    python -m benchmarks.bench_serialization [rows] [repeats]
+
+"default" is what a ``response_model=List[FilmResponse]`` endpoint does:
+load ORM objects, validate them with from_attributes, dump in JSON mode and
+render with the stdlib encoder. "fast" is RowSerializer: Core row tuples,
+precompiled converters and orjson. Both run against the same in-memory
+SQLite table and must produce identical bytes.
+"""
+import sys
+import time
+from decimal import Decimal
+from typing import List
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.core.serialization import RowSerializer
+from src.db.models import Base, Film
+from src.schemas import FilmResponse
+
+def _seed(session, rows: int):
+    session.add_all([
+        Film(
+            film_id=i,
+            title=f"Film {i} – «{i % 97}»",
+            description=f"A \"quoted\" description of film {i}\nwith two lines" if i % 5 else None,
+            release_year=1990 + i % 30,
+            rental_rate=Decimal("0.99") if i % 3 == 0 else Decimal("4.99"),
+            length=60 + i % 120,
+            rating=("G", "PG", "PG-13", "R", "NC-17")[i % 5],
+        )
+        for i in range(1, rows + 1)
+    ])
+    session.commit()
+
+def _best(func, repeats: int) -> float:
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+def main(rows: int = 5000, repeats: int = 20):
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine)
+    with Session() as session:
+        _seed(session, rows)
+
+    adapter = TypeAdapter(List[FilmResponse])
+    film_rows = RowSerializer(FilmResponse, Film)
+
+    def default_path() -> bytes:
+        with Session() as session:
+            films = session.query(Film).all()
+            value = adapter.validate_python(films, from_attributes=True)
+            return JSONResponse(adapter.dump_python(value, mode="json")).body
+
+    def fast_path() -> bytes:
+        with Session() as session:
+            return film_rows.response(film_rows.query(session).all()).body
+
+    if default_path() != fast_path():
+        raise SystemExit("fast path output differs from the default path")
+
+    default = _best(default_path, repeats)
+    fast = _best(fast_path, repeats)
+    print(f"{rows} rows, best of {repeats}")
+    print(f"  default  {default * 1000:8.2f} ms  {rows / default:10.0f} rows/s")
+    print(f"  fast     {fast * 1000:8.2f} ms  {rows / fast:10.0f} rows/s")
+    print(f"  speedup  {default / fast:8.2f}x  (identical output)")
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -6,16 +6,15 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent / "src"))
 
 from src.db.postgres import engine, SessionLocal
-from src.db.models import Base, User, Product
-from passlib.context import CryptContext
-
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from src.db.models import User, Product
+from src.db.migrations import migration_runner
+from src.core.security import get_password_hash
 
 def init_database():
     """Initialize database with tables and sample data"""
     
-    # Create tables
-    Base.metadata.create_all(bind=engine)
+    # Create tables and indexes
+    migration_runner.upgrade(engine)
     
     db = SessionLocal()
     
@@ -30,14 +29,14 @@ def init_database():
             User(
                 email="demo@skillstacker.com",
                 full_name="Demo User",
-                password_hash=pwd_context.hash("demo123"),
+                password_hash=get_password_hash("demo123"),
                 is_active=True,
                 is_admin=False
             ),
             User(
                 email="admin@skillstacker.com", 
                 full_name="Admin User",
-                password_hash=pwd_context.hash("admin123"),
+                password_hash=get_password_hash("admin123"),
                 is_active=True,
                 is_admin=True
             )
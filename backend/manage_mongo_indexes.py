@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""Compare, build and check the MongoDB indexes declared in src/db/mongo_indexes.py
+
+    python manage_mongo_indexes.py diff     # declared vs actual (default)
+    python manage_mongo_indexes.py ensure   # create what is missing
+    python manage_mongo_indexes.py explain  # flag hot queries still doing COLLSCAN
+
+diff and explain exit with status 1 when they find a problem, so they can
+gate a deploy.
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent / "src"))
+
+from src.db.mongo import close_mongo_client, get_mongo_client, get_sync_client
+from src.db.mongo_indexes import mongo_indexes
+
+def diff() -> bool:
+    ok = True
+    for namespace, changes in mongo_indexes.diff(get_sync_client()).items():
+        problems = {kind: names for kind, names in changes.items() if names}
+        print(f"{namespace}: {problems or 'in sync'}")
+        # Extra indexes cost writes but break nothing; only missing/changed fail
+        ok = ok and not changes["missing"] and not changes["changed"]
+    return ok
+
+def ensure() -> bool:
+    async def run():
+        try:
+            return await mongo_indexes.ensure_async(await get_mongo_client())
+        finally:
+            await close_mongo_client()
+
+    ok = True
+    for namespace, result in asyncio.run(run()).items():
+        print(f"{namespace}: {result}")
+        ok = ok and not isinstance(result, str)
+    return ok
+
+def explain() -> bool:
+    ok = True
+    for result in mongo_indexes.explain(get_sync_client()):
+        status = "COLLSCAN" if result["collscan"] else "ok"
+        detail = result.get("error") or " > ".join(stage for stage in result["stages"] if stage)
+        print(f"[{status}] {result['namespace']} {result['filter']} sort={result.get('sort')}: {detail}")
+        ok = ok and not result["collscan"]
+    return ok
+
+COMMANDS = {"diff": diff, "ensure": ensure, "explain": explain}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Manage declared MongoDB indexes")
+    parser.add_argument("command", nargs="?", default="diff", choices=COMMANDS)
+    args = parser.parse_args()
+    try:
+        sys.exit(0 if COMMANDS[args.command]() else 1)
+    except Exception as e:
+        print(f"Error: {e}")
+        sys.exit(1)
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""Apply and check the versioned schema migrations in src/db/migrations.py
+
+    python migrate.py          # apply pending migrations (default)
+    python migrate.py status   # applied and pending versions
+    python migrate.py verify   # exit 1 if a hot-path index is missing
+
+Run once per deploy, before the API processes start.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent / "src"))
+
+from src.db.postgres import engine
+from src.db.migrations import migration_runner
+
+def upgrade() -> bool:
+    ran = migration_runner.upgrade(engine)
+    for migration in ran:
+        print(f"Applied {migration.version}: {migration.name}")
+    if not ran:
+        print("Schema is up to date")
+    return verify()
+
+def status() -> bool:
+    applied = migration_runner.applied(engine)
+    for migration in migration_runner.migrations:
+        state = f"applied {applied[migration.version]}" if migration.version in applied else "pending"
+        print(f"{migration.version:>4}  {migration.name:<30} {state}")
+    return True
+
+def verify() -> bool:
+    missing = migration_runner.verify(engine)
+    for name in missing:
+        print(f"Missing index: {name}")
+    return not missing
+
+COMMANDS = {"upgrade": upgrade, "status": status, "verify": verify}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Database schema migrations")
+    parser.add_argument("command", nargs="?", default="upgrade", choices=COMMANDS)
+    args = parser.parse_args()
+    try:
+        sys.exit(0 if COMMANDS[args.command]() else 1)
+    except Exception as e:
+        print(f"Error: {e}")
+        sys.exit(1)
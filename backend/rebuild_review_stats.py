@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""Recompute the per-product review rollups (review_stats) from the reviews collection
+
+    python rebuild_review_stats.py             # rebuild now
+    python rebuild_review_stats.py --if-empty  # only if there are reviews but no rollups
+
+The deploy runs it with --if-empty after migrate.py, so the first deploy of
+the rollups (or a fresh restore of the reviews) starts from real numbers
+instead of zeros.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent / "src"))
+
+from src.db.mongo import get_mongo_db
+from src.services.review_stats import review_stats
+
+def rebuild(if_empty: bool = False):
+    """
+    Replace review_stats with a fresh aggregation over every review.
+
+    Run after restoring reviews from a backup, after the first deploy of the
+    rollups, or if a failed write left them out of step. Reviews written
+    while the rebuild runs may be missed; run it when writes are quiet.
+    """
+    mongo_db = get_mongo_db()
+    if mongo_db is None:
+        print("MongoDB unavailable")
+        # Don't hold up a deploy over the rollups; the next one retries
+        sys.exit(0 if if_empty else 1)
+    try:
+        products = review_stats.ensure_built(mongo_db) if if_empty else review_stats.rebuild(mongo_db)
+        if products is None:
+            print("Review stats already built")
+        else:
+            print(f"Rebuilt review stats for {products} products")
+    except Exception as e:
+        print(f"Error rebuilding review stats: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rebuild the per-product review rollups")
+    parser.add_argument("--if-empty", action="store_true", help="only rebuild when review_stats is empty")
+    rebuild(parser.parse_args().if_empty)
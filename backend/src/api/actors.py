@@ -1,20 +1,32 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
 from typing import List, Optional
+from src.core.conditional import conditional_get
+from src.core.counting import COUNT_MODE_PATTERN, count_query, set_total_count
 from src.core.dependencies import get_db
+from src.core.pagination import apply_keyset, set_next_cursor
+from src.core.serialization import RowSerializer
+from src.core.streaming import STREAM_FORMAT_PATTERN, stream_query
 from src.db.models import Actor
 from src.schemas import ActorResponse
 
 router = APIRouter()
 
+actor_rows = RowSerializer(ActorResponse, Actor)
+
 @router.get("/", response_model=List[ActorResponse])
 def get_actors(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(1000, ge=1, le=10000),
     search: Optional[str] = Query(None),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from X-Next-Cursor; replaces skip"),
+    count: Optional[str] = Query(None, pattern=COUNT_MODE_PATTERN, description="Total in X-Total-Count: none, exact, estimated or cached"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. actor_id,last_name"),
     db: Session = Depends(get_db)
 ):
-    query = db.query(Actor)
+    rows = actor_rows.project(fields)
+    query = rows.query(db)
     
     if search:
         query = query.filter(
@@ -22,11 +34,32 @@ def get_actors(
             (Actor.last_name.ilike(f"%{search}%"))
         )
     
-    return query.offset(skip).limit(limit).all()
+    set_total_count(response, count_query(query, count))
+    keyset = [Actor.actor_id]
+    query = apply_keyset(query, keyset, cursor)
+    if cursor is None:
+        query = query.offset(skip)
+    actors = query.limit(limit).all()
+    set_next_cursor(response, actors, keyset, limit)
+    return rows.response(actors, response)
 
 @router.get("/all", response_model=List[ActorResponse])
-def get_all_actors(db: Session = Depends(get_db)):
-    return db.query(Actor).all()
+def get_all_actors(
+    request: Request,
+    response: Response,
+    stream: Optional[str] = Query(None, pattern=STREAM_FORMAT_PATTERN, description="Stream as ndjson or a chunked json array"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. actor_id,last_name"),
+    db: Session = Depends(get_db)
+):
+    rows = actor_rows.project(fields)
+    not_modified = conditional_get(request, response, db, Actor)
+    if not_modified:
+        return not_modified
+    if stream:
+        streaming = stream_query(rows.query(db).order_by(Actor.actor_id), rows, stream)
+        streaming.headers.update(response.headers)
+        return streaming
+    return rows.response(rows.query(db).all(), response)
 
 @router.get("/stats")
 def get_actor_stats(db: Session = Depends(get_db)):
@@ -34,8 +67,13 @@ def get_actor_stats(db: Session = Depends(get_db)):
     return {"total_actors": total_actors}
 
 @router.get("/{actor_id}", response_model=ActorResponse)
-def get_actor(actor_id: int, db: Session = Depends(get_db)):
-    actor = db.query(Actor).filter(Actor.actor_id == actor_id).first()
+def get_actor(
+    actor_id: int,
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. actor_id,last_name"),
+    db: Session = Depends(get_db)
+):
+    rows = actor_rows.project(fields)
+    actor = rows.query(db).filter(Actor.actor_id == actor_id).first()
     if not actor:
         raise HTTPException(status_code=404, detail="Actor not found")
-    return actor
\ No newline at end of file
+    return rows.item_response(actor)
\ No newline at end of file
@@ -1,27 +1,23 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
+from starlette.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from passlib.context import CryptContext
 from jose import JWTError, jwt
 from datetime import datetime, timedelta
-from db.postgres import get_db
-from db.models import User
-from schemas import UserCreate, UserResponse, Token, UserLogin
-from core.config import settings
+from src.db.postgres import get_db
+from src.db.models import User
+from src.schemas import UserCreate, UserResponse, Token, UserLogin
+from src.core.config import settings
+from src.core.cache import response_cache
+from src.core.principal import invalidate_principal, principal_claims, resolve_principal
+from src.core.security import password_hasher
 import logging
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/v1/auth/login")
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
-
-def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
-
 def create_access_token(data: dict, expires_delta: timedelta = None):
     to_encode = data.copy()
     if expires_delta:
@@ -46,33 +42,57 @@ def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(
     except JWTError:
         raise credentials_exception
     
-    user = db.query(User).filter(User.email == email).first()
+    # Cached (or claims-only) lookup - see AUTH_PRINCIPAL_MODE
+    user = resolve_principal(payload, db, User)
     if user is None:
         raise credentials_exception
     return user
 
+def get_current_admin(current_user: User = Depends(get_current_user)):
+    if not current_user.is_admin:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    return current_user
+
+def _create_user(db: Session, user_data: UserCreate, hashed_password: str) -> User:
+    db_user = User(
+        email=user_data.email,
+        first_name=user_data.first_name,
+        last_name=user_data.last_name,
+        password_hash=hashed_password
+    )
+    db.add(db_user)
+    db.commit()
+    db.refresh(db_user)
+    return db_user
+
+def _update_password_hash(db: Session, user: User, new_hash: str):
+    user.password_hash = new_hash
+    db.commit()
+    db.refresh(user)
+
+# register and login are async so that bcrypt (awaited on the password
+# hasher's pool) never holds a request thread; their database calls still run
+# on the threadpool.
+
 @router.post("/register", response_model=Token)
-def register(user_data: UserCreate, db: Session = Depends(get_db)):
+async def register(user_data: UserCreate, db: Session = Depends(get_db)):
     """Register a new user"""
     try:
         # Check if user exists
-        existing_user = db.query(User).filter(User.email == user_data.email).first()
+        existing_user = await run_in_threadpool(
+            lambda: db.query(User).filter(User.email == user_data.email).first()
+        )
         if existing_user:
             raise HTTPException(status_code=400, detail="Email already registered")
         
         # Create new user
-        hashed_password = get_password_hash(user_data.password)
-        db_user = User(
-            email=user_data.email,
-            full_name=user_data.full_name,
-            password_hash=hashed_password
-        )
-        db.add(db_user)
-        db.commit()
-        db.refresh(db_user)
+        hashed_password = await password_hasher.hash_async(user_data.password)
+        db_user = await run_in_threadpool(_create_user, db, user_data, hashed_password)
+        response_cache.invalidate("users")
+        invalidate_principal(db_user.email)
         
         # Create access token
-        access_token = create_access_token(data={"sub": db_user.email})
+        access_token = create_access_token(data={"sub": db_user.email, **principal_claims(db_user)})
         
         return {
             "access_token": access_token,
@@ -87,21 +107,31 @@ def register(user_data: UserCreate, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail="Registration failed")
 
 @router.post("/login", response_model=Token)
-def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
+async def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
     """Login user"""
     try:
-        user = db.query(User).filter(User.email == form_data.username).first()
+        user = await run_in_threadpool(
+            lambda: db.query(User).filter(User.email == form_data.username).first()
+        )
         
-        if not user or not verify_password(form_data.password, user.password_hash):
+        valid, new_hash = (
+            await password_hasher.verify_and_update_async(form_data.password, user.password_hash)
+            if user else (False, None)
+        )
+        if not valid:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Incorrect email or password"
             )
         
-        if not user.is_active:
+        if not user.activebool:
             raise HTTPException(status_code=400, detail="Inactive user")
         
-        access_token = create_access_token(data={"sub": user.email})
+        # Stored hash predates the current bcrypt cost - upgrade it now that we know the password
+        if new_hash:
+            await run_in_threadpool(_update_password_hash, db, user, new_hash)
+        
+        access_token = create_access_token(data={"sub": user.email, **principal_claims(user)})
         
         return {
             "access_token": access_token,
@@ -0,0 +1,241 @@
+# =============================================================================
+# BULK DATA API - LARGE UPLOADS INTO POSTGRESQL AND MONGODB
+# =============================================================================
+# Served under /unified/bulk alongside unified_data.py. Bulk loads are
+# rare, so this module (and the ingest services it pulls in) is only
+# imported when the first bulk request arrives - see LAZY_ROUTERS in main.py.
+#
+# What this file does:
+# 1. JSON array uploads: validated up front, written in one go
+# 2. Streaming NDJSON/CSV uploads: parsed and written batch by batch
+# =============================================================================
+
+# Import necessary libraries
+from fastapi import APIRouter, Depends, HTTPException, Query, Request  # FastAPI components
+from sqlalchemy.orm import Session  # Database session management
+from typing import List, Optional, Dict, Any  # Type hints for better code
+import logging  # For error tracking and debugging
+from pymongo.database import Database  # MongoDB database handle
+from pymongo.errors import BulkWriteError  # Partial failures of unordered inserts
+from starlette.concurrency import run_in_threadpool  # Run sync checks from async endpoints
+
+# Import our custom modules
+from src.core.dependencies import get_db  # Database dependency injection
+from src.core.config import settings  # Application settings
+from src.core.cache import response_cache  # Write-driven invalidation
+from src.core.ingest import record_parser  # Streaming NDJSON/CSV upload parsing
+from src.db.mongo import get_mongo_client, get_mongo_db  # Shared pooled MongoDB clients
+from src.db.mongo_catalog import mongo_catalog  # Cached list of MongoDB databases/collections
+from src.services.film_ingest import film_ingest, film_values  # Batched film loading
+from src.services.document_ingest import (  # Batched review/publication loading
+    document_ingest, publication_document, review_document
+)
+from src.services.review_stats import review_stats  # Per-product review rollups
+
+# Create router instance - mounted at /unified like unified_data
+router = APIRouter()
+
+# Set up logging - helps us track what's happening in our application
+logger = logging.getLogger(__name__)
+
+def _build_documents(items: List[Dict[str, Any]], build) -> List[Dict[str, Any]]:
+    """Validate a JSON array upload up front; a bad item rejects the request with its position"""
+    documents = []
+    for position, item in enumerate(items):
+        try:
+            documents.append(build(item))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=f"Item {position}: {e}")
+    return documents
+
+def _insert_unordered(collection, documents: List[Dict[str, Any]]) -> tuple:
+    """
+    Unordered insert_many in BULK_INGEST_BATCH_SIZE chunks.
+    
+    Returns the inserted ids and the positions of documents MongoDB rejected
+    (e.g. duplicate keys) - the rest of each chunk is still written.
+    """
+    ids, errors = [], []
+    size = settings.bulk_ingest_batch_size
+    for start in range(0, len(documents), size):
+        chunk = documents[start:start + size]
+        failed = set()
+        try:
+            collection.insert_many(chunk, ordered=False)
+        except BulkWriteError as e:
+            for error in e.details.get("writeErrors", []):
+                failed.add(error["index"])
+                errors.append({"item": start + error["index"], "error": error.get("errmsg", "write error")})
+        ids.extend(str(document["_id"]) for position, document in enumerate(chunk) if position not in failed)
+    return ids, errors
+
+async def _ingest_documents(request: Request, collection_name: str, build, batch_size, concurrency, return_ids, on_inserted=None) -> Dict[str, Any]:
+    # One cheap check up front instead of every batch waiting for server selection
+    if await run_in_threadpool(get_mongo_db) is None:
+        raise HTTPException(status_code=503, detail="MongoDB unavailable")
+    client = await get_mongo_client()
+    database = client[settings.mongo_database]
+    parse = record_parser(request.headers.get("content-type"))
+    after_batch = None
+    if on_inserted is not None:
+        after_batch = lambda documents: on_inserted(database, documents)
+    return await document_ingest.ingest(
+        database[collection_name], parse(request.stream()), build, batch_size, concurrency, return_ids, after_batch
+    )
+
+@router.post("/bulk/reviews/ingest")
+async def ingest_reviews(
+    request: Request,
+    batch_size: Optional[int] = Query(None, ge=1, le=100000, description="Documents per insert_many (default BULK_INGEST_BATCH_SIZE)"),
+    concurrency: Optional[int] = Query(None, ge=1, le=32, description="Batches written at once (default BULK_INGEST_CONCURRENCY)"),
+    return_ids: bool = Query(False, description="Include inserted ids in each batch summary"),
+):
+    """
+    📦 STREAMING REVIEW INGEST - Backfill millions of reviews
+    
+    Send NDJSON (or CSV with Content-Type: text/csv). The body is parsed as it
+    uploads and written with unordered insert_many, several batches at a time.
+    created_at/updated_at in the records are kept, so historical reviews keep
+    their dates. Each batch's reviews are folded into the per-product rating
+    rollups with one $inc per product.
+    
+    Returns:
+        inserted/failed totals, docs per second and a per-batch summary with
+        the line numbers of rejected records
+    """
+    report = await _ingest_documents(
+        request, "reviews", review_document, batch_size, concurrency, return_ids, review_stats.record_created_async
+    )
+    if report["inserted"]:
+        response_cache.invalidate("reviews")
+    return report
+
+@router.post("/bulk/publications/ingest")
+async def ingest_publications(
+    request: Request,
+    batch_size: Optional[int] = Query(None, ge=1, le=100000, description="Documents per insert_many (default BULK_INGEST_BATCH_SIZE)"),
+    concurrency: Optional[int] = Query(None, ge=1, le=32, description="Batches written at once (default BULK_INGEST_CONCURRENCY)"),
+    return_ids: bool = Query(False, description="Include inserted ids in each batch summary"),
+):
+    """
+    📦 STREAMING PUBLICATION INGEST - Same as /bulk/reviews/ingest for publications
+    
+    In CSV uploads, separate multiple groups with "|".
+    """
+    report = await _ingest_documents(request, "publications", publication_document, batch_size, concurrency, return_ids)
+    if report["inserted"]:
+        response_cache.invalidate("publications")
+        mongo_catalog.register(settings.mongo_database, "publications")
+    return report
+
+@router.post("/bulk/publications")
+def bulk_create_publications(
+    publications: List[Dict[str, Any]],
+    mongo_db: Optional[Database] = Depends(get_mongo_db)
+):
+    """Bulk create publications in MongoDB"""
+    try:
+        if mongo_db is None:
+            raise HTTPException(status_code=503, detail="MongoDB unavailable")
+        
+        publication_docs = _build_documents(publications, publication_document)
+        ids, errors = _insert_unordered(mongo_db.publications, publication_docs)
+        response_cache.invalidate("publications")
+        mongo_catalog.register(mongo_db.name, "publications")
+        return {
+            "message": f"Created {len(ids)} publications successfully",
+            "count": len(ids),
+            "ids": ids,
+            "errors": errors
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Bulk create publications error: {e}")
+        raise HTTPException(status_code=500, detail="Failed to bulk create publications")
+
+@router.post("/bulk/films")
+def bulk_create_films(
+    films: List[Dict[str, Any]],
+    db: Session = Depends(get_db)
+):
+    """
+    Bulk create films from a JSON array - all or nothing, in one transaction.
+    
+    For large catalogs use POST /bulk/films/ingest, which streams the upload
+    and commits batch by batch.
+    """
+    # Step 1: Validate every film before touching the database
+    rows = []
+    for position, film_data in enumerate(films):
+        try:
+            rows.append(film_values(film_data))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=f"Film {position}: {e}")
+    
+    try:
+        # Step 2: One multi-row INSERT ... RETURNING (split into batches by SQLAlchemy)
+        ids = film_ingest.insert_batch(db, rows) if rows else []
+        response_cache.invalidate("films")
+        return {
+            "message": f"Created {len(ids)} films successfully",
+            "count": len(ids),
+            "ids": ids
+        }
+    except Exception as e:
+        logger.error(f"Bulk create films error: {e}")
+        raise HTTPException(status_code=500, detail="Failed to bulk create films")
+
+@router.post("/bulk/films/ingest")
+async def ingest_films(
+    request: Request,
+    batch_size: Optional[int] = Query(None, ge=1, le=50000, description="Rows per transaction (default BULK_INGEST_BATCH_SIZE)"),
+    return_ids: bool = Query(True, description="Include the generated film_ids in the report"),
+    db: Session = Depends(get_db)
+):
+    """
+    📦 STREAMING FILM INGEST - Load hundreds of thousands of films
+    
+    Send the films as NDJSON (one JSON object per line) or, with
+    Content-Type: text/csv, as CSV with a header row. The body is parsed while
+    it uploads and written in batches; each batch commits on its own, so a bad
+    row or batch is reported without losing the rest.
+    
+    Returns:
+        inserted/failed totals, generated film_ids, rows per second and a
+        per-batch summary with the line numbers of rejected rows
+    """
+    parse = record_parser(request.headers.get("content-type"))
+    report = await film_ingest.ingest(db, parse(request.stream()), batch_size, return_ids)
+    if report["inserted"]:
+        response_cache.invalidate("films")
+    return report
+
+@router.post("/bulk/reviews")
+def bulk_create_reviews(
+    reviews: List[Dict[str, Any]],
+    mongo_db: Optional[Database] = Depends(get_mongo_db)
+):
+    """Bulk create reviews in MongoDB"""
+    try:
+        if mongo_db is None:
+            raise HTTPException(status_code=503, detail="MongoDB unavailable")
+        
+        review_docs = _build_documents(reviews, review_document)
+        ids, errors = _insert_unordered(mongo_db.reviews, review_docs)
+        rejected = {error["item"] for error in errors}
+        review_stats.record_created(
+            mongo_db, *(document for position, document in enumerate(review_docs) if position not in rejected)
+        )
+        response_cache.invalidate("reviews")
+        return {
+            "message": f"Created {len(ids)} reviews successfully",
+            "count": len(ids),
+            "ids": ids,
+            "errors": errors
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Bulk create reviews error: {e}")
+        raise HTTPException(status_code=500, detail="Failed to bulk create reviews")
\ No newline at end of file
@@ -1,19 +1,46 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
+from src.core.cache import cached
+from src.core.conditional import conditional_get
 from src.core.dependencies import get_db
+from src.core.serialization import RowSerializer
+from src.core.streaming import STREAM_FORMAT_PATTERN, stream_query
 from src.db.models import Category
 from src.schemas import CategoryResponse
 
 router = APIRouter()
 
-@router.get("/", response_model=List[CategoryResponse])
-def get_categories(db: Session = Depends(get_db)):
+category_rows = RowSerializer(CategoryResponse, Category)
+
+@cached("categories.list", ttl=3600, tags=["categories"], response_model=List[CategoryResponse])
+def _list_categories(db: Session):
     return db.query(Category).all()
 
+@router.get("/", response_model=List[CategoryResponse])
+def get_categories(request: Request, response: Response, db: Session = Depends(get_db)):
+    # Validators are checked before the response cache so a 304 costs one
+    # aggregate query and a 200 can still be served from the cache
+    not_modified = conditional_get(request, response, db, Category)
+    if not_modified:
+        return not_modified
+    return _list_categories(db=db)
+
 @router.get("/all", response_model=List[CategoryResponse])
-def get_all_categories(db: Session = Depends(get_db)):
-    return db.query(Category).all()
+def get_all_categories(
+    request: Request,
+    response: Response,
+    stream: Optional[str] = Query(None, pattern=STREAM_FORMAT_PATTERN, description="Stream as ndjson or a chunked json array"),
+    db: Session = Depends(get_db)
+):
+    not_modified = conditional_get(request, response, db, Category)
+    if not_modified:
+        return not_modified
+    if stream:
+        streaming = stream_query(db.query(Category).order_by(Category.category_id), CategoryResponse, stream)
+        streaming.headers.update(response.headers)
+        return streaming
+    return category_rows.response(category_rows.query(db).all(), response)
 
 @router.get("/stats")
 def get_category_stats(db: Session = Depends(get_db)):
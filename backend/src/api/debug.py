@@ -0,0 +1,54 @@
+# =============================================================================
+# DEBUG API - MONGODB INSPECTION
+# =============================================================================
+# Served at /unified/debug/mongodb alongside unified_data.py and imported on
+# first use only - see LAZY_ROUTERS in main.py.
+# =============================================================================
+
+from fastapi import APIRouter  # FastAPI components
+
+from src.core.config import settings  # Application settings
+from src.db.mongo import get_sync_client  # Shared pooled MongoDB client
+from src.db.mongo_catalog import mongo_catalog  # Cached list of MongoDB databases/collections
+
+router = APIRouter()
+
+@router.get("/debug/mongodb")
+def debug_mongodb():
+    """Debug endpoint to see what's in MongoDB"""
+    try:
+        client = get_sync_client()
+        client.admin.command('ping')
+        
+        debug_info = {
+            "connection": "success",
+            "databases": [],
+            "collections_found": []
+        }
+        
+        # The debug view always re-reads the server and refreshes the catalog
+        for db_name, collections in mongo_catalog.refresh().items():
+            db = client[db_name]
+            debug_info["databases"].append({
+                "name": db_name,
+                "collections": collections
+            })
+            
+            for collection_name in collections:
+                count = db[collection_name].count_documents({})
+                sample = list(db[collection_name].find().limit(1))
+                debug_info["collections_found"].append({
+                    "database": db_name,
+                    "collection": collection_name,
+                    "count": count,
+                    "sample_fields": list(sample[0].keys()) if sample else []
+                })
+
+        return debug_info
+        
+    except Exception as e:
+        return {
+            "connection": "failed",
+            "error": str(e),
+            "mongo_url": settings.mongo_url
+        }
@@ -1,31 +1,53 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from typing import List, Optional
+from src.core.cache import cached
+from src.core.conditional import conditional_get
+from src.core.counting import COUNT_MODE_PATTERN, count_query, set_total_count
 from src.core.dependencies import get_db
+from src.core.pagination import apply_keyset, set_next_cursor
+from src.core.serialization import RowSerializer
+from src.core.streaming import STREAM_FORMAT_PATTERN, stream_query
 from src.db.models import Film
 from src.schemas import FilmResponse
+from src.services.film_search import film_search
 
 router = APIRouter()
 
+film_rows = RowSerializer(FilmResponse, Film)
+
 @router.get("/", response_model=List[FilmResponse])
 def get_films(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(1000, ge=1, le=10000),
     search: Optional[str] = Query(None, description="Search in title or description"),
     rating: Optional[str] = Query(None, description="Filter by rating (G, PG, PG-13, R, NC-17)"),
     min_year: Optional[int] = Query(None, description="Minimum release year"),
     max_year: Optional[int] = Query(None, description="Maximum release year"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from X-Next-Cursor; replaces skip"),
+    count: Optional[str] = Query(None, pattern=COUNT_MODE_PATTERN, description="Total in X-Total-Count: none, exact, estimated or cached"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. film_id,title,rating"),
     db: Session = Depends(get_db)
 ):
-    """Get films with filtering and pagination - shows ALL 1000 films by default"""
-    query = db.query(Film)
+    """Get films with filtering and pagination - shows ALL 1000 films by default
+
+    Pass the X-Next-Cursor header of a page back as ``cursor`` to fetch the
+    next one with a keyset seek instead of an OFFSET scan. Searches use the
+    full-text index and are ranked by relevance, so they page with ``skip``.
+    The total is only counted when ``count`` asks for it. ``fields`` limits
+    both the SELECT and the payload to the named columns (film_id is always
+    included).
+    """
+    if search and cursor:
+        raise HTTPException(status_code=400, detail="cursor cannot be combined with search; use skip")
+    
+    rows = film_rows.project(fields)
+    query = rows.query(db)
     
     if search:
-        search_term = f"%{search}%"
-        query = query.filter(
-            (Film.title.ilike(search_term)) | 
-            (Film.description.ilike(search_term))
-        )
+        query = film_search.apply(query, search)
     
     if rating:
         query = query.filter(Film.rating == rating)
@@ -36,47 +58,140 @@ def get_films(
     if max_year:
         query = query.filter(Film.release_year <= max_year)
     
-    total = query.count()
-    films = query.offset(skip).limit(limit).all()
+    set_total_count(response, count_query(query, count))
+    keyset = [Film.film_id]
+    query = apply_keyset(query, keyset, cursor)
+    if cursor is None:
+        query = query.offset(skip)
+    films = query.limit(limit).all()
+    if not search:
+        set_next_cursor(response, films, keyset, limit)
     
-    return films
+    return rows.response(films, response)
 
 @router.get("/all", response_model=List[FilmResponse])
-def get_all_films(db: Session = Depends(get_db)):
-    """Get ALL 1000 films without any pagination"""
-    return db.query(Film).all()
+def get_all_films(
+    request: Request,
+    response: Response,
+    stream: Optional[str] = Query(None, pattern=STREAM_FORMAT_PATTERN, description="Stream as ndjson or a chunked json array"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. film_id,title,rating"),
+    db: Session = Depends(get_db)
+):
+    """Get ALL 1000 films without any pagination
 
-@router.get("/stats")
-def get_film_stats(db: Session = Depends(get_db)):
-    """Get comprehensive film statistics"""
-    total_films = db.query(Film).count()
-    
-    # Get all ratings
-    ratings = db.query(Film.rating).distinct().all()
-    rating_counts = {}
-    for rating in ratings:
-        if rating[0]:
-            count = db.query(Film).filter(Film.rating == rating[0]).count()
-            rating_counts[rating[0]] = count
-    
-    # Get year range
-    years = db.query(Film.release_year).filter(Film.release_year.isnot(None)).all()
-    year_list = [y[0] for y in years if y[0]]
-    
+    Sends ETag and Last-Modified; a conditional request for an unchanged
+    catalog gets a 304 with no body.
+    """
+    rows = film_rows.project(fields)
+    not_modified = conditional_get(request, response, db, Film)
+    if not_modified:
+        return not_modified
+    if stream:
+        streaming = stream_query(rows.query(db).order_by(Film.film_id), rows, stream)
+        streaming.headers.update(response.headers)
+        return streaming
+    return rows.response(rows.query(db).all(), response)
+
+def _percentile(histogram: dict, p: float) -> Optional[float]:
+    """Linearly interpolated percentile (same as percentile_cont) of a value -> count histogram"""
+    n = sum(histogram.values())
+    if n == 0:
+        return None
+    position = p * (n - 1)
+    lower_rank, upper_rank = int(position), min(int(position) + 1, n - 1)
+    lower = upper = None
+    seen = 0
+    for value in sorted(histogram):
+        seen += histogram[value]
+        if lower is None and seen > lower_rank:
+            lower = float(value)
+        if seen > upper_rank:
+            upper = float(value)
+            break
+    return lower + (upper - lower) * (position - int(position))
+
+PERCENTILES = {"p50": 0.5, "p90": 0.9}
+
+def _aggregate_columns(name: str, column, postgres: bool) -> list:
+    columns = [
+        func.avg(column).label(f"{name}_avg"),
+        func.min(column).label(f"{name}_min"),
+        func.max(column).label(f"{name}_max"),
+    ]
+    if postgres:
+        columns += [
+            func.percentile_cont(p).within_group(column).label(f"{name}_{key}")
+            for key, p in PERCENTILES.items()
+        ]
+    return columns
+
+def _float(value) -> Optional[float]:
+    return float(value) if value is not None else None
+
+def _distribution(db: Session, totals, name: str, column, postgres: bool) -> dict:
+    avg = totals[f"{name}_avg"]
+    distribution = {
+        "avg": round(float(avg), 2) if avg is not None else None,
+        "min": _float(totals[f"{name}_min"]),
+        "max": _float(totals[f"{name}_max"]),
+    }
+    if postgres:
+        distribution.update({key: _float(totals[f"{name}_{key}"]) for key in PERCENTILES})
+    else:
+        # SQLite has no percentile_cont: interpolate over the column's
+        # histogram, one row per distinct value
+        histogram = dict(db.query(column, func.count()).filter(column.isnot(None)).group_by(column).all())
+        distribution.update({key: _percentile(histogram, p) for key, p in PERCENTILES.items()})
+    return distribution
+
+def _compute_film_stats(db: Session) -> dict:
+    # Aggregated by the database: film counts per rating (a handful of rows)
+    # and one row of overall totals, averages, bounds and percentiles
+    postgres = db.get_bind().dialect.name == "postgresql"
+    ratings = db.query(Film.rating, func.count()).filter(Film.rating.isnot(None)).group_by(Film.rating).all()
+    totals = db.query(
+        func.count().label("total_films"),
+        func.min(Film.release_year).label("min_year"),
+        func.max(Film.release_year).label("max_year"),
+        *_aggregate_columns("rental_rate", Film.rental_rate, postgres),
+        *_aggregate_columns("length", Film.length, postgres),
+    ).one()._mapping
+
+    rental_rate = _distribution(db, totals, "rental_rate", Film.rental_rate, postgres)
     return {
-        "total_films": total_films,
-        "ratings": rating_counts,
+        "total_films": totals["total_films"],
+        "ratings": {rating: count for rating, count in ratings},
         "year_range": {
-            "min": min(year_list) if year_list else None,
-            "max": max(year_list) if year_list else None
+            "min": totals["min_year"],
+            "max": totals["max_year"]
         },
-        "avg_rental_rate": float(db.query(Film.rental_rate).filter(Film.rental_rate.isnot(None)).all()[0][0]) if total_films > 0 else 0
+        "avg_rental_rate": rental_rate["avg"] or 0,
+        "rental_rate": rental_rate,
+        "length": _distribution(db, totals, "length", Film.length, postgres),
     }
 
+@router.get("/stats")
+@cached("films.stats", ttl=300, tags=["films"])
+def get_film_stats(
+    fresh: bool = Query(False, description="Bypass the cached result"),
+    db: Session = Depends(get_db)
+):
+    """Get comprehensive film statistics
+
+    Computed with two small aggregate queries and served from the response
+    cache until a film is written or ``fresh`` is passed.
+    """
+    return _compute_film_stats(db)
+
 @router.get("/{film_id}", response_model=FilmResponse)
-def get_film(film_id: int, db: Session = Depends(get_db)):
+def get_film(
+    film_id: int,
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. film_id,title,rating"),
+    db: Session = Depends(get_db)
+):
     """Get a specific film by ID"""
-    film = db.query(Film).filter(Film.film_id == film_id).first()
+    rows = film_rows.project(fields)
+    film = rows.query(db).filter(Film.film_id == film_id).first()
     if not film:
         raise HTTPException(status_code=404, detail="Film not found")
-    return film
\ No newline at end of file
+    return rows.item_response(film)
\ No newline at end of file
@@ -0,0 +1,41 @@
+from fastapi import APIRouter, Depends
+from src.core.cache import response_cache
+from src.core.security import password_hasher
+from src.core.startup import startup_profile
+from src.api.auth import get_current_admin
+from src.db.pool_metrics import pool_metrics
+from src.db.postgres import engine
+
+# Internal operational data: every endpoint is admin only
+router = APIRouter(dependencies=[Depends(get_current_admin)])
+
+@router.get("/cache")
+def get_cache_metrics():
+    """Hit/miss counters per route, size and evictions of the response cache"""
+    return response_cache.stats()
+
+@router.get("/password-hashing")
+def get_password_hashing_metrics():
+    """Queue depth, rejections and average duration of the bcrypt pool"""
+    return password_hasher.stats()
+
+@router.get("/db-pool")
+def get_db_pool_metrics():
+    """Pool size and usage, checkout wait/hold histograms, overflow checkouts, timeouts and connection lifetimes"""
+    return pool_metrics.stats(engine)
+
+@router.get("/db-pool/connections")
+def get_checked_out_connections():
+    """Connections checked out right now and how long they have been held"""
+    return {"pool": pool_metrics.stats(engine)["pool"], "checked_out": pool_metrics.checked_out()}
+
+@router.get("/startup")
+def get_startup_profile():
+    """Time spent in each startup phase, including routers loaded on first use"""
+    return startup_profile.report()
+
+@router.post("/cache/clear")
+def clear_cache():
+    """Drop every cached response"""
+    response_cache.clear()
+    return {"message": "Cache cleared"}
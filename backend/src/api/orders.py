@@ -1,9 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from typing import List
-from db.postgres import get_db
-from db.models import User, Order, Product
-from api.auth import get_current_user
+from src.db.postgres import get_db
+from src.db.models import User, Order, Product
+from src.api.auth import get_current_user
 from pydantic import BaseModel
 import logging
 
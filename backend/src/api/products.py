@@ -1,7 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
 from typing import List, Optional
+from src.core.counting import COUNT_MODE_PATTERN, count_query, set_total_count
+from src.core.cache import cached
+from src.core.conditional import conditional_get
 from src.core.dependencies import get_db
+from src.core.pagination import apply_keyset, set_next_cursor
+from src.core.serialization import RowSerializer
+from src.core.streaming import STREAM_FORMAT_PATTERN, stream_query
 from src.db.models import Film as Product
 from src.schemas import ProductResponse
 import logging
@@ -10,18 +16,25 @@ import math
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+product_rows = RowSerializer(ProductResponse, Product)
+
 @router.get("/", response_model=List[ProductResponse])
 def get_products(
+    response: Response,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(1000, ge=1, le=10000, description="Number of records to return (default: all)"),
     search: Optional[str] = Query(None, description="Search term for product name"),
     category: Optional[str] = Query(None, description="Filter by category"),
     min_rating: Optional[float] = Query(None, ge=0, le=5, description="Minimum rating filter"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from X-Next-Cursor; replaces skip"),
+    count: Optional[str] = Query(None, pattern=COUNT_MODE_PATTERN, description="Total in X-Total-Count: none, exact, estimated or cached"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. film_id,title,rating"),
     db: Session = Depends(get_db)
 ):
     """Get products with filtering and pagination"""
+    rows = product_rows.project(fields)
     try:
-        query = db.query(Product)
+        query = rows.query(db)
         
         # Apply filters
         if search:
@@ -36,26 +49,49 @@ def get_products(
         # if min_rating is not None:
         #     query = query.filter(Product.rating >= min_rating)
         
-        # Get total count for pagination
-        total = query.count()
+        # Total count for pagination - only when the caller asks for it
+        total = count_query(query, count)
+        set_total_count(response, total)
         
-        # Apply pagination
-        products = query.offset(skip).limit(limit).all()
+        # Apply pagination - keyset seek when a cursor is given, offset otherwise
+        keyset = [Product.film_id]
+        query = apply_keyset(query, keyset, cursor)
+        if cursor is None:
+            query = query.offset(skip)
+        products = query.limit(limit).all()
+        set_next_cursor(response, products, keyset, limit)
         
-        logger.info(f"Retrieved {len(products)} out of {total} total products")
-        return products
+        logger.info(f"Retrieved {len(products)} products (total: {total if total is not None else 'not counted'})")
+        return rows.response(products, response)
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error retrieving products: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @router.get("/all", response_model=List[ProductResponse])
-def get_all_products(db: Session = Depends(get_db)):
+def get_all_products(
+    request: Request,
+    response: Response,
+    stream: Optional[str] = Query(None, pattern=STREAM_FORMAT_PATTERN, description="Stream as ndjson or a chunked json array"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. film_id,title,rating"),
+    db: Session = Depends(get_db)
+):
     """Get ALL products without any limits - for frontend display"""
+    rows = product_rows.project(fields)
     try:
-        products = db.query(Product).all()
+        not_modified = conditional_get(request, response, db, Product)
+        if not_modified:
+            return not_modified
+        if stream:
+            streaming = stream_query(rows.query(db).order_by(Product.film_id), rows, stream)
+            streaming.headers.update(response.headers)
+            return streaming
+        
+        products = rows.query(db).all()
         logger.info(f"Retrieved ALL {len(products)} products")
-        return products
+        return rows.response(products, response)
         
     except Exception as e:
         logger.error(f"Error retrieving all products: {str(e)}")
@@ -78,29 +114,41 @@ def get_product_stats(db: Session = Depends(get_db)):
         logger.error(f"Error retrieving stats: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
+@cached("products.categories", ttl=3600, tags=["films"])
+def _list_ratings(db: Session):
+    ratings = db.query(Product.rating).distinct().all()
+    return [rating[0] for rating in ratings if rating[0]]
+
 @router.get("/categories")
-def get_categories(db: Session = Depends(get_db)):
+def get_categories(request: Request, response: Response, db: Session = Depends(get_db)):
     """Get all available product categories (ratings)"""
     try:
-        ratings = db.query(Product.rating).distinct().all()
-        return [rating[0] for rating in ratings if rating[0]]
+        not_modified = conditional_get(request, response, db, Product)
+        if not_modified:
+            return not_modified
+        return _list_ratings(db=db)
     except Exception as e:
         logger.error(f"Error retrieving categories: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @router.get("/{product_id}", response_model=ProductResponse)
-def get_product(product_id: int, db: Session = Depends(get_db)):
+def get_product(
+    product_id: int,
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. film_id,title,rating"),
+    db: Session = Depends(get_db)
+):
     """Get a specific product by ID"""
     try:
         if product_id <= 0:
             raise HTTPException(status_code=400, detail="Product ID must be positive")
         
-        product = db.query(Product).filter(Product.film_id == product_id).first()
+        rows = product_rows.project(fields)
+        product = rows.query(db).filter(Product.film_id == product_id).first()
         
         if not product:
             raise HTTPException(status_code=404, detail="Product not found")
         
-        return product
+        return rows.item_response(product)
         
     except HTTPException:
         raise
@@ -1,26 +1,44 @@
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Response
 from typing import List, Optional, Dict, Any
 import pymongo
-from src.db.mongo import get_mongo_client
+from src.core.counting import COUNT_MODE_PATTERN, count_documents, set_total_count
+from src.db.mongo import get_publications_collection
+from src.services.publication_search import (
+    SCORE_PROJECTION, SCORE_SORT, publication_index, regex_query, text_query
+)
 
 router = APIRouter()
 
 @router.get("/")
 async def get_publications(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     search: Optional[str] = Query(None, description="Search in title"),
     type_filter: Optional[str] = Query(None, description="Filter by type (Journal, etc.)"),
-    group: Optional[str] = Query(None, description="Filter by group")
+    group: Optional[str] = Query(None, description="Filter by group"),
+    count: str = Query("estimated", pattern=COUNT_MODE_PATTERN, description="How to compute total: none, exact, estimated or cached")
 ):
-    """Get publications from MongoDB - 364,908 research publications available"""
+    """Get publications from MongoDB - 364,908 research publications available
+
+    ``total`` defaults to the collection metadata estimate when unfiltered
+    and is null for searches and filters, which would otherwise count every
+    match. Pass count=exact or count=cached to have them counted.
+    """
     
     try:
+        # Get publications collection
+        collection = await get_publications_collection()
+        use_text = bool(search) and await publication_index.has_index_async(collection)
+        
         # Build query
         query = {}
         
         if search:
-            query["title"] = {"$regex": search, "$options": "i"}
+            if use_text:
+                query.update(text_query(search))
+            else:
+                query["title"] = {"$regex": search, "$options": "i"}
         
         if type_filter:
             query["type"] = type_filter
@@ -28,15 +46,16 @@ async def get_publications(
         if group:
             query["groups"] = {"$in": [group]}
         
-        # Get publications collection
-        client = await get_mongo_client()
-        collection = client["Publications-data"]["Publications"]
-        
         # Get total count
-        total = await collection.count_documents(query)
+        total = await count_documents(collection, query, count)
+        set_total_count(response, total)
         
-        # Get paginated results
-        cursor = collection.find(query).skip(skip).limit(limit)
+        # Get paginated results - best text matches first when searching
+        if use_text:
+            cursor = collection.find(query, SCORE_PROJECTION).sort(SCORE_SORT)
+        else:
+            cursor = collection.find(query)
+        cursor = cursor.skip(skip).limit(limit)
         publications = await cursor.to_list(length=limit)
         
         # Convert ObjectId to string for JSON serialization
@@ -57,8 +76,7 @@ async def get_publication_stats():
     """Get comprehensive publication statistics"""
     
     try:
-        client = await get_mongo_client()
-        collection = client["Publications-data"]["Publications"]
+        collection = await get_publications_collection()
         
         # Total count
         total = await collection.count_documents({})
@@ -72,25 +90,27 @@ async def get_publication_stats():
 @router.get("/search")
 async def search_publications(
     q: str = Query(..., description="Search query"),
-    limit: int = Query(20, ge=1, le=100)
+    limit: int = Query(20, ge=1, le=100),
+    skip: int = Query(0, ge=0)
 ):
-    """Advanced search in publications"""
+    """Advanced search in publications
+
+    Uses the weighted text index over title, related_title, groups and
+    subgroups and returns the most relevant matches first, each with its
+    ``score``. Until the index has been built it falls back to a regex scan.
+    """
     
     try:
-        client = await get_mongo_client()
-        collection = client["Publications-data"]["Publications"]
+        collection = await get_publications_collection()
         
-        # Text search query
-        query = {
-            "$or": [
-                {"title": {"$regex": q, "$options": "i"}},
-                {"related_title": {"$regex": q, "$options": "i"}},
-                {"groups": {"$in": [{"$regex": q, "$options": "i"}]}},
-                {"subgroups": {"$in": [{"$regex": q, "$options": "i"}]}}
-            ]
-        }
+        if await publication_index.has_index_async(collection):
+            mode = "text"
+            cursor = collection.find(text_query(q), SCORE_PROJECTION).sort(SCORE_SORT)
+        else:
+            mode = "regex"
+            cursor = collection.find(regex_query(q))
         
-        cursor = collection.find(query).limit(limit)
+        cursor = cursor.skip(skip).limit(limit)
         results = await cursor.to_list(length=limit)
         
         # Convert ObjectId to string
@@ -99,8 +119,11 @@ async def search_publications(
         
         return {
             "query": q,
+            "mode": mode,
+            "skip": skip,
+            "limit": limit,
             "results": results,
             "count": len(results)
         }
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error searching publications: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Error searching publications: {str(e)}")
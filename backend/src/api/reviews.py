@@ -1,70 +1,89 @@
-from fastapi import APIRouter
-from typing import List
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Response
+from typing import List, Optional
 import logging
-from pymongo import MongoClient
-from src.core.config import settings
+from pymongo.database import Database
+from src.core.pagination import NEXT_CURSOR_HEADER
+from src.db.mongo import get_mongo_db
+from src.services.review_feed import REVIEW_FEED_PROJECTION, feed_query, next_cursor
+from src.services.review_stats import review_stats
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
-def get_mongo_db():
-    """Get MongoDB database connection"""
-    try:
-        client = MongoClient(settings.mongo_url)
-        return client.skillstacker
-    except Exception as e:
-        logger.error(f"MongoDB connection error: {e}")
-        return None
+MAX_SUMMARY_PRODUCTS = 500  # product ids per batch summary request
 
 @router.get("/product/{product_id}")
-def get_product_reviews(product_id: int):
-    """Get reviews for a specific product"""
+def get_product_reviews(
+    product_id: int,
+    response: Response,
+    limit: int = Query(20, ge=1, le=100),
+    sort: str = Query("newest", pattern="^(newest|helpful)$", description="newest (created_at) or helpful (helpful_count)"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from X-Next-Cursor"),
+    db: Optional[Database] = Depends(get_mongo_db)
+):
+    """Get a page of reviews for a specific product
+
+    Pages are keyset seeks over a (product_id, sort key, _id) index, so the
+    100th page costs the same as the first. Pass the X-Next-Cursor header of
+    a page back as ``cursor`` to fetch the next one.
+    """
+    query, order = feed_query(product_id, sort, cursor)
+    if db is None:
+        raise HTTPException(status_code=503, detail="MongoDB unavailable")
     try:
-        db = get_mongo_db()
-        if db is not None:
-            reviews = list(db.reviews.find({"product_id": product_id}))
-            # Convert ObjectId to string
-            for review in reviews:
-                review["id"] = str(review["_id"])
-                del review["_id"]
-            return reviews
+        reviews = list(db.reviews.find(query, REVIEW_FEED_PROJECTION).sort(order).limit(limit))
     except Exception as e:
         logger.error(f"Error fetching reviews: {e}")
+        raise HTTPException(status_code=500, detail="Failed to fetch reviews")
     
-    # Fallback to mock data
-    return [
-        {
-            "id": "1",
-            "product_id": product_id,
-            "user_id": 1,
-            "rating": 5,
-            "title": "Great product!",
-            "content": "Really enjoyed this.",
-            "created_at": "2024-01-01T00:00:00Z",
-            "helpful_count": 5
-        }
-    ]
+    next_page = next_cursor(reviews, sort, limit)
+    if next_page:
+        response.headers[NEXT_CURSOR_HEADER] = next_page
+    # Convert ObjectId to string
+    for review in reviews:
+        review["id"] = str(review["_id"])
+        del review["_id"]
+    return reviews
 
 @router.get("/product/{product_id}/summary")
-def get_product_review_summary(product_id: int):
-    """Get review summary for a product"""
+def get_product_review_summary(product_id: int, db: Optional[Database] = Depends(get_mongo_db)):
+    """Get review summary for a product (one read of its review_stats rollup)"""
+    if db is None:
+        raise HTTPException(status_code=503, detail="MongoDB unavailable")
     try:
-        db = get_mongo_db()
-        if db is not None:
-            reviews = list(db.reviews.find({"product_id": product_id}))
-            if reviews:
-                total_reviews = len(reviews)
-                avg_rating = sum(r.get("rating", 0) for r in reviews) / total_reviews
-                return {
-                    "average_rating": round(avg_rating, 1),
-                    "total_reviews": total_reviews
-                }
+        return review_stats.summary(db, product_id)
     except Exception as e:
         logger.error(f"Error fetching review summary: {e}")
-    
-    # Fallback data
-    return {
-        "average_rating": 4.5,
-        "total_reviews": 1,
-        "rating_distribution": {"1": 0, "2": 0, "3": 0, "4": 0, "5": 1}
-    }
\ No newline at end of file
+        raise HTTPException(status_code=500, detail="Failed to fetch review summary")
+
+def _batch_summaries(product_ids: List[int], db: Optional[Database]):
+    product_ids = list(dict.fromkeys(product_ids))  # drop repeats, keep order
+    if len(product_ids) > MAX_SUMMARY_PRODUCTS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_SUMMARY_PRODUCTS} product ids per request")
+    if db is None:
+        raise HTTPException(status_code=503, detail="MongoDB unavailable")
+    try:
+        return review_stats.summaries(db, product_ids)
+    except Exception as e:
+        logger.error(f"Error fetching review summaries: {e}")
+        raise HTTPException(status_code=500, detail="Failed to fetch review summaries")
+
+@router.get("/summaries")
+def get_review_summaries(
+    product_ids: str = Query(..., description="Comma-separated product ids, e.g. 1,2,3"),
+    db: Optional[Database] = Depends(get_mongo_db)
+):
+    """Review summaries for many products at once (one $in read of review_stats)"""
+    try:
+        ids = [int(value) for value in product_ids.split(",") if value.strip()]
+    except ValueError:
+        raise HTTPException(status_code=400, detail="product_ids must be comma-separated integers")
+    return _batch_summaries(ids, db)
+
+@router.post("/summaries")
+def post_review_summaries(
+    product_ids: List[int] = Body(..., description="Product ids to summarize"),
+    db: Optional[Database] = Depends(get_mongo_db)
+):
+    """Same as GET /summaries, for id lists too long for a query string"""
+    return _batch_summaries(product_ids, db)
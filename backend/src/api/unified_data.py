@@ -7,24 +7,39 @@
 # What this file does:
 # 1. Provides unified search across all data sources
 # 2. Handles CRUD operations for Films, Actors, and Reviews
-# 3. Manages bulk operations for efficiency
-# 4. Provides statistics and analytics
+# 3. Provides statistics and analytics
+#
+# Bulk operations (bulk.py) and the MongoDB debug view (debug.py) share the
+# /unified prefix but live in their own modules, loaded on first use.
 # =============================================================================
 
 # Import necessary libraries
 from fastapi import APIRouter, Depends, HTTPException, Query  # FastAPI components
+from sqlalchemy import text  # Raw SQL for the per-source statement timeout
 from sqlalchemy.orm import Session  # Database session management
 from typing import List, Optional, Dict, Any, Union  # Type hints for better code
 import logging  # For error tracking and debugging
 import re  # Regular expressions for text processing
+import time  # Per-source search timing
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout  # Parallel search fan-out
 from datetime import datetime  # Date and time handling
-from pymongo import MongoClient  # MongoDB connection
+from pymongo.database import Database  # MongoDB database handle
 
 # Import our custom modules
 from src.core.dependencies import get_db  # Database dependency injection
+from src.api.auth import get_current_admin  # Admin-only maintenance endpoints
 from src.core.config import settings  # Application settings
+from src.core.cache import Uncached, cached, response_cache  # Read cache + write-driven invalidation
+from src.core.serialization import parse_fields  # Sparse fieldsets (?fields=)
+from src.db.mongo import get_mongo_db, get_sync_client  # Shared pooled MongoDB clients
+from src.db.mongo_catalog import mongo_catalog  # Cached list of MongoDB databases/collections
 from src.db.models import Film, Actor, Category, User, Rental, Payment  # PostgreSQL models
 from src.schemas import FilmResponse, ActorResponse, CategoryResponse, UserResponse  # Data validation schemas
+from src.services.film_search import film_search  # Full-text film search
+from src.services.review_stats import review_stats  # Per-product review rollups
+from src.services.publication_search import (  # Text-indexed publication search
+    SCORE_PROJECTION, SCORE_SORT, publication_index, text_query
+)
 
 # Create router instance - this groups all our API endpoints together
 router = APIRouter()
@@ -32,32 +47,38 @@ router = APIRouter()
 # Set up logging - helps us track what's happening in our application
 logger = logging.getLogger(__name__)
 
-def get_mongo_db():
-    """
-    Connect to MongoDB database safely
-    
-    This function:
-    1. Creates a connection to MongoDB using our settings
-    2. Tests the connection with a 'ping' command
-    3. Returns the database if successful, None if failed
-    4. Logs any errors for debugging
-    
-    Returns:
-        MongoDB database object or None if connection fails
-    """
-    try:
-        # Create MongoDB client with 5-second timeout
-        client = MongoClient(settings.mongo_url, serverSelectionTimeoutMS=5000)
-        
-        # Test if MongoDB is actually reachable
-        client.admin.command('ping')
-        
-        # Return our specific database
-        return client.skillstacker
-    except Exception as e:
-        # Log the error so we can debug connection issues
-        logger.error(f"MongoDB connection error: {e}")
-        return None
+# Sparse fieldsets for the detail endpoints: ?fields=title,rating returns only
+# those keys, and only the matching columns / document fields are read
+FILM_DETAIL_COLUMNS = {
+    "id": Film.film_id,
+    "title": Film.title,
+    "description": Film.description,
+    "release_year": Film.release_year,
+    "rental_rate": Film.rental_rate,
+    "length": Film.length,
+    "rating": Film.rating,
+}
+ACTOR_DETAIL_COLUMNS = {
+    "id": Actor.actor_id,
+    "first_name": Actor.first_name,
+    "last_name": Actor.last_name,
+}
+ACTOR_DETAIL_FIELDS = ["id", "first_name", "last_name", "full_name"]  # full_name is built from both names
+
+# MongoDB detail fields and the value used when a document lacks one
+REVIEW_DETAIL_FIELDS = {
+    "id": None, "title": "", "content": "", "rating": 0, "product_id": None,
+    "user_id": None, "created_at": None, "updated_at": None,
+}
+PUBLICATION_DETAIL_FIELDS = {
+    "id": None, "title": "", "content": "", "type": "article", "groups": [],
+    "author": None, "created_at": None, "updated_at": None,
+}
+FIELDS_DESCRIPTION = "Comma-separated fields to return (default: all)"
+
+def _mongo_projection(selected: List[str]) -> Dict[str, int]:
+    """Projection reading only the selected fields; _id is always returned"""
+    return {name: 1 for name in selected if name != "id"} or {"_id": 1}
 
 def sanitize_search_term(term: str) -> str:
     """
@@ -84,6 +105,203 @@ def sanitize_search_term(term: str) -> str:
     sanitized = re.sub(r'[^\w\s-]', '', term.strip())[:100]
     return sanitized
 
+# =============================================================================
+# UNIFIED SEARCH - one helper per data source
+# =============================================================================
+# Every source is searched on its own worker thread so the response time is
+# that of the slowest source still inside its time budget, not the sum of
+# all five. Each helper gets its own database session because SQLAlchemy
+# sessions must not be shared between threads.
+
+SEARCH_SOURCES = ["films", "actors", "users", "publications", "reviews"]
+
+# Bounded pool shared by all search requests - a stuck backend can tie up at
+# most this many threads instead of one per request
+_search_executor = ThreadPoolExecutor(
+    max_workers=settings.unified_search_max_workers,
+    thread_name_prefix="unified-search"
+)
+
+class SourceUnavailable(Exception):
+    """Raised by a search helper when its backend cannot be reached"""
+
+def _truncate(text: Optional[str], size: int = 200) -> str:
+    """Shorten long text fields for search result previews"""
+    text = text or ""
+    return text[:size] + "..." if len(text) > size else text
+
+def _statement_timeout(session: Session, budget: float):
+    """
+    Have PostgreSQL cancel this source's queries once its budget is spent.
+
+    A timed-out future cannot stop a query that is already running, so
+    without this the query would keep its worker thread and pooled
+    connection after the response has gone out. Scoped to the session's
+    transaction, like max_time_ms on the MongoDB sources. SQLite has no
+    equivalent and runs unbounded.
+    """
+    if session.get_bind().dialect.name == "postgresql":
+        session.execute(
+            text("SELECT set_config('statement_timeout', :ms, true)"),
+            {"ms": str(max(1, int(budget * 1000)))}
+        )
+
+def _search_films(bind, search_term: str, skip: int, limit: int, budget: float) -> List[Dict[str, Any]]:
+    # Full-text index lookup, best matches first (see services/film_search.py)
+    with Session(bind=bind) as session:
+        _statement_timeout(session, budget)
+        films = film_search.apply(session.query(Film), search_term).offset(skip).limit(limit).all()
+        return [
+            {
+                "id": f.film_id,
+                "title": f.title,
+                "description": f.description,
+                "rating": f.rating,
+                "length": f.length,
+                "type": "film"
+            } for f in films
+        ]
+
+def _search_actors(bind, search_term: str, skip: int, limit: int, budget: float) -> List[Dict[str, Any]]:
+    # Search both first name AND last name
+    with Session(bind=bind) as session:
+        _statement_timeout(session, budget)
+        actors = session.query(Actor).filter(
+            (Actor.first_name.ilike(f"%{search_term}%")) |
+            (Actor.last_name.ilike(f"%{search_term}%"))
+        ).offset(skip).limit(limit).all()
+        return [
+            {
+                "id": a.actor_id,
+                "name": f"{a.first_name} {a.last_name}",  # Combine first and last name
+                "first_name": a.first_name,
+                "last_name": a.last_name,
+                "type": "actor"
+            } for a in actors
+        ]
+
+def _search_users(bind, search_term: str, skip: int, limit: int, budget: float) -> List[Dict[str, Any]]:
+    # Search in first name, last name, OR email address
+    with Session(bind=bind) as session:
+        _statement_timeout(session, budget)
+        users = session.query(User).filter(
+            (User.first_name.ilike(f"%{search_term}%")) |
+            (User.last_name.ilike(f"%{search_term}%")) |
+            (User.email.ilike(f"%{search_term}%"))
+        ).offset(skip).limit(limit).all()
+        return [
+            {
+                "id": u.customer_id,
+                "name": f"{u.first_name} {u.last_name}",
+                "email": u.email,
+                "active": u.activebool,  # Whether user account is active
+                "type": "user"
+            } for u in users
+        ]
+
+def _search_publications(bind, search_term: str, skip: int, limit: int, budget: float) -> List[Dict[str, Any]]:
+    if get_mongo_db() is None:
+        raise SourceUnavailable("MongoDB unavailable")
+    
+    # Reuse the shared pooled client - it can reach every database.
+    # Up to three queries run one after another, so each gets max_time_ms
+    # from what is left of the budget rather than the whole of it, and no
+    # further option is tried once the budget is spent.
+    client = get_sync_client()
+    deadline = time.perf_counter() + budget
+    regex_filter = {"$or": [
+        {"title": {"$regex": search_term, "$options": "i"}},
+        {"content": {"$regex": search_term, "$options": "i"}}
+    ]}
+    
+    def max_time_ms() -> int:
+        return max(1, int((deadline - time.perf_counter()) * 1000))
+    
+    def spent() -> bool:
+        return time.perf_counter() >= deadline
+    
+    # Try different possible database and collection combinations
+    # Option 1: skillstacker.publications
+    publications = list(client[settings.mongo_database].publications.find(
+        regex_filter
+    ).skip(skip).limit(limit).max_time_ms(max_time_ms()))
+    
+    # Option 2: the research publications collection - ranked $text lookup
+    # once its text index exists, title regex scan until then
+    if not publications and not spent():
+        collection = client[settings.publications_database][settings.publications_collection]
+        if publication_index.has_index(collection):
+            cursor = collection.find(text_query(search_term), SCORE_PROJECTION).sort(SCORE_SORT)
+        else:
+            cursor = collection.find({"title": {"$regex": search_term, "$options": "i"}})
+        publications = list(cursor.skip(skip).limit(limit).max_time_ms(max_time_ms()))
+    
+    # Option 3: Any database with 'publications' collection
+    if not publications:
+        for db_name, collection_name in mongo_catalog.publication_collections():
+            if spent():
+                break
+            publications = list(client[db_name][collection_name].find(
+                regex_filter
+            ).skip(skip).limit(limit).max_time_ms(max_time_ms()))
+            if publications:
+                break
+    
+    return [
+        {
+            "id": str(p["_id"]),
+            "title": p.get("title", ""),
+            "content": _truncate(p.get("content")),
+            "type": p.get("type", "publication"),
+            "groups": p.get("groups", [])
+        } for p in publications
+    ]
+
+def _search_reviews(bind, search_term: str, skip: int, limit: int, budget: float) -> List[Dict[str, Any]]:
+    mongo_db = get_mongo_db()
+    if mongo_db is None:
+        raise SourceUnavailable("MongoDB unavailable")
+    
+    reviews = list(mongo_db.reviews.find(
+        {"$or": [
+            {"title": {"$regex": search_term, "$options": "i"}},
+            {"content": {"$regex": search_term, "$options": "i"}}
+        ]},
+        {"_id": 1, "title": 1, "content": 1, "rating": 1, "product_id": 1}
+    ).skip(skip).limit(limit).max_time_ms(max(1, int(budget * 1000))))
+    
+    return [
+        {
+            "id": str(r["_id"]),
+            "title": r.get("title", ""),
+            "content": _truncate(r.get("content")),
+            "rating": r.get("rating", 0),
+            "product_id": r.get("product_id"),
+            "type": "review"
+        } for r in reviews
+    ]
+
+SEARCH_HANDLERS = {
+    "films": _search_films,
+    "actors": _search_actors,
+    "users": _search_users,
+    "publications": _search_publications,
+    "reviews": _search_reviews,
+}
+
+def _source_budget(source: str) -> float:
+    """Seconds a source may take before its results are dropped"""
+    return settings.unified_search_source_timeouts.get(source, settings.unified_search_timeout_seconds)
+
+def _timed(handler, bind, search_term: str, skip: int, limit: int, deadline: float) -> tuple:
+    # The budget is counted from submission, so time spent queued for a pool
+    # thread is taken off what the handler's queries may use
+    started = time.perf_counter()
+    if started >= deadline:
+        raise FuturesTimeout()
+    items = handler(bind, search_term, skip, limit, deadline - started)
+    return items, time.perf_counter() - started
+
 @router.get("/search")
 def unified_search(
     q: str = Query(..., description="Search query"),
@@ -103,6 +321,10 @@ def unified_search(
     - Publications (articles in MongoDB)
     - Reviews (user reviews in MongoDB)
     
+    All sources are queried at the same time. A source that fails or runs
+    past its time budget contributes no results, and the "sources" field
+    reports the status and timing of each one.
+    
     Parameters:
         q: What you want to search for (required)
         category: Limit search to specific type (optional)
@@ -128,170 +350,40 @@ def unified_search(
             "actors": [],  # Actors found
             "users": [],  # Users found
             "publications": [],  # Articles/publications found
-            "reviews": []  # User reviews found
+            "reviews": [],  # User reviews found
+            "sources": {}  # Status and timing of each source
         }
         
-        # Step 3: Search Films (PostgreSQL Database)
-        # Only search films if no category specified OR category is "films"
-        if not category or category == "films":
-            # Query the database for films with titles containing our search term
-            # ilike = case-insensitive search ("Movie" matches "movie")
-            films = db.query(Film).filter(
-                Film.title.ilike(f"%{search_term}%")
-            ).offset(skip).limit(limit).all()
-            
-            # Convert database objects to simple dictionaries for JSON response
-            results["films"] = [
-                {
-                    "id": f.film_id,
-                    "title": f.title,
-                    "description": f.description,
-                    "rating": f.rating,
-                    "length": f.length,
-                    "type": "film"
-                } for f in films  # List comprehension - creates a list from database results
-            ]
+        # Step 3: Start every requested source at once
+        # Only search a source if no category specified OR it matches the category
+        bind = db.get_bind()
+        started = time.perf_counter()
+        futures = {}
+        for source in SEARCH_SOURCES:
+            if not category or category == source:
+                futures[source] = _search_executor.submit(
+                    _timed, SEARCH_HANDLERS[source], bind, search_term, skip, limit, started + _source_budget(source)
+                )
         
-        # Step 4: Search Actors (PostgreSQL Database)
-        if not category or category == "actors":
-            # Search both first name AND last name
-            # The | symbol means "OR" - match either first name OR last name
-            actors = db.query(Actor).filter(
-                (Actor.first_name.ilike(f"%{search_term}%")) |
-                (Actor.last_name.ilike(f"%{search_term}%"))
-            ).offset(skip).limit(limit).all()
-            
-            # Convert to JSON-friendly format
-            results["actors"] = [
-                {
-                    "id": a.actor_id,
-                    "name": f"{a.first_name} {a.last_name}",  # Combine first and last name
-                    "first_name": a.first_name,
-                    "last_name": a.last_name,
-                    "type": "actor"
-                } for a in actors
-            ]
-        
-        # Step 5: Search Users (PostgreSQL Database)
-        if not category or category == "users":
-            # Search in first name, last name, OR email address
-            users = db.query(User).filter(
-                (User.first_name.ilike(f"%{search_term}%")) |
-                (User.last_name.ilike(f"%{search_term}%")) |
-                (User.email.ilike(f"%{search_term}%"))
-            ).offset(skip).limit(limit).all()
-            
-            # Convert to JSON format
-            results["users"] = [
-                {
-                    "id": u.customer_id,
-                    "name": f"{u.first_name} {u.last_name}",
-                    "email": u.email,
-                    "active": u.activebool,  # Whether user account is active
-                    "type": "user"
-                } for u in users
-            ]
-        
-        # Step 6: Search Publications (MongoDB)
-        if not category or category == "publications":
+        # Step 4: Collect each source within its own budget
+        for source, future in futures.items():
+            remaining = _source_budget(source) - (time.perf_counter() - started)
             try:
-                # Connect directly to MongoDB with proper database/collection structure
-                client = MongoClient(settings.mongo_url, serverSelectionTimeoutMS=5000)
-                
-                # Try different possible database and collection combinations
-                publications = []
-                
-                # Option 1: skillstacker.publications
-                try:
-                    db = client.skillstacker
-                    publications = list(db.publications.find(
-                        {"$or": [
-                            {"title": {"$regex": search_term, "$options": "i"}},
-                            {"content": {"$regex": search_term, "$options": "i"}}
-                        ]}
-                    ).skip(skip).limit(limit))
-                except:
-                    pass
-                
-                # Option 2: Publications-data.Publications
-                if not publications:
-                    try:
-                        db = client["Publications-data"]
-                        publications = list(db["Publications"].find(
-                            {"title": {"$regex": search_term, "$options": "i"}}
-                        ).skip(skip).limit(limit))
-                    except:
-                        pass
-                
-                # Option 3: Any database with 'publications' collection
-                if not publications:
-                    try:
-                        for db_name in client.list_database_names():
-                            if db_name not in ['admin', 'local', 'config']:
-                                db = client[db_name]
-                                for collection_name in db.list_collection_names():
-                                    if 'publication' in collection_name.lower():
-                                        publications = list(db[collection_name].find(
-                                            {"$or": [
-                                                {"title": {"$regex": search_term, "$options": "i"}},
-                                                {"content": {"$regex": search_term, "$options": "i"}}
-                                            ]}
-                                        ).skip(skip).limit(limit))
-                                        if publications:
-                                            break
-                                if publications:
-                                    break
-                    except:
-                        pass
-                
-                results["publications"] = [
-                    {
-                        "id": str(p["_id"]),
-                        "title": p.get("title", ""),
-                        "content": p.get("content", "")[:200] + "..." if p.get("content") and len(p.get("content", "")) > 200 else p.get("content", ""),
-                        "type": p.get("type", "publication"),
-                        "groups": p.get("groups", [])
-                    } for p in publications
-                ]
-                
+                items, took = future.result(timeout=max(0, remaining))
+                results[source] = items
+                results["sources"][source] = {"status": "ok", "count": len(items), "took_ms": round(took * 1000, 1)}
+            except FuturesTimeout:
+                future.cancel()
+                logger.warning(f"Unified search: {source} exceeded its {_source_budget(source)}s budget")
+                results["sources"][source] = {"status": "timeout", "count": 0, "took_ms": round((time.perf_counter() - started) * 1000, 1)}
+            except SourceUnavailable:
+                results["sources"][source] = {"status": "unavailable", "count": 0, "took_ms": 0.0}
             except Exception as e:
-                logger.error(f"MongoDB publications search error: {e}")
-                results["publications"] = []
-        
-        # Search Reviews (MongoDB)
-        if not category or category == "reviews":
-            mongo_db = get_mongo_db()
-            if mongo_db is not None:
-                try:
-                    reviews = list(mongo_db.reviews.find(
-                        {"$or": [
-                            {"title": {"$regex": search_term, "$options": "i"}},
-                            {"content": {"$regex": search_term, "$options": "i"}}
-                        ]},
-                        {"_id": 1, "title": 1, "content": 1, "rating": 1, "product_id": 1}
-                    ).skip(skip).limit(limit))
-                    
-                    results["reviews"] = [
-                        {
-                            "id": str(r["_id"]),
-                            "title": r.get("title", ""),
-                            "content": r.get("content", "")[:200] + "..." if len(r.get("content", "")) > 200 else r.get("content", ""),
-                            "rating": r.get("rating", 0),
-                            "product_id": r.get("product_id"),
-                            "type": "review"
-                        } for r in reviews
-                    ]
-                except Exception as e:
-                    logger.error(f"MongoDB reviews search error: {e}")
+                logger.error(f"Unified search {source} error: {e}")
+                results["sources"][source] = {"status": "error", "count": 0, "took_ms": round((time.perf_counter() - started) * 1000, 1)}
         
         # Calculate total results
-        results["total_results"] = (
-            len(results["films"]) + 
-            len(results["actors"]) + 
-            len(results["users"]) + 
-            len(results["publications"]) + 
-            len(results["reviews"])
-        )
+        results["total_results"] = sum(len(results[source]) for source in SEARCH_SOURCES)
         
         return results
         
@@ -302,9 +394,14 @@ def unified_search(
         raise HTTPException(status_code=500, detail="Search failed")
 
 @router.get("/stats")
-def get_unified_stats(db: Session = Depends(get_db)):
+@cached("unified.stats", ttl=60, tags=["films", "actors", "categories", "users", "publications", "reviews"])
+def get_unified_stats(
+    db: Session = Depends(get_db),
+    mongo_db: Optional[Database] = Depends(get_mongo_db)
+):
     """Get comprehensive statistics from all data sources"""
     try:
+        degraded = mongo_db is None  # partial counts are returned but not cached
         stats = {
             "postgresql": {
                 "films": db.query(Film).count(),
@@ -321,30 +418,27 @@ def get_unified_stats(db: Session = Depends(get_db)):
         }
         
         # Get MongoDB stats
-        mongo_db = get_mongo_db()
         if mongo_db is not None:
             try:
                 # Publications - search all possible locations
                 try:
-                    client = MongoClient(settings.mongo_url)
+                    client = get_sync_client()
                     pub_count = 0
                     
-                    # Check all databases and collections for publications
-                    for db_name in client.list_database_names():
-                        if db_name not in ['admin', 'local', 'config']:
-                            db = client[db_name]
-                            for collection_name in db.list_collection_names():
-                                if 'publication' in collection_name.lower():
-                                    pub_count += db[collection_name].count_documents({})
+                    # Check every publication collection in the cached catalog
+                    for db_name, collection_name in mongo_catalog.publication_collections():
+                        pub_count += client[db_name][collection_name].count_documents({})
                     
                     stats["mongodb"]["publications"] = pub_count
                 except:
                     stats["mongodb"]["publications"] = 0
+                    degraded = True
                 
                 # Reviews from skillstacker database
                 stats["mongodb"]["reviews"] = mongo_db.reviews.count_documents({})
             except Exception as e:
                 logger.error(f"MongoDB stats error: {e}")
+                degraded = True
         
         stats["total"] = (
             stats["postgresql"]["films"] +
@@ -354,57 +448,30 @@ def get_unified_stats(db: Session = Depends(get_db)):
             stats["mongodb"]["reviews"]
         )
         
-        return stats
+        return Uncached(stats) if degraded else stats
         
     except Exception as e:
         logger.error(f"Stats error: {e}")
         raise HTTPException(status_code=500, detail="Failed to get statistics")
 
-@router.get("/debug/mongodb")
-def debug_mongodb():
-    """Debug endpoint to see what's in MongoDB"""
+@router.post("/catalog/refresh", dependencies=[Depends(get_current_admin)])
+def refresh_mongo_catalog():
+    """Re-discover MongoDB databases and collections now instead of waiting for the TTL (admin only)"""
     try:
-        client = MongoClient(settings.mongo_url, serverSelectionTimeoutMS=5000)
-        client.admin.command('ping')
-        
-        debug_info = {
-            "connection": "success",
-            "databases": [],
-            "collections_found": []
-        }
-        
-        for db_name in client.list_database_names():
-            if db_name not in ['admin', 'local', 'config']:
-                db = client[db_name]
-                collections = db.list_collection_names()
-                debug_info["databases"].append({
-                    "name": db_name,
-                    "collections": collections
-                })
-                
-                for collection_name in collections:
-                    count = db[collection_name].count_documents({})
-                    sample = list(db[collection_name].find().limit(1))
-                    debug_info["collections_found"].append({
-                        "database": db_name,
-                        "collection": collection_name,
-                        "count": count,
-                        "sample_fields": list(sample[0].keys()) if sample else []
-                    })
-        
-        return debug_info
-        
+        return {"databases": mongo_catalog.refresh()}
     except Exception as e:
-        return {
-            "connection": "failed",
-            "error": str(e),
-            "mongo_url": settings.mongo_url
-        }
+        logger.error(f"MongoDB catalog refresh error: {e}")
+        raise HTTPException(status_code=503, detail="MongoDB unavailable")
 
 @router.get("/categories")
-def get_all_categories(db: Session = Depends(get_db)):
+@cached("unified.categories", ttl=600, tags=["films", "categories", "publications"])
+def get_all_categories(
+    db: Session = Depends(get_db),
+    mongo_db: Optional[Database] = Depends(get_mongo_db)
+):
     """Get all available categories from all data sources"""
     try:
+        degraded = mongo_db is None  # partial lists are returned but not cached
         categories = {
             "film_ratings": [],
             "film_categories": [],
@@ -421,37 +488,35 @@ def get_all_categories(db: Session = Depends(get_db)):
         categories["film_categories"] = [c[0] for c in film_categories]
         
         # MongoDB categories
-        mongo_db = get_mongo_db()
         if mongo_db is not None:
             try:
                 # Publication types and groups - search all collections
                 try:
-                    client = MongoClient(settings.mongo_url)
+                    client = get_sync_client()
                     pub_types = set()
                     pub_groups = set()
                     
-                    for db_name in client.list_database_names():
-                        if db_name not in ['admin', 'local', 'config']:
-                            db = client[db_name]
-                            for collection_name in db.list_collection_names():
-                                if 'publication' in collection_name.lower():
-                                    try:
-                                        types = db[collection_name].distinct("type")
-                                        groups = db[collection_name].distinct("groups")
-                                        pub_types.update(types)
-                                        pub_groups.update([g for g in groups if g])
-                                    except:
-                                        pass
+                    for db_name, collection_name in mongo_catalog.publication_collections():
+                        try:
+                            collection = client[db_name][collection_name]
+                            types = collection.distinct("type")
+                            groups = collection.distinct("groups")
+                            pub_types.update(types)
+                            pub_groups.update([g for g in groups if g])
+                        except:
+                            degraded = True
                     
                     categories["publication_types"] = list(pub_types)
                     categories["publication_groups"] = list(pub_groups)
                 except:
                     categories["publication_types"] = []
                     categories["publication_groups"] = []
+                    degraded = True
             except Exception as e:
                 logger.error(f"MongoDB categories error: {e}")
+                degraded = True
         
-        return categories
+        return Uncached(categories) if degraded else categories
         
     except Exception as e:
         logger.error(f"Categories error: {e}")
@@ -511,6 +576,7 @@ def create_film(
         
         # Step 3: Save changes to database (commit the transaction)
         db.commit()
+        response_cache.invalidate("films")
         
         # Step 4: Refresh to get the auto-generated ID
         db.refresh(film)
@@ -528,7 +594,11 @@ def create_film(
         raise HTTPException(status_code=500, detail="Failed to create film")
 
 @router.get("/films/{film_id}")
-def get_film(film_id: int, db: Session = Depends(get_db)):
+def get_film(
+    film_id: int,
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    db: Session = Depends(get_db)
+):
     """
     🔍 READ FILM - Get details of a specific movie
     
@@ -539,28 +609,27 @@ def get_film(film_id: int, db: Session = Depends(get_db)):
     
     Parameters:
         film_id: The unique ID of the film to retrieve
+        fields: Only return these details, e.g. "title,rating" (optional)
         db: Database connection (automatically provided)
         
     Returns:
-        JSON with all film details
+        JSON with the requested film details (all of them by default)
     """
-    # Step 1: Search for the film in the database
-    film = db.query(Film).filter(Film.film_id == film_id).first()
+    # Step 1: Work out which columns we need - only those are selected
+    selected = parse_fields(fields, list(FILM_DETAIL_COLUMNS)) or list(FILM_DETAIL_COLUMNS)
     
-    # Step 2: Check if film exists
+    # Step 2: Search for the film in the database
+    film = db.query(*(FILM_DETAIL_COLUMNS[name] for name in selected)).filter(Film.film_id == film_id).first()
+    
+    # Step 3: Check if film exists
     if not film:
         raise HTTPException(status_code=404, detail="Film not found")
     
-    # Step 3: Return film details as JSON
-    return {
-        "id": film.film_id,
-        "title": film.title,
-        "description": film.description,
-        "release_year": film.release_year,
-        "rental_rate": str(film.rental_rate),  # Convert decimal to string for JSON
-        "length": film.length,
-        "rating": film.rating
-    }
+    # Step 4: Return film details as JSON
+    result = dict(zip(selected, film))
+    if "rental_rate" in result:
+        result["rental_rate"] = str(result["rental_rate"])  # Convert decimal to string for JSON
+    return result
 
 @router.put("/films/{film_id}")
 def update_film(
@@ -612,6 +681,7 @@ def update_film(
         
         # Step 3: Save changes to database
         db.commit()
+        response_cache.invalidate("films")
         return {"message": "Film updated successfully"}
     except HTTPException:
         # Re-raise HTTP exceptions (like 404)
@@ -652,6 +722,7 @@ def delete_film(film_id: int, db: Session = Depends(get_db)):
         
         # Step 3: Save changes (commit the deletion)
         db.commit()
+        response_cache.invalidate("films")
         return {"message": "Film deleted successfully"}
     except HTTPException:
         raise
@@ -677,6 +748,7 @@ def create_actor(
         actor = Actor(first_name=first_name, last_name=last_name)
         db.add(actor)
         db.commit()
+        response_cache.invalidate("actors")
         db.refresh(actor)
         return {"id": actor.actor_id, "name": f"{actor.first_name} {actor.last_name}", "message": "Actor created successfully"}
     except Exception as e:
@@ -685,16 +757,22 @@ def create_actor(
         raise HTTPException(status_code=500, detail="Failed to create actor")
 
 @router.get("/actors/{actor_id}")
-def get_actor(actor_id: int, db: Session = Depends(get_db)):
+def get_actor(
+    actor_id: int,
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    db: Session = Depends(get_db)
+):
     """Get a specific actor by ID"""
-    actor = db.query(Actor).filter(Actor.actor_id == actor_id).first()
+    selected = parse_fields(fields, ACTOR_DETAIL_FIELDS) or ACTOR_DETAIL_FIELDS
+    needs_names = "full_name" in selected
+    loaded = [name for name in ACTOR_DETAIL_COLUMNS if name in selected or (needs_names and name != "id")]
+    actor = db.query(*(ACTOR_DETAIL_COLUMNS[name] for name in loaded)).filter(Actor.actor_id == actor_id).first()
     if not actor:
         raise HTTPException(status_code=404, detail="Actor not found")
+    values = dict(zip(loaded, actor))
     return {
-        "id": actor.actor_id,
-        "first_name": actor.first_name,
-        "last_name": actor.last_name,
-        "full_name": f"{actor.first_name} {actor.last_name}"
+        name: f"{values['first_name']} {values['last_name']}" if name == "full_name" else values[name]
+        for name in selected
     }
 
 @router.put("/actors/{actor_id}")
@@ -714,6 +792,7 @@ def update_actor(
         if last_name: actor.last_name = last_name
         
         db.commit()
+        response_cache.invalidate("actors")
         return {"message": "Actor updated successfully"}
     except HTTPException:
         raise
@@ -732,6 +811,7 @@ def delete_actor(actor_id: int, db: Session = Depends(get_db)):
         
         db.delete(actor)
         db.commit()
+        response_cache.invalidate("actors")
         return {"message": "Actor deleted successfully"}
     except HTTPException:
         raise
@@ -747,11 +827,11 @@ def create_review(
     content: str,
     rating: int = Query(..., ge=1, le=5),
     product_id: Optional[int] = None,
-    user_id: Optional[int] = None
+    user_id: Optional[int] = None,
+    mongo_db: Optional[Database] = Depends(get_mongo_db)
 ):
     """Create a new review in MongoDB"""
     try:
-        mongo_db = get_mongo_db()
         if mongo_db is None:
             raise HTTPException(status_code=503, detail="MongoDB unavailable")
         
@@ -761,11 +841,14 @@ def create_review(
             "rating": rating,
             "product_id": product_id,
             "user_id": user_id,
+            "helpful_count": 0,
             "created_at": datetime.utcnow(),
             "updated_at": datetime.utcnow()
         }
         
         result = mongo_db.reviews.insert_one(review)
+        review_stats.record_created(mongo_db, review)  # Keep the product's rollup current
+        response_cache.invalidate("reviews")
         return {
             "id": str(result.inserted_id),
             "title": title,
@@ -779,27 +862,25 @@ def create_review(
         raise HTTPException(status_code=500, detail="Failed to create review")
 
 @router.get("/reviews/{review_id}")
-def get_review(review_id: str):
+def get_review(
+    review_id: str,
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    mongo_db: Optional[Database] = Depends(get_mongo_db)
+):
     """Get a specific review by ID"""
     try:
-        mongo_db = get_mongo_db()
         if mongo_db is None:
             raise HTTPException(status_code=503, detail="MongoDB unavailable")
         
+        selected = parse_fields(fields, list(REVIEW_DETAIL_FIELDS)) or list(REVIEW_DETAIL_FIELDS)
         from bson import ObjectId
-        review = mongo_db.reviews.find_one({"_id": ObjectId(review_id)})
+        review = mongo_db.reviews.find_one({"_id": ObjectId(review_id)}, _mongo_projection(selected))
         if not review:
             raise HTTPException(status_code=404, detail="Review not found")
         
         return {
-            "id": str(review["_id"]),
-            "title": review.get("title", ""),
-            "content": review.get("content", ""),
-            "rating": review.get("rating", 0),
-            "product_id": review.get("product_id"),
-            "user_id": review.get("user_id"),
-            "created_at": review.get("created_at"),
-            "updated_at": review.get("updated_at")
+            name: str(review["_id"]) if name == "id" else review.get(name, REVIEW_DETAIL_FIELDS[name])
+            for name in selected
         }
     except HTTPException:
         raise
@@ -812,11 +893,11 @@ def update_review(
     review_id: str,
     title: Optional[str] = None,
     content: Optional[str] = None,
-    rating: Optional[int] = Query(None, ge=1, le=5)
+    rating: Optional[int] = Query(None, ge=1, le=5),
+    mongo_db: Optional[Database] = Depends(get_mongo_db)
 ):
     """Update a review"""
     try:
-        mongo_db = get_mongo_db()
         if mongo_db is None:
             raise HTTPException(status_code=503, detail="MongoDB unavailable")
         
@@ -826,14 +907,18 @@ def update_review(
         if content: update_data["content"] = content
         if rating: update_data["rating"] = rating
         
-        result = mongo_db.reviews.update_one(
+        # Read the old rating in the same operation so the rollup moves by the exact difference
+        before = mongo_db.reviews.find_one_and_update(
             {"_id": ObjectId(review_id)},
-            {"$set": update_data}
+            {"$set": update_data},
+            projection={"product_id": 1, "rating": 1}
         )
-        
-        if result.matched_count == 0:
+        if before is None:
             raise HTTPException(status_code=404, detail="Review not found")
         
+        review_stats.record_updated(mongo_db, before, {**before, **update_data})
+        response_cache.invalidate("reviews")
+        
         return {"message": "Review updated successfully"}
     except HTTPException:
         raise
@@ -842,19 +927,23 @@ def update_review(
         raise HTTPException(status_code=500, detail="Failed to update review")
 
 @router.delete("/reviews/{review_id}")
-def delete_review(review_id: str):
+def delete_review(review_id: str, mongo_db: Optional[Database] = Depends(get_mongo_db)):
     """Delete a review"""
     try:
-        mongo_db = get_mongo_db()
         if mongo_db is None:
             raise HTTPException(status_code=503, detail="MongoDB unavailable")
         
         from bson import ObjectId
-        result = mongo_db.reviews.delete_one({"_id": ObjectId(review_id)})
-        
-        if result.deleted_count == 0:
+        deleted = mongo_db.reviews.find_one_and_delete(
+            {"_id": ObjectId(review_id)},
+            projection={"product_id": 1, "rating": 1}
+        )
+        if deleted is None:
             raise HTTPException(status_code=404, detail="Review not found")
         
+        review_stats.record_deleted(mongo_db, deleted)
+        response_cache.invalidate("reviews")
+        
         return {"message": "Review deleted successfully"}
     except HTTPException:
         raise
@@ -869,7 +958,8 @@ def create_publication(
     content: str,
     type: str = "article",
     groups: Optional[List[str]] = None,
-    author: Optional[str] = None
+    author: Optional[str] = None,
+    mongo_db: Optional[Database] = Depends(get_mongo_db)
 ):
     """
     📰 CREATE PUBLICATION - Add a new article/blog to MongoDB
@@ -886,12 +976,12 @@ def create_publication(
         type: Type of publication (default: "article")
         groups: Categories/tags (optional)
         author: Author name (optional)
+        mongo_db: Shared MongoDB database (automatically provided)
         
     Returns:
         JSON with new publication ID and success message
     """
     try:
-        mongo_db = get_mongo_db()
         if mongo_db is None:
             raise HTTPException(status_code=503, detail="MongoDB unavailable")
         
@@ -906,6 +996,8 @@ def create_publication(
         }
         
         result = mongo_db.publications.insert_one(publication)
+        response_cache.invalidate("publications")
+        mongo_catalog.register(mongo_db.name, "publications")
         return {
             "id": str(result.inserted_id),
             "title": title,
@@ -919,128 +1011,28 @@ def create_publication(
         raise HTTPException(status_code=500, detail="Failed to create publication")
 
 @router.get("/publications/{publication_id}")
-def get_publication(publication_id: str):
+def get_publication(
+    publication_id: str,
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    mongo_db: Optional[Database] = Depends(get_mongo_db)
+):
     """Get a specific publication by ID"""
     try:
-        mongo_db = get_mongo_db()
         if mongo_db is None:
             raise HTTPException(status_code=503, detail="MongoDB unavailable")
         
+        selected = parse_fields(fields, list(PUBLICATION_DETAIL_FIELDS)) or list(PUBLICATION_DETAIL_FIELDS)
         from bson import ObjectId
-        publication = mongo_db.publications.find_one({"_id": ObjectId(publication_id)})
+        publication = mongo_db.publications.find_one({"_id": ObjectId(publication_id)}, _mongo_projection(selected))
         if not publication:
             raise HTTPException(status_code=404, detail="Publication not found")
         
         return {
-            "id": str(publication["_id"]),
-            "title": publication.get("title", ""),
-            "content": publication.get("content", ""),
-            "type": publication.get("type", "article"),
-            "groups": publication.get("groups", []),
-            "author": publication.get("author"),
-            "created_at": publication.get("created_at"),
-            "updated_at": publication.get("updated_at")
+            name: str(publication["_id"]) if name == "id" else publication.get(name, PUBLICATION_DETAIL_FIELDS[name])
+            for name in selected
         }
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"Get publication error: {e}")
         raise HTTPException(status_code=500, detail="Failed to get publication")
-
-# Bulk Operations
-@router.post("/bulk/publications")
-def bulk_create_publications(publications: List[Dict[str, Any]]):
-    """Bulk create publications in MongoDB"""
-    try:
-        mongo_db = get_mongo_db()
-        if mongo_db is None:
-            raise HTTPException(status_code=503, detail="MongoDB unavailable")
-        
-        publication_docs = []
-        for pub_data in publications[:20]:  # Limit to 20 for safety
-            publication = {
-                "title": pub_data.get("title", "Untitled Article"),
-                "content": pub_data.get("content", ""),
-                "type": pub_data.get("type", "article"),
-                "groups": pub_data.get("groups", []),
-                "author": pub_data.get("author"),
-                "created_at": datetime.utcnow(),
-                "updated_at": datetime.utcnow()
-            }
-            publication_docs.append(publication)
-        
-        result = mongo_db.publications.insert_many(publication_docs)
-        return {
-            "message": f"Created {len(result.inserted_ids)} publications successfully",
-            "count": len(result.inserted_ids),
-            "ids": [str(id) for id in result.inserted_ids]
-        }
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Bulk create publications error: {e}")
-        raise HTTPException(status_code=500, detail="Failed to bulk create publications")
-
-@router.post("/bulk/films")
-def bulk_create_films(
-    films: List[Dict[str, Any]],
-    db: Session = Depends(get_db)
-):
-    """Bulk create films"""
-    try:
-        created_films = []
-        for film_data in films[:10]:  # Limit to 10 for safety
-            film = Film(
-                title=film_data.get("title", "Untitled"),
-                description=film_data.get("description"),
-                release_year=film_data.get("release_year"),
-                rental_rate=film_data.get("rental_rate", 4.99),
-                length=film_data.get("length"),
-                rating=film_data.get("rating", "G"),
-                language_id=1
-            )
-            db.add(film)
-            created_films.append(film)
-        
-        db.commit()
-        return {
-            "message": f"Created {len(created_films)} films successfully",
-            "count": len(created_films)
-        }
-    except Exception as e:
-        db.rollback()
-        logger.error(f"Bulk create films error: {e}")
-        raise HTTPException(status_code=500, detail="Failed to bulk create films")
-
-@router.post("/bulk/reviews")
-def bulk_create_reviews(reviews: List[Dict[str, Any]]):
-    """Bulk create reviews in MongoDB"""
-    try:
-        mongo_db = get_mongo_db()
-        if mongo_db is None:
-            raise HTTPException(status_code=503, detail="MongoDB unavailable")
-        
-        review_docs = []
-        for review_data in reviews[:20]:  # Limit to 20 for safety
-            review = {
-                "title": review_data.get("title", "Untitled Review"),
-                "content": review_data.get("content", ""),
-                "rating": max(1, min(5, review_data.get("rating", 3))),
-                "product_id": review_data.get("product_id"),
-                "user_id": review_data.get("user_id"),
-                "created_at": datetime.utcnow(),
-                "updated_at": datetime.utcnow()
-            }
-            review_docs.append(review)
-        
-        result = mongo_db.reviews.insert_many(review_docs)
-        return {
-            "message": f"Created {len(result.inserted_ids)} reviews successfully",
-            "count": len(result.inserted_ids),
-            "ids": [str(id) for id in result.inserted_ids]
-        }
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Bulk create reviews error: {e}")
-        raise HTTPException(status_code=500, detail="Failed to bulk create reviews")
\ No newline at end of file
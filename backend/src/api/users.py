@@ -1,10 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
-from typing import List
-from db.postgres import get_db
-from db.models import User
-from schemas import UserResponse
-from api.auth import get_current_user
+from typing import List, Optional
+from src.db.postgres import get_db
+from src.db.models import User
+from src.schemas import UserResponse
+from src.api.auth import get_current_user
+from src.core.streaming import STREAM_FORMAT_PATTERN, stream_query
 import logging
 
 router = APIRouter()
@@ -17,6 +18,7 @@ def get_current_user_profile(current_user: User = Depends(get_current_user)):
 
 @router.get("/", response_model=List[UserResponse])
 def get_users(
+    stream: Optional[str] = Query(None, pattern=STREAM_FORMAT_PATTERN, description="Stream as ndjson or a chunked json array"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -25,6 +27,8 @@ def get_users(
         raise HTTPException(status_code=403, detail="Not enough permissions")
     
     try:
+        if stream:
+            return stream_query(db.query(User).order_by(User.customer_id), UserResponse, stream)
         users = db.query(User).all()
         return users
     except Exception as e:
@@ -0,0 +1,281 @@
+import functools
+import inspect
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+from pydantic import TypeAdapter
+
+from src.core.cache_backends import CacheBackend, build_backend
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Only plain query/path values take part in the cache key; injected sessions
+# and database handles are ignored
+_KEY_TYPES = (str, int, float, bool, type(None))
+
+class ResponseCache:
+    """
+    In-process TTL + LRU cache for read endpoints.
+
+    Entries carry tags naming the data they were built from ("films",
+    "reviews", ...). Write endpoints call invalidate() with the tags they
+    touch, which drops every dependent entry so the next read is fresh.
+    Invalidations are numbered: a read takes generation() before building
+    its value and passes it to set(), which skips the store if one of its
+    tags was invalidated in between, instead of caching pre-write data for
+    the whole TTL.
+
+    With an L2 backend, L1 misses fall through to the shared store and
+    invalidations are written to its log. Every worker replays that log at
+    most every CACHE_SYNC_INTERVAL_SECONDS, so a write handled by one worker
+    evicts the stale L1 entries of all the others.
+    """
+
+    def __init__(self, max_entries: int, l2: Optional[CacheBackend] = None):
+        self.max_entries = max_entries
+        self.l2 = l2
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any, frozenset]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits: Dict[str, int] = defaultdict(int)
+        self._misses: Dict[str, int] = defaultdict(int)
+        self._l2_hits = 0
+        self._l2_errors = 0
+        self._evictions = 0
+        self._invalidations = 0
+        # Sequence number of the latest invalidation per tag, bounded; a store
+        # that started before _seq_floor is treated as stale
+        self._seq = 0
+        self._tag_seqs: "OrderedDict[str, int]" = OrderedDict()
+        self._seq_floor = 0
+        self._stale_skips = 0
+        self._remote_invalidations = 0
+        self._log_seq = 0
+        self._next_sync = 0.0
+        if l2 is not None:
+            # Start from the current end of the log: an empty L1 has nothing to evict
+            self._log_seq = self._l2_call(lambda: l2.invalidations_since(2 ** 62)[0], 0)
+
+    def _l2_call(self, call, default=None):
+        # The shared tier is an optimization; if it fails we carry on with L1 only
+        try:
+            return call()
+        except Exception as e:
+            self._l2_errors += 1
+            logger.error(f"L2 cache error: {e}")
+            return default
+
+    def _drop_tags(self, tags: Iterable[str]) -> int:
+        wanted = set(tags)
+        with self._lock:
+            self._seq += 1
+            for tag in wanted:
+                self._tag_seqs[tag] = self._seq
+                self._tag_seqs.move_to_end(tag)
+            while len(self._tag_seqs) > 4 * self.max_entries:
+                self._seq_floor = self._tag_seqs.popitem(last=False)[1]
+            stale = [key for key, (_, _, entry_tags) in self._entries.items() if entry_tags & wanted]
+            for key in stale:
+                del self._entries[key]
+            return len(stale)
+
+    def _sync_invalidations(self, force: bool = False):
+        """Replay invalidations other workers wrote to the shared log"""
+        now = time.monotonic()
+        if self.l2 is None or (now < self._next_sync and not force):
+            return
+        self._next_sync = now + settings.cache_sync_interval_seconds
+        result = self._l2_call(lambda: self.l2.invalidations_since(self._log_seq))
+        if result is None:
+            return
+        seq, tags = result
+        if tags:
+            self._drop_tags(tags)
+            self._remote_invalidations += 1
+        self._log_seq = max(self._log_seq, seq)
+
+    def generation(self) -> int:
+        """Invalidation sequence number to pass to set() as ``since``; take it before building the value"""
+        self._sync_invalidations()
+        with self._lock:
+            return self._seq
+
+    def _invalidated_since(self, since: int, tags: frozenset) -> bool:
+        # Caller holds the lock
+        return since < self._seq_floor or any(self._tag_seqs.get(tag, 0) > since for tag in tags)
+
+    def _store_l1(self, key: Hashable, value: Any, expires: float, tags: frozenset, since: Optional[int] = None) -> bool:
+        with self._lock:
+            if since is not None and self._invalidated_since(since, tags):
+                self._stale_skips += 1
+                return False
+            self._entries[key] = (expires, value, tags)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+            return True
+
+    def get(self, route: str, key: Hashable) -> Tuple[bool, Any]:
+        self._sync_invalidations()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self._hits[route] += 1
+                return True, entry[1]
+            if entry is not None:
+                del self._entries[key]
+        
+        if self.l2 is not None:
+            raw = self._l2_call(lambda: self.l2.get(repr(key)))
+            if raw is not None:
+                payload = json.loads(raw)
+                remaining = payload["expires"] - time.time()
+                if remaining > 0:
+                    self._store_l1(key, payload["value"], time.monotonic() + remaining, frozenset(payload["tags"]))
+                    with self._lock:
+                        self._hits[route] += 1
+                        self._l2_hits += 1
+                    return True, payload["value"]
+        
+        with self._lock:
+            self._misses[route] += 1
+        return False, None
+
+    def set(self, key: Hashable, value: Any, ttl: float, tags: Iterable[str], since: Optional[int] = None):
+        """
+        Store ``value``; with ``since`` (from generation()), only if none of
+        ``tags`` was invalidated after that snapshot was taken.
+        """
+        tags = frozenset(tags)
+        if since is not None:
+            # Writes handled by other workers must be seen before deciding
+            self._sync_invalidations(force=True)
+        if not self._store_l1(key, value, time.monotonic() + ttl, tags, since):
+            return
+        if self.l2 is not None:
+            payload = json.dumps({"expires": time.time() + ttl, "tags": sorted(tags), "value": value}).encode()
+            self._l2_call(lambda: self.l2.set(repr(key), payload, ttl, tags))
+
+    def invalidate(self, *tags: str) -> int:
+        """Drop every entry built from any of ``tags``; returns how many L1 entries were dropped"""
+        dropped = self._drop_tags(tags)
+        with self._lock:
+            self._invalidations += 1
+        if self.l2 is not None:
+            self._l2_call(lambda: self.l2.invalidate(tags))
+        return dropped
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._seq += 1
+            self._seq_floor = self._seq
+        if self.l2 is not None:
+            self._l2_call(self.l2.clear)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            routes = sorted(set(self._hits) | set(self._misses))
+            hits, misses = sum(self._hits.values()), sum(self._misses.values())
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": hits,
+                "misses": misses,
+                "hit_ratio": round(hits / (hits + misses), 4) if hits + misses else None,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+                "stale_skips": self._stale_skips,
+                "l2": None if self.l2 is None else {
+                    "backend": type(self.l2).__name__,
+                    "hits": self._l2_hits,
+                    "errors": self._l2_errors,
+                    "remote_invalidations": self._remote_invalidations,
+                },
+                "routes": {
+                    route: {"hits": self._hits[route], "misses": self._misses[route]}
+                    for route in routes
+                },
+            }
+
+response_cache = ResponseCache(settings.cache_max_entries, l2=build_backend())
+
+def route_ttl(route: str, default: float) -> float:
+    """TTL for ``route``, overridable per route with CACHE_TTLS"""
+    return settings.cache_ttls.get(route, default)
+
+class Uncached:
+    """
+    Wraps a result that @cached should return but not store, e.g. a partial
+    answer built while one of its sources was down.
+    """
+
+    def __init__(self, value: Any):
+        self.value = value
+
+def cached(route: str, ttl: float, tags: Iterable[str], response_model: Optional[Any] = None):
+    """
+    Cache an endpoint's result under ``route`` for ``ttl`` seconds.
+
+    The key is the route plus the endpoint's plain arguments. When the
+    endpoint returns ORM objects, pass its ``response_model`` so the cache
+    holds plain JSON data instead of session-bound instances. A ``fresh``
+    argument set to True skips the lookup and refreshes the entry. Results
+    wrapped in Uncached are returned as-is and never stored.
+    """
+    tags = frozenset(tags)
+    adapter = TypeAdapter(response_model) if response_model is not None else None
+
+    def decorator(func: Callable):
+        def make_key(kwargs: Dict[str, Any]) -> Hashable:
+            return (route,) + tuple(sorted(
+                (name, value) for name, value in kwargs.items()
+                if isinstance(value, _KEY_TYPES) and name != "fresh"
+            ))
+
+        def store(key: Hashable, value: Any, since: int) -> Any:
+            if adapter is not None:
+                value = adapter.dump_python(
+                    adapter.validate_python(value, from_attributes=True), mode="json"
+                )
+            response_cache.set(key, value, route_ttl(route, ttl), tags, since=since)
+            return value
+
+        def finish(key: Hashable, result: Any, since: int) -> Any:
+            if isinstance(result, Uncached):
+                return result.value
+            return store(key, result, since) if settings.cache_enabled else result
+
+        def lookup(kwargs: Dict[str, Any]) -> Tuple[bool, Hashable, Any]:
+            key = make_key(kwargs)
+            if not settings.cache_enabled or kwargs.get("fresh") is True:
+                return False, key, None
+            hit, value = response_cache.get(route, key)
+            return hit, key, value
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(**kwargs):
+                hit, key, value = lookup(kwargs)
+                if hit:
+                    return value
+                since = response_cache.generation()
+                return finish(key, await func(**kwargs), since)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(**kwargs):
+            hit, key, value = lookup(kwargs)
+            if hit:
+                return value
+            since = response_cache.generation()
+            return finish(key, func(**kwargs), since)
+        return wrapper
+
+    return decorator
@@ -0,0 +1,246 @@
+"""
+Shared (L2) stores for the response cache.
+
+Each uvicorn worker keeps its own in-process L1 cache; an L2 backend is the
+tier all workers on a host (sqlite) or in a deployment (redis) can see. It
+also carries the invalidation log every worker polls, so a write handled by
+one worker evicts the stale L1 entries of all the others.
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Iterable, List, Optional, Tuple
+
+from src.core.config import settings
+
+class CacheBackend(ABC):
+    """Interface for L2 stores. Keys are strings and values JSON bytes."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        ...
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl: float, tags: Iterable[str]):
+        ...
+
+    @abstractmethod
+    def invalidate(self, tags: Iterable[str]):
+        """Delete entries carrying any of ``tags`` and append them to the invalidation log"""
+
+    @abstractmethod
+    def invalidations_since(self, seq: int) -> Tuple[int, List[str]]:
+        """Latest log sequence number and the tags invalidated after ``seq``"""
+
+    @abstractmethod
+    def clear(self):
+        ...
+
+class MemoryCacheBackend(CacheBackend):
+    """Process-local stand-in for a network store; used in tests and single-worker runs"""
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._log: List[Tuple[int, List[str]]] = []
+        self._seq = 0
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.time():
+                del self._entries[key]
+                return None
+            return entry[1]
+
+    def set(self, key: str, value: bytes, ttl: float, tags: Iterable[str]):
+        now = time.time()
+        with self._lock:
+            self._entries[key] = (now + ttl, value, frozenset(tags))
+            if len(self._entries) > self.max_entries:
+                # Same policy as SQLiteCacheBackend: expired entries first, then the soonest-to-expire
+                for stale in [k for k, (expires, _, _) in self._entries.items() if expires <= now]:
+                    del self._entries[stale]
+                excess = len(self._entries) - self.max_entries
+                if excess > 0:
+                    for stale in sorted(self._entries, key=lambda k: self._entries[k][0])[:excess]:
+                        del self._entries[stale]
+
+    def invalidate(self, tags: Iterable[str]):
+        tags = list(tags)
+        with self._lock:
+            wanted = set(tags)
+            for key in [k for k, (_, _, entry_tags) in self._entries.items() if entry_tags & wanted]:
+                del self._entries[key]
+            self._seq += 1
+            self._log.append((self._seq, tags))
+            del self._log[:-1000]
+
+    def invalidations_since(self, seq: int) -> Tuple[int, List[str]]:
+        with self._lock:
+            return self._seq, [tag for entry_seq, tags in self._log if entry_seq > seq for tag in tags]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+class SQLiteCacheBackend(CacheBackend):
+    """
+    On-disk L2 shared by every worker on the host.
+
+    Uses WAL so readers never block the writer, and memory-maps the file so
+    hot entries are served from the page cache.
+    """
+
+    def __init__(self, path: str, max_entries: int = 10000):
+        self.path = path
+        self.max_entries = max_entries
+        self._local = threading.local()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        conn = self._conn()
+        conn.execute("CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value BLOB, expires REAL, tags TEXT)")
+        conn.execute("CREATE TABLE IF NOT EXISTS invalidations (seq INTEGER PRIMARY KEY AUTOINCREMENT, tags TEXT, at REAL)")
+        conn.execute("CREATE INDEX IF NOT EXISTS entries_expires ON entries (expires)")
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA mmap_size=67108864")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Optional[bytes]:
+        row = self._conn().execute(
+            "SELECT value FROM entries WHERE key = ? AND expires > ?", (key, time.time())
+        ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, value: bytes, ttl: float, tags: Iterable[str]):
+        now = time.time()
+        conn = self._conn()
+        conn.execute(
+            "INSERT OR REPLACE INTO entries (key, value, expires, tags) VALUES (?, ?, ?, ?)",
+            (key, value, now + ttl, "|" + "|".join(sorted(tags)) + "|")
+        )
+        # Keep the file bounded: drop expired rows, then the soonest-to-expire
+        conn.execute("DELETE FROM entries WHERE expires <= ?", (now,))
+        conn.execute(
+            "DELETE FROM entries WHERE key IN (SELECT key FROM entries ORDER BY expires DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,)
+        )
+
+    def invalidate(self, tags: Iterable[str]):
+        tags = list(tags)
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for tag in tags:
+                conn.execute("DELETE FROM entries WHERE tags LIKE ?", (f"%|{tag}|%",))
+            now = time.time()
+            conn.execute("INSERT INTO invalidations (tags, at) VALUES (?, ?)", (json.dumps(tags), now))
+            conn.execute("DELETE FROM invalidations WHERE at < ?", (now - 3600,))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def invalidations_since(self, seq: int) -> Tuple[int, List[str]]:
+        rows = self._conn().execute(
+            "SELECT seq, tags FROM invalidations WHERE seq > ? ORDER BY seq", (seq,)
+        ).fetchall()
+        if not rows:
+            latest = self._conn().execute("SELECT COALESCE(MAX(seq), 0) FROM invalidations").fetchone()[0]
+            return latest, []
+        return rows[-1][0], [tag for _, tags in rows for tag in json.loads(tags)]
+
+    def clear(self):
+        self._conn().execute("DELETE FROM entries")
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Network L2 shared across hosts. Needs the optional ``redis`` package and
+    Redis 7+ (EXPIRE NX/GT).
+
+    Each tag has a sorted set of the entries carrying it, scored by their
+    expiry time: expired members are trimmed whenever the tag is written to,
+    and the set itself expires with its longest-lived entry, so per-user tags
+    do not outlive the user's cached principal.
+    """
+
+    LOG_LENGTH = 1000
+
+    def __init__(self, url: str, prefix: str = "skillstacker:cache:"):
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError("CACHE_BACKEND=redis requires the 'redis' package") from e
+        self._redis = redis.Redis.from_url(url)
+        self.prefix = prefix
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._redis.get(self.prefix + "entry:" + key)
+
+    def _tag_key(self, tag: str) -> str:
+        return self.prefix + "tags:" + tag
+
+    def set(self, key: str, value: bytes, ttl: float, tags: Iterable[str]):
+        entry_key = self.prefix + "entry:" + key
+        ttl_ms = max(1, int(ttl * 1000))
+        now = time.time()
+        pipe = self._redis.pipeline()
+        pipe.set(entry_key, value, px=ttl_ms)
+        for tag in tags:
+            tag_key = self._tag_key(tag)
+            pipe.zadd(tag_key, {entry_key: now + ttl_ms / 1000})
+            pipe.zremrangebyscore(tag_key, "-inf", now)
+            # New sets get this entry's TTL; existing ones are only ever extended
+            pipe.pexpire(tag_key, ttl_ms, nx=True)
+            pipe.pexpire(tag_key, ttl_ms, gt=True)
+        pipe.execute()
+
+    def invalidate(self, tags: Iterable[str]):
+        tags = list(tags)
+        for tag in tags:
+            tag_key = self._tag_key(tag)
+            members = self._redis.zrange(tag_key, 0, -1)
+            if members:
+                self._redis.delete(*members)
+            self._redis.delete(tag_key)
+        seq = self._redis.incr(self.prefix + "seq")
+        pipe = self._redis.pipeline()
+        pipe.rpush(self.prefix + "log", json.dumps([seq, tags]))
+        pipe.ltrim(self.prefix + "log", -self.LOG_LENGTH, -1)
+        pipe.execute()
+
+    def invalidations_since(self, seq: int) -> Tuple[int, List[str]]:
+        latest = int(self._redis.get(self.prefix + "seq") or 0)
+        if latest <= seq:
+            return latest, []
+        entries = (json.loads(raw) for raw in self._redis.lrange(self.prefix + "log", -self.LOG_LENGTH, -1))
+        return latest, [tag for entry_seq, tags in entries if entry_seq > seq for tag in tags]
+
+    def clear(self):
+        keys = list(self._redis.scan_iter(self.prefix + "entry:*"))
+        if keys:
+            self._redis.delete(*keys)
+
+def build_backend() -> Optional[CacheBackend]:
+    """L2 backend selected by CACHE_BACKEND (none, memory, sqlite or redis)"""
+    backend = settings.cache_backend
+    if backend == "memory":
+        return MemoryCacheBackend(max_entries=settings.cache_l2_max_entries)
+    if backend == "sqlite":
+        return SQLiteCacheBackend(settings.cache_l2_path, max_entries=settings.cache_l2_max_entries)
+    if backend == "redis":
+        return RedisCacheBackend(settings.cache_l2_url)
+    return None
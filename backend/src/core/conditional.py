@@ -0,0 +1,68 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Optional, Tuple
+
+from fastapi import Request, Response
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+def catalog_validator(db: Session, *models) -> Tuple[str, Optional[datetime]]:
+    """
+    ETag and Last-Modified for the tables behind ``models``.
+
+    Built from COUNT(*) and MAX(last_update) of each table - one aggregate
+    query per table, answered from the primary key and last_update without
+    reading any row bodies. Inserts and updates move the max timestamp,
+    deletes change the count.
+    """
+    parts = []
+    last_modified = None
+    for model in models:
+        count, latest = db.query(func.count(), func.max(model.last_update)).one()
+        if isinstance(latest, str):
+            # SQLite returns MAX() of a timestamp column as text
+            latest = datetime.fromisoformat(latest)
+        if latest is not None and latest.tzinfo is None:
+            latest = latest.replace(tzinfo=timezone.utc)
+        parts.append(f"{model.__tablename__}:{count}:{latest.isoformat() if latest else '-'}")
+        if latest is not None and (last_modified is None or latest > last_modified):
+            last_modified = latest
+    digest = hashlib.sha1("|".join(parts).encode()).hexdigest()[:20]
+    return f'W/"{digest}"', last_modified
+
+def _not_modified(request: Request, etag: str, last_modified: Optional[datetime]) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # If-None-Match wins over If-Modified-Since when both are sent
+        candidates = {tag.strip() for tag in if_none_match.split(",")}
+        weak = etag[2:] if etag.startswith("W/") else etag
+        return "*" in candidates or etag in candidates or weak in candidates
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)  # "-0000" parses as naive; it still means UTC
+        # HTTP dates have one-second resolution
+        return last_modified.replace(microsecond=0) <= since
+    return False
+
+def conditional_get(request: Request, response: Response, db: Session, *models) -> Optional[Response]:
+    """
+    Answer a conditional GET for a catalog endpoint.
+
+    Returns a ready 304 response when the client's copy is current.
+    Otherwise puts the validators on ``response`` and returns None, and the
+    endpoint builds the body as usual.
+    """
+    etag, last_modified = catalog_validator(db, *models)
+    headers: Dict[str, str] = {"ETag": etag, "Cache-Control": "no-cache"}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(last_modified.astimezone(timezone.utc), usegmt=True)
+    if _not_modified(request, etag, last_modified):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
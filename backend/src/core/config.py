@@ -1,19 +1,70 @@
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import Dict, Optional
 
 class Settings(BaseSettings):
     # Database URLs
     database_url: str = "sqlite:///./skillstacker.db"  # Use SQLite by default
+    migrate_on_startup: bool = False  # Run migrate.py from every process at startup (local development)
+    
+    # SQLAlchemy connection pool (per process; see /api/v1/metrics/db-pool)
+    db_pool_size: int = 5  # Connections kept open
+    db_max_overflow: int = 10  # Extra connections opened under load, closed when returned
+    db_pool_timeout: float = 30  # Seconds a request waits for a connection before failing
+    db_pool_recycle: int = 1800  # Reconnect connections older than this (seconds, -1 = never)
+    db_pool_pre_ping: bool = True  # Test each connection on checkout and replace dead ones
     mongo_url: str = "mongodb://localhost:27017"
+    mongo_database: str = "skillstacker"
+    publications_database: str = "Publications-data"
+    publications_collection: str = "Publications"
+    
+    # MongoDB connection pool (shared by every router)
+    mongo_max_pool_size: int = 100
+    mongo_min_pool_size: int = 0
+    mongo_max_idle_time_ms: Optional[int] = None
+    mongo_server_selection_timeout_ms: int = 5000
+    mongo_retry_after_seconds: float = 5.0  # Skip pinging for this long after a failed ping
+    mongo_catalog_ttl_seconds: int = 300  # How long discovered databases/collections are reused
+    mongo_ensure_indexes: bool = True  # Build declared indexes (db/mongo_indexes.py) at startup
     
     # Security
     secret_key: str = "your-super-secret-key-change-this-in-production-12345678901234567890"
     jwt_algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
+    auth_principal_mode: str = "cached"  # db, cached or claims - see core.principal
+    auth_principal_cache_seconds: float = 30  # Lifetime of a cached principal in "cached" mode
+    password_bcrypt_rounds: int = 12  # Changing it rehashes each password at its next login
+    password_hash_workers: int = 2  # Dedicated bcrypt workers
+    password_hash_max_pending: int = 16  # Running + queued hashes before sign-ins get a 503
+    password_hash_processes: bool = False  # Process pool instead of threads
     
     # API
     api_v1_prefix: str = "/api/v1"
     project_name: str = "SkillStacker API"
+    lazy_routers: bool = True  # Import the bulk and debug routers on first use (see main.LAZY_ROUTERS)
+    openapi_prebuild: bool = True  # Build the OpenAPI document in the background at startup
+    profile_startup: bool = False  # Log the startup profile once the app is ready
+    film_search_probe_seconds: float = 30  # Re-check a missing film search index this often
+    stream_batch_size: int = 500  # Rows fetched per round trip by ?stream= exports
+    bulk_ingest_batch_size: int = 1000  # Rows per transaction in streaming bulk uploads
+    bulk_ingest_use_copy: bool = True  # PostgreSQL: load film batches with COPY instead of INSERT
+    bulk_ingest_concurrency: int = 4  # MongoDB batches written at the same time
+    count_cache_seconds: int = 60  # Lifetime of totals served with ?count=cached
+    
+    # Response cache for reference-style read endpoints
+    cache_enabled: bool = True
+    cache_max_entries: int = 1024
+    cache_ttls: Dict[str, float] = {}  # Per-route TTL overrides, e.g. {"films.stats": 60}
+    # Shared L2 tier for multi-worker deployments: none, memory, sqlite or redis
+    cache_backend: str = "none"
+    cache_l2_path: str = "./.cache/response_cache.sqlite3"  # sqlite backend file, shared by workers on a host
+    cache_l2_url: str = "redis://localhost:6379/0"  # redis backend
+    cache_l2_max_entries: int = 10000
+    cache_sync_interval_seconds: float = 0.5  # How often workers replay the invalidation log
+    
+    # Unified search fan-out
+    unified_search_max_workers: int = 16
+    unified_search_timeout_seconds: float = 2.0  # Default per-source budget
+    unified_search_source_timeouts: Dict[str, float] = {}  # e.g. {"publications": 3.0}
     
     # Environment
     environment: str = "development"
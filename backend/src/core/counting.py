@@ -0,0 +1,99 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+from fastapi import Response
+
+from src.core.config import settings
+
+TOTAL_COUNT_HEADER = "X-Total-Count"
+
+# Values accepted by the ``count`` query parameter on list endpoints:
+#   none      - do not count (default for row lists)
+#   exact     - COUNT(*) / count_documents with the request's filters
+#   estimated - planner / collection metadata estimate, no scan; on MongoDB,
+#               which has no filtered estimate, filtered lists get no total
+#   cached    - exact count reused for COUNT_CACHE_SECONDS per filter set
+COUNT_MODE_PATTERN = "^(none|exact|estimated|cached)$"
+
+class _CountCache:
+    """Small TTL cache of exact counts keyed by a filter signature"""
+
+    def __init__(self, max_entries: int = 1024):
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._max_entries = max_entries
+
+    def get(self, key: Hashable) -> Optional[int]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                return None
+            return entry[1]
+
+    def set(self, key: Hashable, value: int):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + settings.count_cache_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+count_cache = _CountCache()
+
+def _sql_signature(query) -> Hashable:
+    compiled = query.statement.compile()
+    return str(compiled), tuple(sorted((k, repr(v)) for k, v in compiled.params.items()))
+
+def _postgres_estimate(query) -> int:
+    # The planner's row estimate for the filtered query - uses table
+    # statistics (reltuples and column histograms) and never touches the rows
+    connection = query.session.connection()
+    compiled = query.order_by(None).statement.compile(dialect=connection.dialect)
+    plan = connection.exec_driver_sql("EXPLAIN (FORMAT JSON) " + str(compiled), compiled.params).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+def count_query(query, mode: Optional[str]) -> Optional[int]:
+    """Total rows matching a SQLAlchemy query (without limit/offset) under ``mode``"""
+    if not mode or mode == "none":
+        return None
+    if mode == "estimated" and query.session.get_bind().dialect.name == "postgresql":
+        return _postgres_estimate(query)
+    if mode == "cached":
+        key = ("sql",) + _sql_signature(query)
+        total = count_cache.get(key)
+        if total is None:
+            total = query.order_by(None).count()
+            count_cache.set(key, total)
+        return total
+    # exact, and estimated on databases without a planner estimate (SQLite)
+    return query.order_by(None).count()
+
+async def count_documents(collection, filter: Dict[str, Any], mode: Optional[str]) -> Optional[int]:
+    """Total documents matching ``filter`` in a motor collection under ``mode``"""
+    if not mode or mode == "none":
+        return None
+    if mode == "exact":
+        return await collection.count_documents(filter)
+    if mode == "estimated":
+        # Read from collection metadata - O(1) regardless of size. MongoDB has
+        # no filtered estimate, and counting would scan every match.
+        return None if filter else await collection.estimated_document_count()
+    # cached
+    key = ("mongo", collection.database.name, collection.name, repr(sorted(filter.items(), key=lambda kv: kv[0])))
+    total = count_cache.get(key)
+    if total is None:
+        total = await collection.count_documents(filter)
+        count_cache.set(key, total)
+    return total
+
+def set_total_count(response: Response, total: Optional[int]):
+    if total is not None:
+        response.headers[TOTAL_COUNT_HEADER] = str(total)
@@ -1,6 +1,7 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer
 from sqlalchemy.orm import Session
+from src.core.principal import resolve_principal
 from src.core.security import verify_token
 from src.db.postgres import get_db
 from src.db.models import User
@@ -19,7 +20,7 @@ def get_current_active_user(token: str = Depends(security), db: Session = Depend
     if email is None:
         raise credentials_exception
     
-    user = db.query(User).filter(User.email == email).first()
+    user = resolve_principal(payload, db, User)
     if user is None:
         raise credentials_exception
     
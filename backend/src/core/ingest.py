@@ -0,0 +1,117 @@
+import codecs
+import csv
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from src.core.serialization import loads
+
+# Content types accepted by the streaming bulk endpoints
+NDJSON_MEDIA_TYPES = ("application/x-ndjson", "application/jsonl", "application/json-seq")
+CSV_MEDIA_TYPES = ("text/csv", "application/csv")
+
+# (line number, parsed record or None, error message or None)
+Record = Tuple[int, Optional[Any], Optional[str]]
+
+async def iter_ndjson(chunks: AsyncIterator[bytes]) -> AsyncIterator[Record]:
+    """
+    Parse an NDJSON body as it arrives.
+
+    Only the current partial line is buffered, so memory use does not grow
+    with the size of the upload. Lines that are not valid JSON come back
+    with an error instead of stopping the stream; blank lines are skipped.
+    """
+    buffer = b""
+    line_no = 0
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            line_no += 1
+            if line.strip():
+                yield _parse_json(line_no, line)
+    if buffer.strip():
+        yield _parse_json(line_no + 1, buffer)
+
+def _parse_json(line_no: int, line: bytes) -> Record:
+    try:
+        return line_no, loads(line), None
+    except ValueError as e:
+        return line_no, None, f"invalid JSON: {e}"
+
+async def iter_csv(chunks: AsyncIterator[bytes]) -> AsyncIterator[Record]:
+    """
+    Parse a CSV body with a header row as it arrives.
+
+    Records are dicts keyed by the header; empty cells become None. Quoted
+    cells may span lines. Rows with the wrong number of cells come back with
+    an error.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    header: Optional[List[str]] = None
+    pending, record, record_line, line_no = "", "", 0, 0
+
+    def parse(text: str, first_line: int) -> Optional[Record]:
+        nonlocal header
+        try:
+            values = next(csv.reader([text]), [])
+        except csv.Error as e:
+            return first_line, None, f"invalid CSV: {e}"
+        if not values or values == [""]:
+            return None
+        if header is None:
+            header = [name.strip() for name in values]
+            return None
+        if len(values) != len(header):
+            return first_line, None, f"expected {len(header)} cells, got {len(values)}"
+        return first_line, {name: value if value != "" else None for name, value in zip(header, values)}, None
+
+    async def lines() -> AsyncIterator[str]:
+        nonlocal pending
+        async for chunk in chunks:
+            *complete, pending = (pending + decoder.decode(chunk)).split("\n")
+            for line in complete:
+                yield line
+        tail = pending + decoder.decode(b"", final=True)
+        if tail:
+            yield tail
+
+    async for line in lines():
+        line_no += 1
+        if not record:
+            record_line = line_no
+        record += line + "\n"
+        if record.count('"') % 2:
+            continue  # inside a quoted cell that continues on the next line
+        parsed = parse(record.rstrip("\r\n"), record_line)
+        record = ""
+        if parsed is not None:
+            yield parsed
+    if record:
+        parsed = parse(record.rstrip("\r\n"), record_line)
+        if parsed is not None:
+            yield parsed
+
+def record_parser(content_type: Optional[str]):
+    """iter_csv for CSV uploads, iter_ndjson for everything else"""
+    media_type = (content_type or "").split(";")[0].strip().lower()
+    return iter_csv if media_type in CSV_MEDIA_TYPES else iter_ndjson
+
+async def batched(records: AsyncIterator[Record], size: int) -> AsyncIterator[List[Record]]:
+    batch: List[Record] = []
+    async for record in records:
+        batch.append(record)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def batch_summary(index: int, batch: List[Record], inserted: int, errors: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Per-batch entry of a bulk ingest report"""
+    return {
+        "batch": index,
+        "first_line": batch[0][0],
+        "last_line": batch[-1][0],
+        "inserted": inserted,
+        "failed": len(batch) - inserted,
+        "errors": errors,
+    }
@@ -0,0 +1,58 @@
+import base64
+import json
+from typing import Any, List, Optional, Sequence
+
+from fastapi import HTTPException, Response
+from sqlalchemy import and_, or_
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# JSON values a keyset column can be compared with
+_CURSOR_TYPES = (str, int, float, type(None))
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode the keyset values of the last row on a page into an opaque token"""
+    raw = json.dumps(list(values), separators=(",", ":"), default=str)
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """Decode a cursor token back into its keyset values"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if not isinstance(values, list) or len(values) != size:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if not all(isinstance(value, _CURSOR_TYPES) for value in values):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return values
+
+def apply_keyset(query, columns: Sequence, cursor: Optional[str]):
+    """
+    Order a query by ``columns`` and, when a cursor is given, seek past it.
+
+    The last column must be unique (normally the primary key) so the order is
+    total. The seek predicate is expanded into ORs of ANDs rather than a row
+    value comparison so it works the same on SQLite and PostgreSQL and can use
+    a composite index on ``columns``.
+    """
+    query = query.order_by(*columns)
+    if cursor is None:
+        return query
+
+    values = decode_cursor(cursor, len(columns))
+    clauses = []
+    for i, column in enumerate(columns):
+        equal = [columns[j] == values[j] for j in range(i)]
+        clauses.append(and_(*equal, column > values[i]))
+    return query.filter(or_(*clauses))
+
+def set_next_cursor(response: Response, rows: list, columns: Sequence, limit: int) -> Optional[str]:
+    """Advertise the cursor for the page after ``rows`` via a response header"""
+    if len(rows) < limit:
+        return None
+    last = rows[-1]
+    cursor = encode_cursor([getattr(last, column.key) for column in columns])
+    response.headers[NEXT_CURSOR_HEADER] = cursor
+    return cursor
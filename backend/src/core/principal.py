@@ -0,0 +1,90 @@
+from typing import Any, Dict, Optional
+
+from sqlalchemy.orm import Session
+
+from src.core.cache import response_cache, route_ttl
+from src.core.config import settings
+from src.schemas import UserResponse
+
+PRINCIPAL_ROUTE = "auth.principal"
+
+# Claim name -> principal field, embedded in tokens issued at login/register
+PRINCIPAL_CLAIMS = {
+    "uid": "customer_id",
+    "fn": "first_name",
+    "ln": "last_name",
+    "adm": "is_admin",
+    "act": "activebool",
+    "oap": "oauth_provider",
+}
+
+class Principal(UserResponse):
+    """
+    The authenticated user as seen by protected routes.
+
+    A detached snapshot of the customer row (no session, no lazy loads) so it
+    can be cached between requests. It has the same fields as UserResponse,
+    so /me endpoints return it as-is.
+    """
+
+def _user_tag(email: str) -> str:
+    return f"user:{email}"
+
+def principal_claims(user) -> Dict[str, Any]:
+    """Claims describing ``user``, added to its access tokens"""
+    return {claim: getattr(user, field) for claim, field in PRINCIPAL_CLAIMS.items()}
+
+def _from_claims(payload: Dict[str, Any]) -> Optional[Principal]:
+    if any(claim not in payload for claim in PRINCIPAL_CLAIMS):
+        return None  # token issued before claims were embedded
+    values = {field: payload[claim] for claim, field in PRINCIPAL_CLAIMS.items()}
+    return Principal(email=payload["sub"], **values)
+
+def _load(db: Session, user_model, email: str) -> Optional[Principal]:
+    columns = [getattr(user_model, name) for name in Principal.model_fields]
+    row = db.query(*columns).filter(user_model.email == email).first()
+    if row is None:
+        return None
+    return Principal(**dict(zip(Principal.model_fields, row)))
+
+def resolve_principal(payload: Dict[str, Any], db: Session, user_model) -> Optional[Principal]:
+    """
+    Principal for a decoded token payload, or None for an unknown subject.
+
+    AUTH_PRINCIPAL_MODE picks the source:
+      db     - query the customer row on every request
+      cached - reuse the row for AUTH_PRINCIPAL_CACHE_SECONDS per subject;
+               invalidate_principal() drops it as soon as the user changes
+      claims - trust the claims embedded in the token and skip the database
+               entirely; changes to is_admin/activebool only take effect when
+               the token is reissued (at most ACCESS_TOKEN_EXPIRE_MINUTES)
+
+    ``user_model`` is the caller's User model, so the query runs against the
+    same metadata as the caller's session.
+    """
+    email = payload.get("sub")
+    if email is None:
+        return None
+    mode = settings.auth_principal_mode
+    if mode == "claims":
+        principal = _from_claims(payload)
+        if principal is not None:
+            return principal
+    if mode == "db" or not settings.cache_enabled:
+        return _load(db, user_model, email)
+
+    key = (PRINCIPAL_ROUTE, email)
+    hit, value = response_cache.get(PRINCIPAL_ROUTE, key)
+    if hit:
+        return Principal(**value)
+    tags = [_user_tag(email)]
+    since = response_cache.generation()  # a change to the user while loading skips the store
+    principal = _load(db, user_model, email)
+    if principal is not None:
+        ttl = route_ttl(PRINCIPAL_ROUTE, settings.auth_principal_cache_seconds)
+        response_cache.set(key, principal.model_dump(mode="json"), ttl, tags, since=since)
+    return principal
+
+def invalidate_principal(email: str):
+    """Forget the cached principal for ``email``; call after any change to the user"""
+    response_cache.invalidate(_user_tag(email))
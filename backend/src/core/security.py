@@ -1,18 +1,148 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Union
+from typing import Any, Callable, Dict, Optional, Tuple, Union
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import HTTPException, status
 from src.core.config import settings
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing - the only CryptContext in the app. Raising
+# PASSWORD_BCRYPT_ROUNDS marks existing hashes as outdated; they are rehashed
+# at the next successful login (see verify_and_update_password).
+pwd_context = CryptContext(
+    schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.password_bcrypt_rounds
+)
+
+def _hash(password: str) -> str:
+    return pwd_context.hash(password)
+
+def _verify_and_update(password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    return pwd_context.verify_and_update(password, hashed_password)
+
+class PasswordHasher:
+    """
+    Runs bcrypt on a small dedicated pool instead of the request threads.
+
+    Each hash takes hundreds of milliseconds of CPU, so a burst of logins
+    used to occupy most of the threadpool that serves every other sync
+    endpoint. Here at most ``max_workers`` hashes run at once, and once
+    ``max_pending`` jobs are running or queued new sign-ins are turned away
+    with a 503 + Retry-After instead of piling up.
+
+    The auth endpoints await the *_async methods, so no request thread is
+    held while a job queues or runs; the blocking ones are for scripts.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int, use_processes: bool = False):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.use_processes = use_processes
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._peak_pending = 0
+        self._completed = 0
+        self._rejected = 0
+        self._busy_seconds = 0.0
+
+    def _pool(self) -> Executor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    if self.use_processes:
+                        self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+                    else:
+                        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="bcrypt")
+        return self._executor
+
+    def _admit(self):
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self._rejected += 1
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Too many sign-ins in progress, please retry",
+                    headers={"Retry-After": "1"},
+                )
+            self._pending += 1
+            self._peak_pending = max(self._peak_pending, self._pending)
+
+    def _release(self, started: float):
+        with self._lock:
+            self._pending -= 1
+            self._completed += 1
+            self._busy_seconds += time.perf_counter() - started
+
+    def _run(self, func: Callable, *args) -> Any:
+        self._admit()
+        started = time.perf_counter()
+        try:
+            return self._pool().submit(func, *args).result()
+        finally:
+            self._release(started)
+
+    async def _run_async(self, func: Callable, *args) -> Any:
+        self._admit()
+        started = time.perf_counter()
+        try:
+            return await asyncio.wrap_future(self._pool().submit(func, *args))
+        finally:
+            self._release(started)
+
+    def hash(self, password: str) -> str:
+        return self._run(_hash, password)
+
+    async def hash_async(self, password: str) -> str:
+        return await self._run_async(_hash, password)
+
+    def verify_and_update(self, password: str, hashed_password: Optional[str]) -> Tuple[bool, Optional[str]]:
+        if not hashed_password:
+            return False, None  # OAuth-only accounts have no password
+        return self._run(_verify_and_update, password, hashed_password)
+
+    async def verify_and_update_async(self, password: str, hashed_password: Optional[str]) -> Tuple[bool, Optional[str]]:
+        if not hashed_password:
+            return False, None
+        return await self._run_async(_verify_and_update, password, hashed_password)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "executor": "process" if self.use_processes else "thread",
+                "workers": self.max_workers,
+                "max_pending": self.max_pending,
+                "in_flight": min(self._pending, self.max_workers),
+                "queued": max(0, self._pending - self.max_workers),
+                "peak_pending": self._peak_pending,
+                "completed": self._completed,
+                "rejected": self._rejected,
+                "avg_ms": round(self._busy_seconds / self._completed * 1000, 2) if self._completed else None,
+                "bcrypt_rounds": pwd_context.handler("bcrypt").default_rounds,
+            }
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+password_hasher = PasswordHasher(
+    settings.password_hash_workers,
+    settings.password_hash_max_pending,
+    use_processes=settings.password_hash_processes,
+)
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    return password_hasher.verify_and_update(plain_password, hashed_password)[0]
+
+def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """(valid, new_hash) - new_hash is set when the stored hash uses outdated settings"""
+    return password_hasher.verify_and_update(plain_password, hashed_password)
 
 def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+    return password_hasher.hash(password)
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
@@ -34,4 +164,4 @@ def verify_token(token: str) -> dict:
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
-        )
\ No newline at end of file
+        )
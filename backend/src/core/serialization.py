@@ -0,0 +1,160 @@
+import inspect
+import json
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type, Union
+
+from fastapi import HTTPException, Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from sqlalchemy import inspect as sa_inspect
+
+try:
+    import orjson
+except ImportError:  # optional speedup; the stdlib encoder gives the same bytes
+    orjson = None
+
+# Types a row serializer passes straight through; their JSON form is the same
+# whether FastAPI or the fast path encodes them
+_PLAIN_TYPES = (int, str, bool, float)
+
+def _stdlib_dumps(content: Any) -> bytes:
+    # Same arguments as starlette's JSONResponse.render
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode("utf-8")
+
+def dumps(content: Any) -> bytes:
+    """Encode ``content`` exactly as FastAPI's default JSONResponse would"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(content)
+        except (TypeError, orjson.JSONEncodeError):
+            # e.g. lone surrogates or ints beyond 64 bits, which json accepts
+            pass
+    return _stdlib_dumps(content)
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson when it is installed"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+def _field_converter(schema: Type[BaseModel], name: str) -> Optional[Callable[[Any], Any]]:
+    serializers = schema.__pydantic_decorators__.field_serializers
+    for decorator in serializers.values():
+        if name in decorator.info.fields:
+            if decorator.info.mode != "plain" or len(inspect.signature(decorator.func).parameters) != 2:
+                raise ValueError(f"{schema.__name__}.{name}: only plain field serializers are supported")
+            func, instance = decorator.func, schema.model_construct()
+            return lambda value: func(instance, value)
+
+    annotation = schema.model_fields[name].annotation
+    if annotation in (Decimal, Optional[Decimal]):
+        # pydantic's JSON mode writes Decimals as strings
+        return str
+    if annotation in _PLAIN_TYPES or annotation in tuple(Optional[t] for t in _PLAIN_TYPES):
+        return None
+    raise ValueError(f"{schema.__name__}.{name}: {annotation} is not supported by RowSerializer")
+
+def parse_fields(fields: Optional[str], available: Sequence[str]) -> Optional[List[str]]:
+    """
+    Names from a ``fields=a,b,c`` parameter, in ``available`` order.
+
+    Returns None when the parameter is absent or empty (meaning every field)
+    and answers unknown names with a 400.
+    """
+    if not fields:
+        return None
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    if not requested:
+        return None
+    unknown = requested.difference(available)
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown field(s): {', '.join(sorted(unknown))}. Available: {', '.join(available)}"
+        )
+    return [name for name in available if name in requested]
+
+class RowSerializer:
+    """
+    Precompiled row -> JSON path for a flat response schema.
+
+    Selects only the schema's columns as Core rows (no ORM identity map or
+    per-instance state), converts them with converters resolved once at
+    import time, and encodes the list in one call. The bytes are identical to
+    returning ORM objects through ``response_model=List[schema]``; the schema
+    still documents the endpoint but no longer validates every row.
+
+    project() narrows it to a sparse fieldset, so the SELECT only reads the
+    requested columns.
+    """
+
+    def __init__(self, schema: Type[BaseModel], model, fields: Optional[Sequence[str]] = None):
+        self.schema = schema
+        self.model = model
+        self.fields = list(fields) if fields is not None else list(schema.model_fields)
+        self.columns = [getattr(model, name) for name in self.fields]
+        self._converters = [
+            (index, converter)
+            for index, name in enumerate(self.fields)
+            if (converter := _field_converter(schema, name)) is not None
+        ]
+        self._projections: Dict[Tuple[str, ...], "RowSerializer"] = {}
+
+    def project(self, fields: Optional[str]) -> "RowSerializer":
+        """
+        Serializer for the ``fields=`` parameter of a request.
+
+        Primary key columns are always kept - keyset cursors and clients
+        need them to identify rows.
+        """
+        selected = parse_fields(fields, self.fields)
+        if selected is None:
+            return self
+        keys = {column.key for column in sa_inspect(self.model).primary_key}
+        selected = tuple(name for name in self.fields if name in selected or name in keys)
+        projection = self._projections.get(selected)
+        if projection is None:
+            projection = self._projections[selected] = RowSerializer(self.schema, self.model, selected)
+        return projection
+
+    def query(self, db):
+        """Session query yielding plain row tuples in field order"""
+        return db.query(*self.columns)
+
+    def to_dict(self, row: Sequence[Any]) -> dict:
+        values = list(row)
+        for index, convert in self._converters:
+            if values[index] is not None:
+                values[index] = convert(values[index])
+        return dict(zip(self.fields, values))
+
+    def to_dicts(self, rows: Sequence[Sequence[Any]]) -> List[dict]:
+        if not self._converters:
+            fields = self.fields
+            return [dict(zip(fields, row)) for row in rows]
+        return [self.to_dict(row) for row in rows]
+
+    def dumps_row(self, row: Sequence[Any]) -> bytes:
+        return dumps(self.to_dict(row))
+
+    def response(self, rows: Sequence[Sequence[Any]], response: Optional[Response] = None) -> Response:
+        """JSON response for ``rows``, keeping headers already set on ``response``"""
+        return FastJSONResponse(self.to_dicts(rows), headers=_carry_headers(response))
+
+    def item_response(self, row: Sequence[Any], response: Optional[Response] = None) -> Response:
+        """JSON response for a single row"""
+        return FastJSONResponse(self.to_dict(row), headers=_carry_headers(response))
+
+def _carry_headers(response: Optional[Response]) -> Optional[Dict[str, str]]:
+    headers = dict(response.headers) if response is not None else None
+    if headers:
+        headers.pop("content-length", None)
+    return headers
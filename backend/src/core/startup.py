@@ -0,0 +1,122 @@
+import importlib
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, List, NamedTuple, Optional
+
+# Kept free of heavy imports: main.py imports this module first so that the
+# profile also covers importing FastAPI, SQLAlchemy and the routers
+
+class StartupProfile:
+    """
+    Wall-clock time of each startup phase: imports, app setup, lifespan work
+    and routers loaded later on first use.
+
+    Read it with ``python -m src.main --profile-startup``, PROFILE_STARTUP=true
+    (logged once the app is ready) or GET /api/v1/metrics/startup.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.ready_ms: Optional[float] = None
+        self.phases: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def phase(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            ms = round((time.perf_counter() - started) * 1000, 1)
+            with self._lock:
+                self.phases.append({"name": name, "ms": ms, "at_ms": round((started - self.started) * 1000, 1)})
+
+    def import_router(self, module: str):
+        """Import ``module`` as its own phase and return its ``router``"""
+        with self.phase(f"import {module}"):
+            return importlib.import_module(module).router
+
+    def mark_ready(self):
+        """The app is about to accept requests"""
+        self.ready_ms = round((time.perf_counter() - self.started) * 1000, 1)
+
+    def report(self) -> Dict[str, Any]:
+        with self._lock:
+            phases = list(self.phases)
+        return {"ready_ms": self.ready_ms, "phases": phases}
+
+    def format(self) -> str:
+        report = self.report()
+        lines = [f"{'phase':<48} {'start ms':>9} {'ms':>9}"]
+        for phase in sorted(report["phases"], key=lambda phase: phase["ms"], reverse=True):
+            lines.append(f"{phase['name']:<48} {phase['at_ms']:>9} {phase['ms']:>9}")
+        lines.append(f"{'ready after':<48} {'':>9} {report['ready_ms']!s:>9}")
+        return "\n".join(lines)
+
+startup_profile = StartupProfile()
+
+class LazyRouter(NamedTuple):
+    module: str  # imported on first use; must define ``router``
+    prefix: str  # include_router prefix
+    tags: List[str]
+    path: str  # requests under this path load the router
+
+class LazyRouters:
+    """
+    Rarely used routers, included on the first request that needs them
+    instead of at import time.
+
+    The middleware checks each request path against the pending routers and
+    includes the matching ones before routing, so the very first request is
+    served normally. New routes are swapped in as a fresh list, so requests
+    being routed on other threads never see it change under them. Building
+    the OpenAPI document loads every pending router first, so the document
+    is complete whenever it is built and never needs rebuilding afterwards.
+    """
+
+    def __init__(self, app, routers: List[LazyRouter]):
+        self.app = app
+        self.pending = list(routers)
+        self._lock = threading.Lock()
+        app.add_middleware(_LazyRouterMiddleware, routers=self)
+        build_openapi = app.openapi
+
+        def openapi():
+            self.load()
+            return build_openapi()
+        app.openapi = openapi
+
+    def load(self, path: Optional[str] = None):
+        """Include the pending routers serving ``path`` (all of them when None)"""
+        from fastapi import APIRouter  # not at module level: see the note at the top
+
+        with self._lock:
+            for router in [r for r in self.pending if path is None or path.startswith(r.path)]:
+                # Same settings as app.router, so the routes match ones included directly
+                app_router = self.app.router
+                staging = APIRouter(
+                    dependencies=app_router.dependencies,
+                    default_response_class=app_router.default_response_class,
+                    route_class=app_router.route_class,
+                    dependency_overrides_provider=app_router.dependency_overrides_provider,
+                    generate_unique_id_function=app_router.generate_unique_id_function,
+                )
+                staging.include_router(startup_profile.import_router(router.module), prefix=router.prefix, tags=router.tags)
+                self.app.router.routes = [*self.app.router.routes, *staging.routes]
+                self.pending.remove(router)
+
+    def load_for(self, path: str):
+        """Load whatever a request for ``path`` needs"""
+        if any(path.startswith(router.path) for router in self.pending):
+            self.load(path)
+
+class _LazyRouterMiddleware:
+    def __init__(self, app, routers: LazyRouters):
+        self.app = app
+        self.routers = routers
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and self.routers.pending:
+            self.routers.load_for(scope["path"])
+        await self.app(scope, receive, send)
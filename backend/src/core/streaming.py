@@ -0,0 +1,58 @@
+from typing import Any, Callable, Iterator, Optional, Type, Union
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from src.core.config import settings
+from src.core.serialization import RowSerializer
+
+# Values accepted by the ``stream`` query parameter on the /all endpoints
+STREAM_FORMAT_PATTERN = "^(ndjson|json)$"
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "json": "application/json",
+}
+
+def _iter_rows(query, batch_size: int) -> Iterator:
+    # yield_per enables stream_results, so PostgreSQL uses a server-side
+    # cursor and only one batch of ORM objects is alive at a time
+    yield from query.yield_per(batch_size)
+
+def _encoder(schema: Union[Type[BaseModel], RowSerializer]) -> Callable[[Any], bytes]:
+    if isinstance(schema, RowSerializer):
+        return schema.dumps_row
+    return lambda row: schema.model_validate(row).model_dump_json().encode()
+
+def _ndjson(query, schema, batch_size: int) -> Iterator[bytes]:
+    encode = _encoder(schema)
+    for row in _iter_rows(query, batch_size):
+        yield encode(row) + b"\n"
+
+def _json_array(query, schema, batch_size: int) -> Iterator[bytes]:
+    encode = _encoder(schema)
+    yield b"["
+    first = True
+    for row in _iter_rows(query, batch_size):
+        item = encode(row)
+        yield item if first else b"," + item
+        first = False
+    yield b"]"
+
+def stream_query(
+    query,
+    schema: Union[Type[BaseModel], RowSerializer],
+    fmt: str = "ndjson",
+    batch_size: Optional[int] = None,
+) -> StreamingResponse:
+    """
+    Stream the rows of ``query`` as NDJSON or as a chunked JSON array.
+
+    Rows are fetched in batches of ``batch_size`` and written as soon as they
+    are serialized, so memory use does not grow with the size of the table.
+    ``schema`` is a response model for ORM queries or a RowSerializer for
+    row queries built with its query().
+    """
+    batch_size = batch_size or settings.stream_batch_size
+    body = _ndjson if fmt == "ndjson" else _json_array
+    return StreamingResponse(body(query, schema, batch_size), media_type=MEDIA_TYPES[fmt])
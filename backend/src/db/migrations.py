@@ -0,0 +1,117 @@
+import logging
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, NamedTuple
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, inspect, select, text
+from sqlalchemy.engine import Engine
+
+from src.db.models import Base
+from src.services.film_search import film_search
+
+logger = logging.getLogger(__name__)
+
+# Any constant works; it only has to be the same for every runner
+ADVISORY_LOCK_ID = 7_140_023
+
+schema_migrations = Table(
+    "schema_migrations",
+    MetaData(),
+    Column("version", Integer, primary_key=True),
+    Column("name", String(100), nullable=False),
+    Column("applied_at", DateTime(timezone=True), nullable=False),
+)
+
+class Migration(NamedTuple):
+    version: int
+    name: str
+    upgrade: Callable[[Engine], None]
+
+# Indexes added for the filters the API runs most (see db/models.py)
+HOT_PATH_INDEXES = (
+    "idx_film_rating_film_id",
+    "idx_film_release_year_film_id",
+    "idx_fk_inventory_id",
+    "idx_rental_customer_id_rental_date",
+    "idx_payment_customer_id_payment_date",
+    "idx_inventory_film_id_store_id",
+)
+
+def _declared(names) -> List:
+    return [index for table in Base.metadata.sorted_tables for index in table.indexes if index.name in names]
+
+def _create_tables(engine: Engine):
+    Base.metadata.create_all(bind=engine)
+
+def _film_search_index(engine: Engine):
+    if not film_search.ensure_index(engine):
+        raise RuntimeError("film search index could not be created")
+
+def _hot_path_indexes(engine: Engine):
+    # Plain CREATE INDEX: it blocks writes to the table while it builds, which
+    # is fine for Pagila-sized tables during a deploy
+    with engine.begin() as conn:
+        for index in _declared(HOT_PATH_INDEXES):
+            index.create(conn, checkfirst=True)
+
+# Append only: a released migration never changes, the next change is a new version
+MIGRATIONS = [
+    Migration(1, "create tables", _create_tables),
+    Migration(2, "film full-text search index", _film_search_index),
+    Migration(3, "hot-path indexes", _hot_path_indexes),
+]
+
+class MigrationRunner:
+    """
+    Applies MIGRATIONS in order and records each one in schema_migrations.
+
+    Meant to run once per deploy (migrate.py), not in every worker. On
+    PostgreSQL an advisory lock keeps two deploys from migrating at once.
+    Each step is idempotent, so a run interrupted between a step and its
+    schema_migrations row simply repeats that step next time.
+    """
+
+    def __init__(self, migrations: List[Migration] = MIGRATIONS):
+        self.migrations = sorted(migrations, key=lambda migration: migration.version)
+
+    def applied(self, engine: Engine) -> Dict[int, datetime]:
+        schema_migrations.create(engine, checkfirst=True)
+        with engine.connect() as conn:
+            rows = conn.execute(select(schema_migrations.c.version, schema_migrations.c.applied_at))
+            return {version: applied_at for version, applied_at in rows}
+
+    def pending(self, engine: Engine) -> List[Migration]:
+        applied = self.applied(engine)
+        return [migration for migration in self.migrations if migration.version not in applied]
+
+    def upgrade(self, engine: Engine) -> List[Migration]:
+        """Apply every pending migration; returns the ones that ran"""
+        lock = engine.connect() if engine.dialect.name == "postgresql" else None
+        try:
+            if lock is not None:
+                lock.execute(text("SELECT pg_advisory_lock(:id)"), {"id": ADVISORY_LOCK_ID})
+            ran = []
+            for migration in self.pending(engine):
+                logger.info(f"Applying migration {migration.version}: {migration.name}")
+                migration.upgrade(engine)
+                with engine.begin() as conn:
+                    conn.execute(schema_migrations.insert().values(
+                        version=migration.version, name=migration.name, applied_at=datetime.now(timezone.utc)
+                    ))
+                ran.append(migration)
+            return ran
+        finally:
+            if lock is not None:
+                lock.execute(text("SELECT pg_advisory_unlock(:id)"), {"id": ADVISORY_LOCK_ID})
+                lock.close()
+
+    def verify(self, engine: Engine) -> List[str]:
+        """Hot-path indexes missing from the database, as table.index names"""
+        inspector = inspect(engine)
+        missing = []
+        for index in _declared(HOT_PATH_INDEXES):
+            existing = {entry["name"] for entry in inspector.get_indexes(index.table.name)}
+            if index.name not in existing:
+                missing.append(f"{index.table.name}.{index.name}")
+        return missing
+
+migration_runner = MigrationRunner()
@@ -1,8 +1,12 @@
-from sqlalchemy import Column, Integer, String, Boolean, Date, DateTime, TIMESTAMP, Numeric, Text, SmallInteger
+from sqlalchemy import Column, Index, Integer, String, Boolean, Date, DateTime, TIMESTAMP, Numeric, Text, SmallInteger
 from sqlalchemy.ext.declarative import declarative_base
+from datetime import datetime, timezone
 
 Base = declarative_base()
 
+def _utcnow():
+    return datetime.now(timezone.utc)
+
 class User(Base):
     __tablename__ = "customer"
     customer_id = Column(Integer, primary_key=True, index=True)
@@ -18,7 +22,7 @@ class User(Base):
     oauth_provider = Column(String, nullable=True)
     oauth_id = Column(String, nullable=True)
     create_date = Column(Date)
-    last_update = Column(TIMESTAMP(timezone=True))
+    last_update = Column(TIMESTAMP(timezone=True), default=_utcnow, onupdate=_utcnow)
 
 class Film(Base):
     __tablename__ = "film"
@@ -33,26 +37,33 @@ class Film(Base):
     replacement_cost = Column(Numeric(5, 2), default=19.99)
     rating = Column(String(10), default='G')
     special_features = Column(Text)
-    last_update = Column(TIMESTAMP(timezone=True))
+    last_update = Column(TIMESTAMP(timezone=True), default=_utcnow, onupdate=_utcnow)
+
+    # Filters of the film lists, with the film_id keyset order they page by.
+    # Existing databases get these from migration 3 (db/migrations.py).
+    __table_args__ = (
+        Index("idx_film_rating_film_id", "rating", "film_id"),
+        Index("idx_film_release_year_film_id", "release_year", "film_id"),
+    )
 
 class Category(Base):
     __tablename__ = "category"
     category_id = Column(SmallInteger, primary_key=True, index=True)
     name = Column(String(25), nullable=False)
-    last_update = Column(TIMESTAMP(timezone=True))
+    last_update = Column(TIMESTAMP(timezone=True), default=_utcnow, onupdate=_utcnow)
 
 class Actor(Base):
     __tablename__ = "actor"
     actor_id = Column(Integer, primary_key=True, index=True)
     first_name = Column(String(45), nullable=False)
     last_name = Column(String(45), nullable=False, index=True)
-    last_update = Column(TIMESTAMP(timezone=True))
+    last_update = Column(TIMESTAMP(timezone=True), default=_utcnow, onupdate=_utcnow)
 
 class Language(Base):
     __tablename__ = "language"
     language_id = Column(SmallInteger, primary_key=True, index=True)
     name = Column(String(20), nullable=False)
-    last_update = Column(TIMESTAMP(timezone=True))
+    last_update = Column(TIMESTAMP(timezone=True), default=_utcnow, onupdate=_utcnow)
 
 class Rental(Base):
     __tablename__ = "rental"
@@ -62,7 +73,12 @@ class Rental(Base):
     customer_id = Column(SmallInteger, nullable=False)
     return_date = Column(TIMESTAMP(timezone=True))
     staff_id = Column(SmallInteger, nullable=False)
-    last_update = Column(TIMESTAMP(timezone=True))
+    last_update = Column(TIMESTAMP(timezone=True), default=_utcnow, onupdate=_utcnow)
+
+    __table_args__ = (
+        Index("idx_fk_inventory_id", "inventory_id"),  # same name as in the Pagila schema
+        Index("idx_rental_customer_id_rental_date", "customer_id", "rental_date"),  # a customer's rentals, newest first
+    )
 
 class Payment(Base):
     __tablename__ = "payment"
@@ -73,12 +89,21 @@ class Payment(Base):
     amount = Column(Numeric(5, 2), nullable=False)
     payment_date = Column(TIMESTAMP(timezone=True), nullable=False)
 
+    __table_args__ = (
+        Index("idx_payment_customer_id_payment_date", "customer_id", "payment_date"),
+    )
+
 class Inventory(Base):
     __tablename__ = "inventory"
     inventory_id = Column(Integer, primary_key=True, index=True)
     film_id = Column(SmallInteger, nullable=False)
     store_id = Column(SmallInteger, nullable=False)
-    last_update = Column(TIMESTAMP(timezone=True))
+    last_update = Column(TIMESTAMP(timezone=True), default=_utcnow, onupdate=_utcnow)
+
+    # Copies of a film, optionally per store (Pagila's index leads with store_id)
+    __table_args__ = (
+        Index("idx_inventory_film_id_store_id", "film_id", "store_id"),
+    )
 
 # Legacy aliases for backward compatibility
 Product = Film
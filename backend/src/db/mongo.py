@@ -1,17 +1,93 @@
+"""
+Process-wide MongoDB clients.
+
+Every router shares one pymongo client (for sync endpoints) and one motor
+client (for async endpoints). Both keep a connection pool sized from
+Settings, are opened lazily or in the app lifespan, and closed on shutdown.
+"""
+import logging
+import threading
+import time
+from typing import Optional
+
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import MongoClient
+from pymongo.database import Database
+from pymongo.errors import PyMongoError
+
 from src.core.config import settings
-from typing import Optional
+
+logger = logging.getLogger(__name__)
 
 _client: Optional[AsyncIOMotorClient] = None
+_sync_client: Optional[MongoClient] = None
+_lock = threading.Lock()
+_unavailable_until = 0.0
+
+def _client_options() -> dict:
+    return {
+        "maxPoolSize": settings.mongo_max_pool_size,
+        "minPoolSize": settings.mongo_min_pool_size,
+        "maxIdleTimeMS": settings.mongo_max_idle_time_ms,
+        "serverSelectionTimeoutMS": settings.mongo_server_selection_timeout_ms,
+    }
+
+def get_sync_client() -> MongoClient:
+    """Shared pymongo client; creating it does not block on the network"""
+    global _sync_client
+    if _sync_client is None:
+        with _lock:
+            if _sync_client is None:
+                _sync_client = MongoClient(settings.mongo_url, **_client_options())
+    return _sync_client
+
+def get_mongo_db() -> Optional[Database]:
+    """
+    Dependency returning the application database, or None if MongoDB is down.
+
+    While the pool has a known-good server no round trip is made. Only when
+    the client has not seen a healthy server yet (cold start, outage) is a
+    ping sent so callers can still answer 503 quickly. A failed ping is
+    remembered for a few seconds so an outage does not cost every request a
+    full server-selection timeout.
+    """
+    global _unavailable_until
+    if time.monotonic() < _unavailable_until:
+        return None
+    try:
+        client = get_sync_client()
+        if not client.topology_description.has_readable_server():
+            client.admin.command("ping")
+        return client[settings.mongo_database]
+    except PyMongoError as e:
+        logger.error(f"MongoDB connection error: {e}")
+        _unavailable_until = time.monotonic() + settings.mongo_retry_after_seconds
+        return None
 
 async def get_mongo_client() -> AsyncIOMotorClient:
     global _client
     if _client is None:
-        _client = AsyncIOMotorClient(settings.mongo_url)
+        _client = AsyncIOMotorClient(settings.mongo_url, **_client_options())
     return _client
 
-async def close_mongo_client():
+async def get_publications_collection():
+    """Async handle on the large research publications collection"""
+    client = await get_mongo_client()
+    return client[settings.publications_database][settings.publications_collection]
+
+def open_mongo_clients():
+    """Create the shared clients up front so the first request finds a warm pool"""
     global _client
+    get_sync_client()
+    if _client is None:
+        _client = AsyncIOMotorClient(settings.mongo_url, **_client_options())
+
+async def close_mongo_client():
+    global _client, _sync_client
     if _client:
         _client.close()
-        _client = None
\ No newline at end of file
+        _client = None
+    with _lock:
+        if _sync_client:
+            _sync_client.close()
+            _sync_client = None
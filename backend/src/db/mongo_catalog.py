@@ -0,0 +1,106 @@
+import logging
+import threading
+import time
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from src.core.config import settings
+from src.db.mongo import get_sync_client
+
+logger = logging.getLogger(__name__)
+
+SYSTEM_DATABASES = {"admin", "local", "config"}
+
+class _CatalogState(NamedTuple):
+    databases: Optional[Dict[str, List[str]]]
+    loaded_at: float
+    retry_at: float  # no discovery before this after a failed one
+    error: Optional[Exception]
+
+class MongoCatalog:
+    """
+    Cached map of database name -> collection names on the shared client.
+
+    Discovering collections costs one listDatabases plus one listCollections
+    per database, so it is done once and reused until the TTL runs out or
+    refresh() is called. Routers that look for collections by name (e.g.
+    anything containing "publication") ask the catalog instead.
+
+    A failed discovery is not retried for mongo_retry_after_seconds; in the
+    meantime the last known catalog is served, or the failure re-raised if
+    there is none yet. refresh() always re-raises, so callers that asked
+    for a fresh catalog know they did not get one.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # Replaced as a whole, never mutated, so readers can check it without the lock
+        self._state = _CatalogState(None, 0.0, 0.0, None)
+
+    def _discover(self) -> Dict[str, List[str]]:
+        client = get_sync_client()
+        return {
+            db_name: sorted(client[db_name].list_collection_names())
+            for db_name in client.list_database_names()
+            if db_name not in SYSTEM_DATABASES
+        }
+
+    @staticmethod
+    def _stale(state: _CatalogState, force_refresh: bool) -> bool:
+        now = time.monotonic()
+        if force_refresh:
+            return True
+        if now < state.retry_at:
+            return False
+        return state.databases is None or now - state.loaded_at > settings.mongo_catalog_ttl_seconds
+
+    def databases(self, force_refresh: bool = False) -> Dict[str, List[str]]:
+        state = self._state
+        if self._stale(state, force_refresh):
+            with self._lock:
+                # Another thread may have refreshed (or failed to) while we waited
+                state = self._state
+                if self._stale(state, force_refresh):
+                    try:
+                        state = self._state = _CatalogState(self._discover(), time.monotonic(), 0.0, None)
+                    except Exception as e:
+                        # Back off like get_mongo_db: during an outage only one
+                        # caller per retry window waits on server selection
+                        retry_at = time.monotonic() + settings.mongo_retry_after_seconds
+                        state = self._state = state._replace(retry_at=retry_at, error=e)
+                        if force_refresh:
+                            raise
+                        if state.databases is not None:
+                            logger.error(f"MongoDB catalog refresh failed, serving stale catalog: {e}")
+        # Keep serving the last known catalog while MongoDB is unreachable
+        if state.databases is None:
+            raise state.error
+        return state.databases
+
+    def find(self, name_fragment: str) -> List[Tuple[str, str]]:
+        """(database, collection) pairs whose collection name contains ``name_fragment``"""
+        fragment = name_fragment.lower()
+        return [
+            (db_name, collection_name)
+            for db_name, collections in self.databases().items()
+            for collection_name in collections
+            if fragment in collection_name.lower()
+        ]
+
+    def publication_collections(self) -> List[Tuple[str, str]]:
+        return self.find("publication")
+
+    def register(self, db_name: str, collection_name: str):
+        """Record a collection we just wrote to so it is visible before the next refresh"""
+        with self._lock:
+            state = self._state
+            if state.databases is None or collection_name in state.databases.get(db_name, []):
+                return
+            databases = dict(state.databases)
+            databases[db_name] = sorted(databases.get(db_name, []) + [collection_name])
+            self._state = state._replace(databases=databases)
+
+    def refresh(self) -> Dict[str, List[str]]:
+        """Re-discover now; raises if MongoDB cannot be reached"""
+        return self.databases(force_refresh=True)
+
+mongo_catalog = MongoCatalog()
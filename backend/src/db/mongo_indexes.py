@@ -0,0 +1,139 @@
+import logging
+from typing import Any, Dict, List, Tuple
+
+from pymongo import ASCENDING, DESCENDING, IndexModel
+from pymongo.errors import PyMongoError
+
+from src.core.config import settings
+from src.services.publication_search import TEXT_INDEX_NAME, publication_index, text_index_keys, text_index_options
+from src.services.review_feed import REVIEW_FEED_INDEXES
+
+logger = logging.getLogger(__name__)
+
+Namespace = Tuple[str, str]  # (database, collection)
+
+def _publication_indexes() -> List[IndexModel]:
+    return [
+        IndexModel([("type", ASCENDING)], name="publications_type"),
+        IndexModel([("groups", ASCENDING)], name="publications_groups"),
+        IndexModel([("title", ASCENDING)], name="publications_title"),
+        IndexModel(text_index_keys(), **text_index_options()),
+    ]
+
+def declared_indexes() -> Dict[Namespace, List[IndexModel]]:
+    """Every index the API relies on, per collection"""
+    return {
+        (settings.mongo_database, "reviews"): [
+            *REVIEW_FEED_INDEXES,  # also serve product_id filters on their own
+            IndexModel([("user_id", ASCENDING)], name="reviews_user"),
+        ],
+        (settings.mongo_database, "publications"): _publication_indexes(),
+        (settings.publications_database, settings.publications_collection): _publication_indexes(),
+    }
+
+def hot_queries() -> Dict[Namespace, List[Dict[str, Any]]]:
+    """Representative filters/sorts of each collection's endpoints, for explain()"""
+    publication_queries = [
+        {"filter": {"type": "Journal"}},
+        {"filter": {"groups": {"$in": ["Physics"]}}},
+        {"filter": {"title": {"$regex": "data", "$options": "i"}}},
+        {"filter": {"$text": {"$search": "data"}}},
+    ]
+    return {
+        (settings.mongo_database, "reviews"): [
+            {"filter": {"product_id": 1}, "sort": [("created_at", DESCENDING), ("_id", DESCENDING)]},
+            {"filter": {"product_id": 1}, "sort": [("helpful_count", DESCENDING), ("_id", DESCENDING)]},
+            {"filter": {"user_id": 1}},
+        ],
+        (settings.mongo_database, "publications"): publication_queries,
+        (settings.publications_database, settings.publications_collection): publication_queries,
+    }
+
+def _key_spec(keys) -> List[Tuple[str, Any]]:
+    # index_information() may report directions as floats (1.0) for indexes built elsewhere
+    items = keys.items() if hasattr(keys, "items") else keys
+    return [(field, int(direction) if isinstance(direction, float) else direction) for field, direction in items]
+
+def _stages(plan: Dict[str, Any]) -> List[str]:
+    plan = plan.get("queryPlan", plan)  # MongoDB 7 wraps classic plans
+    stages = [plan.get("stage")]
+    for child in [plan.get("inputStage"), *plan.get("inputStages", [])]:
+        if child:
+            stages.extend(_stages(child))
+    return stages
+
+class MongoIndexManager:
+    """
+    Keeps MongoDB indexes in line with declared_indexes().
+
+    ensure_async() runs from the app lifespan as a background task: creating
+    an index that already exists is a no-op, so every worker can run it.
+    diff() and explain() back the manage_mongo_indexes.py command.
+    """
+
+    async def ensure_async(self, client) -> Dict[str, Any]:
+        """Create the declared indexes (idempotent) with the motor ``client``"""
+        report = {}
+        for (db_name, collection_name), indexes in declared_indexes().items():
+            collection = client[db_name][collection_name]
+            namespace = f"{db_name}.{collection_name}"
+            try:
+                report[namespace] = await collection.create_indexes(indexes)
+            except PyMongoError as e:
+                logger.error(f"Could not create indexes on {namespace}: {e}")
+                report[namespace] = f"error: {e}"
+                continue
+            if any(index.document["name"] == TEXT_INDEX_NAME for index in indexes):
+                publication_index.mark_ready(collection)
+            logger.info(f"MongoDB indexes ready on {namespace}")
+        return report
+
+    def diff(self, client) -> Dict[str, Dict[str, List[str]]]:
+        """
+        Declared vs actual indexes per collection with the pymongo ``client``.
+
+        ``missing`` are declared but absent, ``extra`` exist but are not
+        declared, ``changed`` share a name with a declared index but not its
+        keys. Text index keys are stored in an internal form and are compared
+        by name only.
+        """
+        report = {}
+        for (db_name, collection_name), indexes in declared_indexes().items():
+            actual = client[db_name][collection_name].index_information()
+            declared = {index.document["name"]: _key_spec(index.document["key"]) for index in indexes}
+            changed = [
+                name for name, keys in declared.items()
+                if name in actual and name != TEXT_INDEX_NAME and _key_spec(actual[name]["key"]) != keys
+            ]
+            report[f"{db_name}.{collection_name}"] = {
+                "missing": [name for name in declared if name not in actual],
+                "extra": [name for name in actual if name not in declared and name != "_id_"],
+                "changed": changed,
+            }
+        return report
+
+    def explain(self, client) -> List[Dict[str, Any]]:
+        """Winning plan of every hot query; ``collscan`` marks the ones scanning the collection"""
+        results = []
+        for (db_name, collection_name), queries in hot_queries().items():
+            collection = client[db_name][collection_name]
+            for query in queries:
+                cursor = collection.find(query["filter"])
+                if query.get("sort"):
+                    cursor = cursor.sort(query["sort"])
+                try:
+                    plan = cursor.explain()["queryPlanner"]["winningPlan"]
+                except PyMongoError as e:
+                    # $text fails outright without a text index
+                    results.append({"namespace": f"{db_name}.{collection_name}", **query, "error": str(e), "collscan": True})
+                    continue
+                stages = _stages(plan)
+                results.append({
+                    "namespace": f"{db_name}.{collection_name}",
+                    **query,
+                    "stages": stages,
+                    "collscan": "COLLSCAN" in stages,
+                })
+        return results
+
+mongo_indexes = MongoIndexManager()
@@ -0,0 +1,165 @@
+import bisect
+import threading
+import time
+from typing import Any, Dict, List, Sequence
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeout
+from sqlalchemy.pool import QueuePool
+
+WAIT_BUCKETS_MS = (1, 5, 10, 50, 100, 500, 1000, 5000)
+LIFETIME_BUCKETS_S = (1, 10, 60, 300, 1800, 3600)
+
+class Histogram:
+    """Counts per upper bound, plus one overflow bucket"""
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def snapshot(self) -> Dict[str, Any]:
+        count = sum(self.counts)
+        labels = [f"<={bound}" for bound in self.bounds] + [f">{self.bounds[-1]}"]
+        return {
+            "count": count,
+            "avg": round(self.total / count, 2) if count else None,
+            "max": round(self.max, 2),
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that times how long each checkout waited for a connection"""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeout:
+            pool_metrics.record_timeout((time.perf_counter() - started) * 1000)
+            raise
+        pool_metrics.record_wait((time.perf_counter() - started) * 1000)
+        return connection
+
+class PoolMetrics:
+    """
+    Connection pool activity for the SQLAlchemy engine.
+
+    Pool events count checkouts, new and closed connections and checkouts
+    served by overflow connections, and measure how long connections live.
+    Waiting for a free connection is timed by InstrumentedQueuePool, so
+    wait_ms is only filled in for engines that use it.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.checkouts = 0
+            self.overflow_checkouts = 0
+            self.timeouts = 0
+            self.connects = 0
+            self.closed = 0
+            self.invalidated = 0
+            self.wait_ms = Histogram(WAIT_BUCKETS_MS)
+            self.held_ms = Histogram(WAIT_BUCKETS_MS)
+            self.lifetime_s = Histogram(LIFETIME_BUCKETS_S)
+            self._checked_out: Dict[int, Dict[str, Any]] = {}
+
+    def record_wait(self, ms: float):
+        with self._lock:
+            self.wait_ms.observe(ms)
+
+    def record_timeout(self, ms: float):
+        with self._lock:
+            self.timeouts += 1
+            self.wait_ms.observe(ms)
+
+    def instrument(self, engine: Engine):
+        """Attach the pool event listeners to ``engine``"""
+        pool = engine.pool
+
+        @event.listens_for(pool, "connect")
+        def on_connect(dbapi_connection, record):
+            record.info["connected_at"] = time.monotonic()
+            with self._lock:
+                self.connects += 1
+
+        @event.listens_for(pool, "checkout")
+        def on_checkout(dbapi_connection, record, proxy):
+            now = time.monotonic()
+            overflow = isinstance(pool, QueuePool) and pool.checkedout() > pool.size()
+            with self._lock:
+                self.checkouts += 1
+                self.overflow_checkouts += overflow
+                self._checked_out[id(record)] = {"since": now, "thread": threading.current_thread().name}
+
+        @event.listens_for(pool, "checkin")
+        def on_checkin(dbapi_connection, record):
+            with self._lock:
+                checkout = self._checked_out.pop(id(record), None)
+                if checkout is not None:
+                    self.held_ms.observe((time.monotonic() - checkout["since"]) * 1000)
+
+        @event.listens_for(pool, "close")
+        def on_close(dbapi_connection, record):
+            connected_at = record.info.pop("connected_at", None)
+            with self._lock:
+                self.closed += 1
+                if connected_at is not None:
+                    self.lifetime_s.observe(time.monotonic() - connected_at)
+
+        @event.listens_for(pool, "invalidate")
+        def on_invalidate(dbapi_connection, record, exception):
+            with self._lock:
+                self.invalidated += 1
+
+    def stats(self, engine: Engine) -> Dict[str, Any]:
+        pool = engine.pool
+        status: Dict[str, Any] = {"class": type(pool).__name__}
+        if isinstance(pool, QueuePool):
+            status.update(
+                size=pool.size(),
+                checked_out=pool.checkedout(),
+                checked_in=pool.checkedin(),
+                overflow=max(0, pool.overflow()),
+                max_overflow=pool._max_overflow,
+                timeout_s=pool.timeout(),
+            )
+        status["recycle_s"] = pool._recycle
+        status["pre_ping"] = pool._pre_ping
+        with self._lock:
+            return {
+                "pool": status,
+                "checkouts": self.checkouts,
+                "overflow_checkouts": self.overflow_checkouts,
+                "timeouts": self.timeouts,
+                "connects": self.connects,
+                "closed": self.closed,
+                "invalidated": self.invalidated,
+                "wait_ms": self.wait_ms.snapshot(),
+                "held_ms": self.held_ms.snapshot(),
+                "connection_lifetime_s": self.lifetime_s.snapshot(),
+            }
+
+    def checked_out(self) -> List[Dict[str, Any]]:
+        """Connections currently checked out, longest held first"""
+        now = time.monotonic()
+        with self._lock:
+            entries = list(self._checked_out.values())
+        return sorted(
+            ({"held_ms": round((now - entry["since"]) * 1000, 1), "thread": entry["thread"]} for entry in entries),
+            key=lambda entry: entry["held_ms"],
+            reverse=True,
+        )
+
+pool_metrics = PoolMetrics()
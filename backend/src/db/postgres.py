@@ -1,12 +1,26 @@
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from src.core.config import settings
+from src.db.pool_metrics import InstrumentedQueuePool, pool_metrics
+
+def _engine_options(url: str) -> dict:
+    options = {"pool_pre_ping": settings.db_pool_pre_ping}
+    if url.startswith("sqlite"):
+        options["connect_args"] = {"check_same_thread": False}
+        if url in ("sqlite://", "sqlite:///:memory:"):
+            return options  # one in-memory database per connection; no pool to size
+    options.update(
+        poolclass=InstrumentedQueuePool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+    )
+    return options
 
 # Create engine based on database URL
-if settings.database_url.startswith("sqlite"):
-    engine = create_engine(settings.database_url, connect_args={"check_same_thread": False})
-else:
-    engine = create_engine(settings.database_url)
+engine = create_engine(settings.database_url, **_engine_options(settings.database_url))
+pool_metrics.instrument(engine)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -15,4 +29,4 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
@@ -1,41 +1,101 @@
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+from src.core.startup import LazyRouter, LazyRouters, startup_profile  # first, so the profile sees every import
+
+import asyncio
+import logging
 import sys
-from pathlib import Path
-
-# Add src to path
-sys.path.append(str(Path(__file__).parent))
-
-from api.auth import router as auth_router
-from api.users import router as users_router
-from api.products import router as products_router
-from api.orders import router as orders_router
-from api.films import router as films_router
-from api.actors import router as actors_router
-from api.categories import router as categories_router
-# from api.publications import router as publications_router  # Temporarily disabled due to motor issues
-from api.reviews import router as reviews_router
-from api.unified_data import router as unified_router
-from db.postgres import engine
-from db.models import Base
-
-# Create tables on startup
-Base.metadata.create_all(bind=engine)
-
-app = FastAPI(
-    title="SkillStacker API",
-    version="1.0.0",
-    description="Enterprise Full-Stack Platform API"
-)
-
-# CORS
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["http://localhost:3000", "http://localhost:3001", "http://localhost:3002"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+from contextlib import asynccontextmanager
+
+with startup_profile.phase("import fastapi"):
+    from fastapi import FastAPI
+    from fastapi.middleware.cors import CORSMiddleware
+    from starlette.concurrency import run_in_threadpool
+
+with startup_profile.phase("import core, db"):
+    from src.core.config import settings
+    from src.core.security import password_hasher
+    from src.db.mongo import open_mongo_clients, close_mongo_client, get_mongo_client
+    from src.db.mongo_indexes import mongo_indexes
+    from src.db.postgres import engine
+    from src.db.migrations import migration_runner
+
+logger = logging.getLogger(__name__)
+
+# Schema changes (tables, full-text and hot-path indexes) are applied once per
+# deploy by migrate.py, not by every worker on import. Nothing here connects
+# to a database: the engine and MongoDB clients connect on first use.
+
+# (module, prefix, tags) - imported at startup
+ROUTERS = [
+    ("src.api.auth", "/api/v1/auth", ["Auth"]),
+    ("src.api.users", "/api/v1/users", ["Users"]),
+    ("src.api.products", "/api/v1/products", ["Products"]),
+    ("src.api.orders", "/api/v1/orders", ["Orders"]),
+    ("src.api.films", "/api/v1/films", ["Films"]),
+    ("src.api.actors", "/api/v1/actors", ["Actors"]),
+    ("src.api.categories", "/api/v1/categories", ["Categories"]),
+    ("src.api.publications", "/api/v1/publications", ["Publications"]),
+    ("src.api.reviews", "/api/v1/reviews", ["Reviews"]),
+    ("src.api.unified_data", "/unified", ["Unified Data & CRUD"]),
+    ("src.api.metrics", "/api/v1/metrics", ["Metrics"]),
+]
+
+# Rarely used routers - imported by the first request under ``path``
+LAZY_ROUTERS = [
+    LazyRouter("src.api.bulk", "/unified", ["Unified Data & CRUD"], "/unified/bulk"),
+    LazyRouter("src.api.debug", "/unified", ["Unified Data & CRUD"], "/unified/debug"),
+]
+
+def build_openapi():
+    """Load every lazy router and build the OpenAPI document now, not on the first /docs hit"""
+    lazy_routers.load()
+    with startup_profile.phase("build openapi"):
+        app.openapi()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if settings.migrate_on_startup:
+        with startup_profile.phase("migrations"):
+            await run_in_threadpool(migration_runner.upgrade, engine)
+    # Shared MongoDB clients live for the whole process
+    with startup_profile.phase("open mongo clients"):
+        open_mongo_clients()
+    # Declared MongoDB indexes (db/mongo_indexes.py) are built in the
+    # background: the publications text index can take a while on a large
+    # collection, and search falls back to regex until it is ready
+    tasks = []
+    if settings.mongo_ensure_indexes:
+        tasks.append(asyncio.create_task(mongo_indexes.ensure_async(await get_mongo_client())))
+    # Off the critical path too: the app takes requests while the lazy
+    # routers are imported and the OpenAPI document is built
+    if settings.openapi_prebuild:
+        app.state.warmup = asyncio.create_task(run_in_threadpool(build_openapi))
+        tasks.append(app.state.warmup)
+    startup_profile.mark_ready()
+    if settings.profile_startup:
+        logger.info(f"Startup profile:\n{startup_profile.format()}")
+    yield
+    for task in tasks:
+        task.cancel()
+    await close_mongo_client()
+    password_hasher.shutdown()
+
+with startup_profile.phase("create app"):
+    app = FastAPI(
+        lifespan=lifespan,
+        title="SkillStacker API",
+        version="1.0.0",
+        description="Enterprise Full-Stack Platform API"
+    )
+
+    # CORS
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["http://localhost:3000", "http://localhost:3001", "http://localhost:3002"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+        expose_headers=["X-Next-Cursor", "X-Total-Count", "ETag", "Last-Modified"],
+    )
 
 @app.get("/")
 def root():
@@ -47,13 +107,23 @@ def health():
 
 # Routes
 # app.include_router(overview_router, prefix="/api/v1/overview", tags=["Overview"])
-app.include_router(auth_router, prefix="/api/v1/auth", tags=["Auth"])
-app.include_router(users_router, prefix="/api/v1/users", tags=["Users"])
-app.include_router(products_router, prefix="/api/v1/products", tags=["Products"])
-app.include_router(orders_router, prefix="/api/v1/orders", tags=["Orders"])
-app.include_router(films_router, prefix="/api/v1/films", tags=["Films"])
-app.include_router(actors_router, prefix="/api/v1/actors", tags=["Actors"])
-app.include_router(categories_router, prefix="/api/v1/categories", tags=["Categories"])
-# app.include_router(publications_router, prefix="/api/v1/publications", tags=["Publications"])  # Temporarily disabled
-app.include_router(reviews_router, prefix="/api/v1/reviews", tags=["Reviews"])
-app.include_router(unified_router, prefix="/unified", tags=["Unified Data & CRUD"])
\ No newline at end of file
+for module, prefix, tags in ROUTERS:
+    app.include_router(startup_profile.import_router(module), prefix=prefix, tags=tags)
+
+lazy_routers = LazyRouters(app, LAZY_ROUTERS)
+if not settings.lazy_routers:
+    lazy_routers.load()
+
+async def _profile_startup():
+    async with lifespan(app):
+        if getattr(app.state, "warmup", None) is not None:
+            await app.state.warmup
+
+if __name__ == "__main__":
+    # python -m src.main --profile-startup: import, start and stop the app
+    # once and print where the time went
+    if "--profile-startup" in sys.argv[1:]:
+        asyncio.run(_profile_startup())
+        print(startup_profile.format())
+    else:
+        print("usage: python -m src.main --profile-startup  (serve with: uvicorn src.main:app)")
@@ -0,0 +1,166 @@
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from pymongo.errors import BulkWriteError
+
+from src.core.config import settings
+from src.core.ingest import Record, batch_summary, batched
+
+logger = logging.getLogger(__name__)
+
+def _timestamp(record: Dict[str, Any], name: str, now: datetime) -> datetime:
+    # Backfills keep their original timestamps; new documents get "now"
+    value = record.get(name)
+    if value is None or value == "":
+        return now
+    if isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        raise ValueError(f"{name}: expected an ISO 8601 timestamp, got {value!r}")
+
+def _optional_int(record: Dict[str, Any], name: str) -> Optional[int]:
+    value = record.get(name)
+    if value is None or value == "":
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{name}: expected an integer, got {value!r}")
+
+def review_document(record: Any) -> Dict[str, Any]:
+    """Review document for one uploaded record; raises ValueError on bad input"""
+    if not isinstance(record, dict):
+        raise ValueError("expected an object")
+    now = datetime.utcnow()
+    rating = _optional_int(record, "rating")
+    return {
+        "title": record.get("title") or "Untitled Review",
+        "content": record.get("content") or "",
+        "rating": max(1, min(5, rating if rating is not None else 3)),
+        "product_id": _optional_int(record, "product_id"),
+        "user_id": _optional_int(record, "user_id"),
+        "helpful_count": _optional_int(record, "helpful_count") or 0,
+        "created_at": _timestamp(record, "created_at", now),
+        "updated_at": _timestamp(record, "updated_at", now),
+    }
+
+def publication_document(record: Any) -> Dict[str, Any]:
+    """Publication document for one uploaded record; raises ValueError on bad input"""
+    if not isinstance(record, dict):
+        raise ValueError("expected an object")
+    groups = record.get("groups") or []
+    if isinstance(groups, str):
+        groups = [group.strip() for group in groups.split("|") if group.strip()]  # CSV cells
+    if not isinstance(groups, list):
+        raise ValueError("groups: expected a list")
+    now = datetime.utcnow()
+    return {
+        "title": record.get("title") or "Untitled Article",
+        "content": record.get("content") or "",
+        "type": record.get("type") or "article",
+        "groups": groups,
+        "author": record.get("author"),
+        "created_at": _timestamp(record, "created_at", now),
+        "updated_at": _timestamp(record, "updated_at", now),
+    }
+
+class DocumentIngestService:
+    """
+    Streams uploaded records into a MongoDB collection.
+
+    Records are grouped into batches and written with unordered insert_many,
+    so one bad document does not stop the rest of its batch. Up to
+    ``concurrency`` batches are in flight at once; parsing waits for a free
+    slot, so memory stays bounded by concurrency x batch size however large
+    the upload is. ``on_inserted`` is awaited with the documents each batch
+    actually wrote, e.g. to keep derived collections in step.
+    """
+
+    async def _insert(self, collection, documents: List[Dict[str, Any]]) -> Tuple[int, List[Tuple[int, str]]]:
+        """Insert ``documents``; returns (inserted count, [(document index, error)])"""
+        try:
+            result = await collection.insert_many(documents, ordered=False)
+            return len(result.inserted_ids), []
+        except BulkWriteError as e:
+            failures = [(error["index"], error.get("errmsg", "write error")) for error in e.details.get("writeErrors", [])]
+            return e.details.get("nInserted", len(documents) - len(failures)), failures
+
+    async def ingest(
+        self,
+        collection,
+        records: AsyncIterator[Record],
+        build: Callable[[Any], Dict[str, Any]],
+        batch_size: Optional[int] = None,
+        concurrency: Optional[int] = None,
+        return_ids: bool = False,
+        on_inserted: Optional[Callable[[List[Dict[str, Any]]], Awaitable[Any]]] = None,
+    ) -> Dict[str, Any]:
+        """Insert parsed upload records into the motor ``collection`` and report per batch"""
+        batch_size = batch_size or settings.bulk_ingest_batch_size
+        concurrency = concurrency or settings.bulk_ingest_concurrency
+        started = time.perf_counter()
+        slots = asyncio.Semaphore(concurrency)
+
+        async def write(index: int, batch: List[Record]) -> Dict[str, Any]:
+            try:
+                documents, lines, errors = [], [], []
+                for line_no, record, error in batch:
+                    if error is None:
+                        try:
+                            documents.append(build(record))
+                            lines.append(line_no)
+                            continue
+                        except ValueError as e:
+                            error = str(e)
+                    errors.append({"line": line_no, "error": error})
+                written: List[Dict[str, Any]] = []
+                inserted = 0
+                if documents:
+                    try:
+                        inserted, failures = await self._insert(collection, documents)
+                    except Exception as e:
+                        logger.error(f"Bulk {collection.name} batch {index} failed: {e}")
+                        inserted, failures = 0, [(position, str(e)) for position in range(len(documents))]
+                    failed_positions = {position for position, _ in failures}
+                    errors.extend({"line": lines[position], "error": message} for position, message in failures)
+                    # insert_many sets _id on each document before sending it
+                    written = [document for position, document in enumerate(documents)
+                               if position not in failed_positions and "_id" in document]
+                    if written and on_inserted is not None:
+                        await on_inserted(written)
+                summary = batch_summary(index, batch, inserted, sorted(errors, key=lambda error: error["line"]))
+                if return_ids:
+                    summary["ids"] = [str(document["_id"]) for document in written]
+                return summary
+            finally:
+                slots.release()
+
+        tasks = []
+        index = 0
+        async for batch in batched(records, batch_size):
+            index += 1
+            await slots.acquire()
+            tasks.append(asyncio.create_task(write(index, batch)))
+        batches = list(await asyncio.gather(*tasks))
+
+        elapsed = time.perf_counter() - started
+        inserted = sum(batch["inserted"] for batch in batches)
+        failed = sum(batch["failed"] for batch in batches)
+        rows_per_second = round(inserted / elapsed, 1) if elapsed > 0 else None
+        logger.info(f"Bulk {collection.name} ingest: {inserted} inserted, {failed} failed in {elapsed:.2f}s ({rows_per_second} docs/s)")
+        return {
+            "inserted": inserted,
+            "failed": failed,
+            "batch_size": batch_size,
+            "concurrency": concurrency,
+            "elapsed_ms": round(elapsed * 1000, 1),
+            "rows_per_second": rows_per_second,
+            "batches": batches,
+        }
+
+document_ingest = DocumentIngestService()
@@ -0,0 +1,163 @@
+import io
+import logging
+import time
+from datetime import datetime, timezone
+from decimal import Decimal, InvalidOperation
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from sqlalchemy import insert, text
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from src.core.config import settings
+from src.core.ingest import Record, batch_summary, batched
+from src.db.models import Film
+
+logger = logging.getLogger(__name__)
+
+# Columns a bulk upload may set, with the defaults of the single-film endpoints
+FILM_DEFAULTS: Dict[str, Any] = {
+    "title": "Untitled",
+    "description": None,
+    "release_year": None,
+    "language_id": 1,
+    "rental_duration": 3,
+    "rental_rate": Decimal("4.99"),
+    "length": None,
+    "replacement_cost": Decimal("19.99"),
+    "rating": "G",
+    "special_features": None,
+}
+_INTEGER_COLUMNS = {"release_year", "language_id", "rental_duration", "length"}
+_DECIMAL_COLUMNS = {"rental_rate", "replacement_cost"}
+_MAX_LENGTHS = {"title": 255, "rating": 10}
+
+def film_values(record: Any) -> Dict[str, Any]:
+    """Column values for one uploaded film; raises ValueError on bad input"""
+    if not isinstance(record, dict):
+        raise ValueError("expected an object")
+    values = {}
+    for name, default in FILM_DEFAULTS.items():
+        value = record.get(name)
+        if value is None or value == "":
+            values[name] = default
+            continue
+        if name in _INTEGER_COLUMNS:
+            try:
+                value = int(value)
+            except (TypeError, ValueError):
+                raise ValueError(f"{name}: expected an integer, got {value!r}")
+        elif name in _DECIMAL_COLUMNS:
+            try:
+                value = Decimal(str(value))
+            except InvalidOperation:
+                raise ValueError(f"{name}: expected a number, got {value!r}")
+        else:
+            value = str(value)
+            if name in _MAX_LENGTHS and len(value) > _MAX_LENGTHS[name]:
+                raise ValueError(f"{name}: longer than {_MAX_LENGTHS[name]} characters")
+        values[name] = value
+    return values
+
+def _copy_text(value: Any) -> str:
+    # COPY ... FROM STDIN text format: \N is NULL, backslash escapes the rest
+    if value is None:
+        return "\\N"
+    return str(value).replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+
+class FilmIngestService:
+    """
+    Loads large film catalogs in batches.
+
+    Each batch is one transaction: a multi-row INSERT ... RETURNING through
+    SQLAlchemy's insertmanyvalues (SQLite, and PostgreSQL without COPY), or
+    COPY FROM STDIN on PostgreSQL with film_ids reserved from the sequence
+    beforehand so they can be returned. A failing batch is rolled back and
+    reported; the batches before and after it are kept.
+    """
+
+    def insert_batch(self, db: Session, rows: List[Dict[str, Any]]) -> List[int]:
+        try:
+            if db.get_bind().dialect.name == "postgresql" and settings.bulk_ingest_use_copy:
+                ids = self._copy(db, rows)
+            else:
+                statement = insert(Film).returning(Film.film_id, sort_by_parameter_order=True)
+                ids = list(db.execute(statement, rows).scalars())
+            db.commit()
+            return ids
+        except Exception:
+            db.rollback()
+            raise
+
+    def _copy(self, db: Session, rows: List[Dict[str, Any]]) -> List[int]:
+        connection = db.connection()
+        ids = list(connection.execute(
+            text("SELECT nextval(pg_get_serial_sequence('film', 'film_id')) FROM generate_series(1, :n)"),
+            {"n": len(rows)}
+        ).scalars())
+        columns = ["film_id", *FILM_DEFAULTS, "last_update"]
+        now = datetime.now(timezone.utc)
+        buffer = io.StringIO()
+        for film_id, row in zip(ids, rows):
+            buffer.write("\t".join(_copy_text(v) for v in (film_id, *row.values(), now)))
+            buffer.write("\n")
+        buffer.seek(0)
+        cursor = connection.connection.cursor()
+        try:
+            cursor.copy_expert(f"COPY film ({', '.join(columns)}) FROM STDIN", buffer)
+        finally:
+            cursor.close()
+        return ids
+
+    async def ingest(
+        self,
+        db: Session,
+        records: AsyncIterator[Record],
+        batch_size: Optional[int] = None,
+        return_ids: bool = True,
+    ) -> Dict[str, Any]:
+        """Insert parsed upload records batch by batch and report per batch"""
+        batch_size = batch_size or settings.bulk_ingest_batch_size
+        started = time.perf_counter()
+        ids: List[int] = []
+        batches = []
+        inserted = failed = 0
+        index = 0
+        async for batch in batched(records, batch_size):
+            index += 1
+            rows, errors = [], []
+            for line_no, record, error in batch:
+                if error is None:
+                    try:
+                        rows.append(film_values(record))
+                        continue
+                    except ValueError as e:
+                        error = str(e)
+                errors.append({"line": line_no, "error": error})
+            batch_ids: List[int] = []
+            if rows:
+                try:
+                    batch_ids = await run_in_threadpool(self.insert_batch, db, rows)
+                except Exception as e:
+                    logger.error(f"Bulk film batch {index} failed: {e}")
+                    errors.append({"line": None, "error": f"batch rolled back: {e.__class__.__name__}: {e}"})
+            inserted += len(batch_ids)
+            failed += len(batch) - len(batch_ids)
+            if return_ids:
+                ids.extend(batch_ids)
+            batches.append(batch_summary(index, batch, len(batch_ids), errors))
+
+        elapsed = time.perf_counter() - started
+        rows_per_second = round(inserted / elapsed, 1) if elapsed > 0 else None
+        logger.info(f"Bulk film ingest: {inserted} inserted, {failed} failed in {elapsed:.2f}s ({rows_per_second} rows/s)")
+        return {
+            "inserted": inserted,
+            "failed": failed,
+            "batch_size": batch_size,
+            "elapsed_ms": round(elapsed * 1000, 1),
+            "rows_per_second": rows_per_second,
+            "ids": ids if return_ids else None,
+            "batches": batches,
+        }
+
+film_ingest = FilmIngestService()
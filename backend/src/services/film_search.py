@@ -0,0 +1,140 @@
+import logging
+import re
+import time
+import weakref
+from typing import List
+
+from sqlalchemy import column, func, literal_column, table, text
+from sqlalchemy.engine import Engine
+
+from src.core.config import settings
+from src.db.models import Film
+
+logger = logging.getLogger(__name__)
+
+# SQLite: external-content FTS5 table over film(title, description). The
+# triggers keep it in step with every INSERT/UPDATE/DELETE on film, so writes
+# through the unified CRUD endpoints (or anything else) are searchable at once.
+SQLITE_DDL = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS film_fts USING fts5(
+        title, description, content='film', content_rowid='film_id'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS film_fts_ai AFTER INSERT ON film BEGIN
+        INSERT INTO film_fts(rowid, title, description) VALUES (new.film_id, new.title, new.description);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS film_fts_ad AFTER DELETE ON film BEGIN
+        INSERT INTO film_fts(film_fts, rowid, title, description) VALUES ('delete', old.film_id, old.title, old.description);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS film_fts_au AFTER UPDATE ON film BEGIN
+        INSERT INTO film_fts(film_fts, rowid, title, description) VALUES ('delete', old.film_id, old.title, old.description);
+        INSERT INTO film_fts(rowid, title, description) VALUES (new.film_id, new.title, new.description);
+    END""",
+]
+
+# PostgreSQL: the Pagila schema already ships a film.fulltext tsvector kept
+# current by film_fulltext_trigger; this recreates both for databases built by
+# create_all and adds a GIN index, which answers @@ lookups faster than GiST.
+POSTGRES_DDL = [
+    "ALTER TABLE film ADD COLUMN IF NOT EXISTS fulltext tsvector",
+    """UPDATE film SET fulltext = to_tsvector('pg_catalog.english', coalesce(title, '') || ' ' || coalesce(description, ''))
+        WHERE fulltext IS NULL""",
+    "CREATE INDEX IF NOT EXISTS film_fulltext_gin_idx ON film USING gin (fulltext)",
+    """CREATE OR REPLACE TRIGGER film_fulltext_trigger BEFORE INSERT OR UPDATE ON film
+        FOR EACH ROW EXECUTE FUNCTION tsvector_update_trigger('fulltext', 'pg_catalog.english', 'title', 'description')""",
+]
+
+film_fts = table("film_fts", column("rowid"), column("film_fts"))
+
+def _tokens(term: str) -> List[str]:
+    return re.findall(r"\w+", term.lower())
+
+class FilmSearchService:
+    """Relevance-ranked film title/description search backed by a full-text index"""
+
+    def __init__(self):
+        # Only hits are kept for good; a miss is re-probed after
+        # film_search_probe_seconds so workers pick up a later migration
+        self._available = weakref.WeakKeyDictionary()
+        self._retry_at = weakref.WeakKeyDictionary()
+
+    def ensure_index(self, engine: Engine) -> bool:
+        """Create the full-text index for ``engine`` if it does not exist yet"""
+        dialect = engine.dialect.name
+        try:
+            with engine.begin() as conn:
+                if dialect == "sqlite":
+                    existed = self._probe(conn, dialect)
+                    for statement in SQLITE_DDL:
+                        conn.execute(text(statement))
+                    if not existed:
+                        conn.execute(text("INSERT INTO film_fts(film_fts) VALUES ('rebuild')"))
+                elif dialect == "postgresql":
+                    for statement in POSTGRES_DDL:
+                        conn.execute(text(statement))
+                else:
+                    return False
+        except Exception as e:
+            logger.error(f"Could not create film search index: {e}")
+            return False
+        self._available[engine] = True
+        self._retry_at.pop(engine, None)
+        return True
+
+    def _probe(self, conn, dialect: str) -> bool:
+        if dialect == "sqlite":
+            sql = "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'film_fts'"
+        elif dialect == "postgresql":
+            sql = ("SELECT 1 FROM information_schema.columns "
+                   "WHERE table_name = 'film' AND column_name = 'fulltext'")
+        else:
+            return False
+        return conn.execute(text(sql)).first() is not None
+
+    def is_available(self, engine: Engine) -> bool:
+        """Whether ``engine`` has the index; a hit is cached, a miss re-checked periodically"""
+        if engine in self._available:
+            return True
+        if time.monotonic() < self._retry_at.get(engine, 0.0):
+            return False
+        try:
+            with engine.connect() as conn:
+                found = self._probe(conn, engine.dialect.name)
+        except Exception as e:
+            logger.error(f"Film search index probe failed: {e}")
+            found = False
+        if found:
+            self._available[engine] = True
+            self._retry_at.pop(engine, None)
+        else:
+            self._retry_at[engine] = time.monotonic() + settings.film_search_probe_seconds
+        return found
+
+    def apply(self, query, term: str):
+        """
+        Restrict a Film query to matches for ``term``, best matches first.
+
+        Every word is matched as a prefix so results update while typing.
+        Falls back to the old ILIKE scan when the index is missing.
+        """
+        engine = query.session.get_bind()
+        tokens = _tokens(term)
+        if not tokens or not self.is_available(engine):
+            pattern = f"%{term}%"
+            return query.filter(Film.title.ilike(pattern) | Film.description.ilike(pattern))
+
+        if engine.dialect.name == "sqlite":
+            match = " ".join(f'"{token}"*' for token in tokens)
+            return (
+                query.join(film_fts, film_fts.c.rowid == Film.film_id)
+                .filter(film_fts.c.film_fts.op("MATCH")(match))
+                .order_by(func.bm25(literal_column("film_fts")))
+            )
+
+        tsquery = func.to_tsquery("pg_catalog.english", " & ".join(f"{token}:*" for token in tokens))
+        fulltext = literal_column("film.fulltext")
+        return (
+            query.filter(fulltext.op("@@")(tsquery))
+            .order_by(func.ts_rank(fulltext, tsquery).desc())
+        )
+
+film_search = FilmSearchService()
@@ -0,0 +1,82 @@
+import logging
+from typing import Any, Dict, List, Tuple
+
+from pymongo import TEXT
+from pymongo.errors import PyMongoError
+
+logger = logging.getLogger(__name__)
+
+# Weighted text index over the fields the old $regex search looked at: a hit
+# in the title counts ten times as much as one in a subgroup name
+TEXT_INDEX_NAME = "publications_text"
+TEXT_INDEX_WEIGHTS = {"title": 10, "related_title": 5, "groups": 2, "subgroups": 1}
+
+SCORE_PROJECTION = {"score": {"$meta": "textScore"}}
+SCORE_SORT = [("score", {"$meta": "textScore"})]
+
+def text_index_keys() -> List[Tuple[str, str]]:
+    return [(field, TEXT) for field in TEXT_INDEX_WEIGHTS]
+
+def text_index_options() -> Dict[str, Any]:
+    return {"name": TEXT_INDEX_NAME, "weights": TEXT_INDEX_WEIGHTS, "default_language": "english"}
+
+def text_query(q: str) -> Dict[str, Any]:
+    """Match documents containing any of the words in ``q`` (stemmed, case-insensitive)"""
+    return {"$text": {"$search": q}}
+
+def regex_query(q: str) -> Dict[str, Any]:
+    """Collection-scanning fallback used until the text index exists"""
+    return {
+        "$or": [
+            {"title": {"$regex": q, "$options": "i"}},
+            {"related_title": {"$regex": q, "$options": "i"}},
+            {"groups": {"$in": [{"$regex": q, "$options": "i"}]}},
+            {"subgroups": {"$in": [{"$regex": q, "$options": "i"}]}}
+        ]
+    }
+
+class PublicationSearchIndex:
+    """
+    Tracks which publication collections have the text index.
+
+    The index itself is declared in db/mongo_indexes.py and built at startup;
+    searches fall back to regex until it exists.
+    """
+
+    def __init__(self):
+        self._ready = set()
+
+    @staticmethod
+    def _key(collection) -> Tuple[str, str]:
+        return collection.database.name, collection.name
+
+    def mark_ready(self, collection):
+        self._ready.add(self._key(collection))
+
+    def has_index(self, collection) -> bool:
+        """Sync (pymongo) check, remembered once the index has been seen"""
+        key = self._key(collection)
+        if key in self._ready:
+            return True
+        try:
+            if TEXT_INDEX_NAME in collection.index_information():
+                self._ready.add(key)
+                return True
+        except PyMongoError as e:
+            logger.error(f"Publication index lookup failed: {e}")
+        return False
+
+    async def has_index_async(self, collection) -> bool:
+        """Async (motor) variant of has_index"""
+        key = self._key(collection)
+        if key in self._ready:
+            return True
+        try:
+            if TEXT_INDEX_NAME in await collection.index_information():
+                self._ready.add(key)
+                return True
+        except PyMongoError as e:
+            logger.error(f"Publication index lookup failed: {e}")
+        return False
+
+publication_index = PublicationSearchIndex()
@@ -0,0 +1,92 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from bson import ObjectId
+from bson.errors import InvalidId
+from fastapi import HTTPException
+from pymongo import ASCENDING, DESCENDING, IndexModel
+
+from src.core.pagination import decode_cursor, encode_cursor
+
+# Feed order -> sort field; ties break on _id, newest first
+REVIEW_SORTS = {
+    "newest": "created_at",
+    "helpful": "helpful_count",
+}
+
+# BSON types a sort key may hold, in MongoDB's cross-type sort order. $lt only
+# matches within one type, so the cursor records the type of the last value and
+# the seek also takes every lower-ordered type: reviews imported with a string
+# created_at come after the dated ones instead of being skipped.
+CURSOR_TYPES = ("null", "number", "string", "date")
+
+# One compound index per order: the product filter, the sort key and the _id
+# tie-break, so a page is a bounded index walk however many reviews a product has.
+# Built at startup by db/mongo_indexes.py.
+REVIEW_FEED_INDEXES = [
+    IndexModel([("product_id", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)], name="reviews_product_created"),
+    IndexModel([("product_id", ASCENDING), ("helpful_count", DESCENDING), ("_id", DESCENDING)], name="reviews_product_helpful"),
+]
+
+REVIEW_FEED_PROJECTION = {
+    "product_id": 1, "user_id": 1, "rating": 1, "title": 1, "content": 1, "created_at": 1, "helpful_count": 1,
+}
+
+def _cursor_value(value: Any) -> Tuple[str, Any]:
+    if value is None:
+        return "null", None
+    if isinstance(value, datetime):
+        return "date", value.isoformat()
+    if isinstance(value, str):
+        return "string", value
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return "number", value
+    raise ValueError(f"Cannot page past a sort key of type {type(value).__name__}")
+
+def _parse_cursor_value(kind: Any, value: Any) -> Any:
+    if kind == "null" and value is None:
+        return None
+    if kind == "number" and isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    if kind == "string" and isinstance(value, str):
+        return value
+    if kind == "date" and isinstance(value, str):
+        return datetime.fromisoformat(value)
+    raise ValueError(f"Invalid cursor value {value!r} of type {kind!r}")
+
+def _seek(field: str, kind: str, value: Any, last_id: ObjectId) -> Dict[str, Any]:
+    # Descending seek past (value, _id). Reviews written before helpful_count
+    # existed have no value; MongoDB sorts them last, so they stay reachable.
+    if kind == "null":
+        return {field: None, "_id": {"$lt": last_id}}
+    branches = [
+        {field: {"$lt": value}},
+        {field: value, "_id": {"$lt": last_id}},
+    ]
+    lower = list(CURSOR_TYPES[1:CURSOR_TYPES.index(kind)])
+    if lower:
+        branches.append({field: {"$type": lower}})
+    branches.append({field: None})
+    return {"$or": branches}
+
+def feed_query(product_id: int, sort: str, cursor: Optional[str]) -> Tuple[Dict[str, Any], List[Tuple[str, int]]]:
+    """Filter and sort for one page of a product's reviews, seeking past ``cursor``"""
+    field = REVIEW_SORTS[sort]
+    query: Dict[str, Any] = {"product_id": product_id}
+    if cursor is not None:
+        kind, value, last_id = decode_cursor(cursor, 3)
+        try:
+            value = _parse_cursor_value(kind, value)
+            last_id = ObjectId(last_id)
+        except (TypeError, ValueError, InvalidId):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        query.update(_seek(field, kind, value, last_id))
+    return query, [(field, DESCENDING), ("_id", DESCENDING)]
+
+def next_cursor(reviews: List[Dict[str, Any]], sort: str, limit: int) -> Optional[str]:
+    """Cursor for the page after ``reviews``, or None on the last page"""
+    if len(reviews) < limit:
+        return None
+    last = reviews[-1]
+    kind, value = _cursor_value(last.get(REVIEW_SORTS[sort]))
+    return encode_cursor([kind, value, str(last["_id"])])
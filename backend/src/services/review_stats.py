@@ -0,0 +1,184 @@
+import logging
+import re
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+from bson.decimal128 import Decimal128
+from pymongo import UpdateOne
+from pymongo.database import Database
+
+logger = logging.getLogger(__name__)
+
+REVIEW_STATS_COLLECTION = "review_stats"
+STARS = ("1", "2", "3", "4", "5")
+
+def star(rating: Any) -> Optional[int]:
+    """
+    ``rating`` as a whole star from 1 to 5, or None if it is not one.
+
+    4, 4.0 and "4" all count as four stars; REBUILD_PIPELINE applies the
+    same rule, so incremental updates and rebuilds agree.
+    """
+    if isinstance(rating, bool):
+        return None
+    if isinstance(rating, Decimal128):
+        rating = rating.to_decimal()
+    if isinstance(rating, str) and not re.fullmatch(r"\d+(\.\d+)?", rating):
+        return None  # what $convert would reject (or Python would read loosely, like "4_0")
+    try:
+        value = float(rating)
+    except (TypeError, ValueError):
+        return None
+    return int(value) if value.is_integer() and 1 <= value <= 5 else None
+
+def _delta_ops(added: Iterable[Dict[str, Any]] = (), removed: Iterable[Dict[str, Any]] = (), touch_last: bool = True) -> List[UpdateOne]:
+    """
+    $inc upserts moving the rollups by ``added`` minus ``removed`` reviews.
+
+    Reviews are folded per product first, so a batch of N reviews for one
+    film is a single update.
+    """
+    deltas: Dict[Any, Dict[str, Any]] = {}
+    for sign, reviews in ((1, added), (-1, removed)):
+        for review in reviews:
+            product_id = review.get("product_id")
+            if product_id is None:
+                continue
+            delta = deltas.setdefault(product_id, {"inc": {}, "last": None})
+            inc = delta["inc"]
+            rating = star(review.get("rating"))
+            inc["count"] = inc.get("count", 0) + sign
+            if rating is not None:
+                inc["sum"] = inc.get("sum", 0) + sign * rating
+                inc[f"hist.{rating}"] = inc.get(f"hist.{rating}", 0) + sign
+            created_at = review.get("created_at")
+            if sign > 0 and touch_last and isinstance(created_at, datetime):
+                delta["last"] = max(delta["last"], created_at) if delta["last"] else created_at
+
+    ops = []
+    for product_id, delta in deltas.items():
+        update: Dict[str, Any] = {}
+        inc = {field: value for field, value in delta["inc"].items() if value}
+        if inc:
+            update["$inc"] = inc
+        if delta["last"] is not None:
+            update["$max"] = {"last_review_at": delta["last"]}
+        if update:
+            ops.append(UpdateOne({"_id": product_id}, update, upsert=True))
+    return ops
+
+def _summary(product_id: Any, stats: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    stats = stats or {}
+    count = stats.get("count", 0)
+    histogram = stats.get("hist", {})
+    rated = sum(histogram.get(s, 0) for s in STARS)  # reviews without a usable rating don't dilute the average
+    return {
+        "product_id": product_id,
+        "average_rating": round(stats.get("sum", 0) / rated, 1) if rated > 0 else 0,
+        "total_reviews": count,
+        "rating_distribution": {s: histogram.get(s, 0) for s in STARS},
+        "last_review_at": stats.get("last_review_at"),
+    }
+
+# Recomputes every rollup from the reviews collection. Ratings go through
+# the same rule as star(): numbers and numeric strings that are a whole 1-5
+_STAR = {"$cond": [
+    {"$in": [{"$type": "$rating"}, ["int", "long", "double", "decimal", "string"]]},
+    {"$convert": {"input": "$rating", "to": "double", "onError": None, "onNull": None}},
+    None,
+]}
+REBUILD_PIPELINE = [
+    {"$match": {"product_id": {"$ne": None}}},
+    {"$set": {"_star": _STAR}},
+    {"$group": {
+        "_id": "$product_id",
+        "count": {"$sum": 1},
+        "sum": {"$sum": {"$cond": [{"$in": ["$_star", [1, 2, 3, 4, 5]]}, "$_star", 0]}},
+        "last_review_at": {"$max": "$created_at"},
+        **{f"star{s}": {"$sum": {"$cond": [{"$eq": ["$_star", int(s)]}, 1, 0]}} for s in STARS},
+    }},
+    {"$project": {
+        "count": 1,
+        "sum": 1,
+        "last_review_at": 1,
+        "hist": {s: f"$star{s}" for s in STARS},
+    }},
+    {"$out": REVIEW_STATS_COLLECTION},
+]
+
+class ReviewStatsService:
+    """
+    Per-product review rollups: count, rating sum, per-star histogram and
+    the time of the newest review, one document per product_id.
+
+    Every review write applies its delta with $inc, so reading a product's
+    summary is a single _id lookup however many reviews it has. The rollup
+    is updated right after the review itself (MongoDB here runs without
+    multi-document transactions), so if a rollup update fails it can drift
+    until rebuild() recomputes everything. last_review_at only ever moves
+    forward; deleting the newest review leaves it in place until a rebuild.
+
+    The deploy runs rebuild_review_stats.py --if-empty (ensure_built), so
+    the rollups are seeded from existing reviews on first deploy.
+    """
+
+    def _apply(self, db: Database, ops: List[UpdateOne]):
+        if not ops:
+            return
+        try:
+            db[REVIEW_STATS_COLLECTION].bulk_write(ops, ordered=False)
+        except Exception as e:
+            # The review write already succeeded; a rebuild repairs the rollup
+            logger.error(f"Review stats update failed: {e}")
+
+    async def _apply_async(self, db, ops: List[UpdateOne]):
+        if not ops:
+            return
+        try:
+            await db[REVIEW_STATS_COLLECTION].bulk_write(ops, ordered=False)
+        except Exception as e:
+            logger.error(f"Review stats update failed: {e}")
+
+    def record_created(self, db: Database, *reviews: Dict[str, Any]):
+        self._apply(db, _delta_ops(added=reviews))
+
+    async def record_created_async(self, db, reviews: List[Dict[str, Any]]):
+        """Same as record_created for a motor database (streaming ingest)"""
+        await self._apply_async(db, _delta_ops(added=reviews))
+
+    def record_updated(self, db: Database, before: Dict[str, Any], after: Dict[str, Any]):
+        if before.get("product_id") == after.get("product_id") and before.get("rating") == after.get("rating"):
+            return
+        self._apply(db, _delta_ops(added=[after], removed=[before], touch_last=False))
+
+    def record_deleted(self, db: Database, review: Dict[str, Any]):
+        self._apply(db, _delta_ops(removed=[review]))
+
+    def summary(self, db: Database, product_id: int) -> Dict[str, Any]:
+        return _summary(product_id, db[REVIEW_STATS_COLLECTION].find_one({"_id": product_id}))
+
+    def summaries(self, db: Database, product_ids: List[int]) -> List[Dict[str, Any]]:
+        """Summaries for many products with one $in read, in the order given"""
+        found = {stats["_id"]: stats for stats in db[REVIEW_STATS_COLLECTION].find({"_id": {"$in": product_ids}})}
+        return [_summary(product_id, found.get(product_id)) for product_id in product_ids]
+
+    async def summary_async(self, db, product_id: int) -> Dict[str, Any]:
+        return _summary(product_id, await db[REVIEW_STATS_COLLECTION].find_one({"_id": product_id}))
+
+    def rebuild(self, db: Database) -> int:
+        """Recompute every rollup from scratch; returns the number of products"""
+        db.reviews.aggregate(REBUILD_PIPELINE, allowDiskUse=True)
+        return db[REVIEW_STATS_COLLECTION].estimated_document_count()
+
+    def ensure_built(self, db: Database) -> Optional[int]:
+        """
+        Rebuild when there are reviews but no rollups yet (first deploy, fresh
+        restore); returns the number of products rebuilt, or None if skipped.
+        """
+        if db[REVIEW_STATS_COLLECTION].find_one({}, {"_id": 1}) is not None:
+            return None
+        if db.reviews.find_one({}, {"_id": 1}) is None:
+            return None
+        return self.rebuild(db)
+
+review_stats = ReviewStatsService()
@@ -0,0 +1,66 @@
+import pytest
+from decimal import Decimal
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from src.main import app
+from src.api.auth import create_access_token
+from src.core.cache import response_cache
+from src.core.counting import count_cache
+from src.core.principal import principal_claims
+from src.db.models import Base, Film, User
+from src.db.postgres import get_db
+
+@pytest.fixture
+def db_session_factory():
+    """In-memory SQLite database seeded with a handful of films"""
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    TestingSession = sessionmaker(bind=engine)
+    session = TestingSession()
+    session.add_all([
+        Film(
+            film_id=i,
+            title=f"Film {i}",
+            release_year=2000 + i,
+            rental_rate=Decimal("0.99") if i % 3 == 0 else Decimal("2.99"),
+            length=60 + 10 * i,
+            rating="PG" if i % 2 else "G",
+        )
+        for i in range(1, 8)
+    ])
+    session.commit()
+    session.close()
+    return TestingSession
+
+@pytest.fixture
+def client(db_session_factory):
+    def override_get_db():
+        db = db_session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+    count_cache.clear()
+    response_cache.clear()
+
+@pytest.fixture
+def auth_headers(db_session_factory):
+    """Authorization headers for a new admin (or regular) user"""
+    def make(is_admin: bool = True):
+        session = db_session_factory()
+        email = "admin@example.com" if is_admin else "user@example.com"
+        user = session.query(User).filter(User.email == email).first()
+        if user is None:
+            user = User(first_name="Test", last_name="User", email=email, is_admin=is_admin)
+            session.add(user)
+            session.commit()
+        token = create_access_token({"sub": user.email, **principal_claims(user)})
+        session.close()
+        return {"Authorization": f"Bearer {token}"}
+    return make
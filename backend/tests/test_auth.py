@@ -0,0 +1,60 @@
+from sqlalchemy import event
+
+from src.api.auth import create_access_token
+from src.core.config import settings
+from src.core.principal import invalidate_principal, principal_claims
+from src.core.security import password_hasher, pwd_context
+from src.db.models import User
+
+def test_principal_is_cached_until_invalidated(client, db_session_factory, monkeypatch):
+    session = db_session_factory()
+    user = User(customer_id=9, first_name="Ada", last_name="Lovelace", email="ada@example.com", is_admin=True)
+    session.add(user)
+    session.commit()
+    token = create_access_token({"sub": user.email, **principal_claims(user)})
+    session.close()
+
+    lookups = []
+    event.listen(db_session_factory.kw["bind"], "before_cursor_execute",
+                 lambda conn, cursor, statement, *args: lookups.append(statement) if "customer" in statement else None)
+    me = lambda: client.get("/api/v1/users/me", headers={"Authorization": f"Bearer {token}"})
+
+    assert me().json()["first_name"] == "Ada"
+    assert me().json()["is_admin"] is True
+    assert len(lookups) == 1
+
+    invalidate_principal("ada@example.com")
+    me()
+    assert len(lookups) == 2
+
+    monkeypatch.setattr(settings, "auth_principal_mode", "claims")
+    invalidate_principal("ada@example.com")
+    assert me().json()["email"] == "ada@example.com"
+    assert len(lookups) == 2
+
+    monkeypatch.setattr(settings, "auth_principal_mode", "db")
+    me()
+    me()
+    assert len(lookups) == 4
+
+def test_login_rehashes_on_cost_change_and_sheds_load(client, db_session_factory, auth_headers, monkeypatch):
+    pwd_context.update(bcrypt__rounds=4)
+    try:
+        registered = client.post("/api/v1/auth/register", json={
+            "first_name": "Grace", "last_name": "Hopper", "email": "grace@example.com", "password": "cobol"
+        })
+        assert registered.status_code == 200
+
+        pwd_context.update(bcrypt__rounds=5)
+        login = lambda password: client.post("/api/v1/auth/login", data={"username": "grace@example.com", "password": password})
+        assert login("wrong").status_code == 401
+        assert login("cobol").status_code == 200
+        with db_session_factory() as session:
+            assert session.query(User.password_hash).filter(User.email == "grace@example.com").scalar().startswith("$2b$05$")
+
+        monkeypatch.setattr(password_hasher, "max_pending", 0)
+        busy = login("cobol")
+        assert busy.status_code == 503 and busy.headers["Retry-After"] == "1"
+        assert client.get("/api/v1/metrics/password-hashing", headers=auth_headers()).json()["rejected"] >= 1
+    finally:
+        pwd_context.update(bcrypt__rounds=settings.password_bcrypt_rounds)
@@ -0,0 +1,78 @@
+import pytest
+from src.core import cache as cache_module
+from src.core.cache import ResponseCache, cached
+from src.core.cache_backends import MemoryCacheBackend, SQLiteCacheBackend
+from src.core.config import settings
+
+@pytest.fixture(params=["memory", "sqlite"])
+def backend(request, tmp_path):
+    if request.param == "memory":
+        return MemoryCacheBackend()
+    return SQLiteCacheBackend(str(tmp_path / "cache.sqlite3"))
+
+@pytest.fixture(autouse=True)
+def sync_every_read(monkeypatch):
+    monkeypatch.setattr(settings, "cache_sync_interval_seconds", 0)
+
+def test_l2_shares_entries_between_workers(backend):
+    worker_a, worker_b = ResponseCache(16, l2=backend), ResponseCache(16, l2=backend)
+    worker_a.set(("films.stats",), {"total_films": 7}, ttl=60, tags=["films"])
+
+    assert worker_b.get("films.stats", ("films.stats",)) == (True, {"total_films": 7})
+    assert worker_b.stats()["l2"]["hits"] == 1
+
+def test_invalidation_reaches_other_workers(backend):
+    worker_a, worker_b = ResponseCache(16, l2=backend), ResponseCache(16, l2=backend)
+    worker_a.set(("films.stats",), {"total_films": 7}, ttl=60, tags=["films"])
+    assert worker_b.get("films.stats", ("films.stats",))[0]
+
+    worker_a.invalidate("films")
+    assert worker_b.get("films.stats", ("films.stats",)) == (False, None)
+
+@pytest.mark.parametrize("kind", ["memory", "sqlite"])
+def test_l2_evicts_soonest_to_expire_beyond_max_entries(kind, tmp_path):
+    if kind == "memory":
+        store = MemoryCacheBackend(max_entries=2)
+    else:
+        store = SQLiteCacheBackend(str(tmp_path / "cache.sqlite3"), max_entries=2)
+    store.set("short", b"1", ttl=1, tags=[])
+    store.set("long", b"2", ttl=60, tags=[])
+    store.set("longer", b"3", ttl=120, tags=[])
+
+    assert store.get("short") is None
+    assert (store.get("long"), store.get("longer")) == (b"2", b"3")
+
+def test_read_overlapping_a_write_is_not_cached(monkeypatch):
+    cache = ResponseCache(16)
+    monkeypatch.setattr(cache_module, "response_cache", cache)
+    films, reads = {"total": 7}, []
+
+    @cached("films.race", ttl=60, tags=["films"])
+    def read_total():
+        total = films["total"]
+        if not reads:
+            # A write lands while the first read is still building its result
+            films["total"] = 8
+            cache.invalidate("films")
+        reads.append(total)
+        return total
+
+    assert read_total() == 7
+    assert read_total() == 8
+    assert read_total() == 8
+    assert reads == [7, 8]
+    assert cache.stats()["stale_skips"] == 1
+
+def test_write_on_another_worker_skips_the_store(backend):
+    worker_a, worker_b = ResponseCache(16, l2=backend), ResponseCache(16, l2=backend)
+    since = worker_a.generation()
+    worker_b.invalidate("films")
+
+    worker_a.set(("films.stats",), {"total_films": 7}, ttl=60, tags=["films"], since=since)
+    assert worker_a.get("films.stats", ("films.stats",)) == (False, None)
+    assert worker_b.get("films.stats", ("films.stats",)) == (False, None)
+
+def test_clearing_the_cache_requires_an_admin(client, auth_headers):
+    assert client.post("/api/v1/metrics/cache/clear").status_code == 401
+    assert client.post("/api/v1/metrics/cache/clear", headers=auth_headers(is_admin=False)).status_code == 403
+    assert client.post("/api/v1/metrics/cache/clear", headers=auth_headers()).status_code == 200
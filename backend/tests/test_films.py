@@ -0,0 +1,143 @@
+from sqlalchemy import event
+
+def test_film_stats_single_pass(client):
+    stats = client.get("/api/v1/films/stats").json()
+    assert stats["total_films"] == 7
+    assert stats["ratings"] == {"PG": 4, "G": 3}
+    assert stats["year_range"] == {"min": 2001, "max": 2007}
+    # two films at 0.99 and five at 2.99
+    assert stats["avg_rental_rate"] == round((2 * 0.99 + 5 * 2.99) / 7, 2)
+    assert stats["length"]["p50"] == 100.0
+    assert stats["length"]["p90"] == 124.0
+
+def test_films_cursor_walks_every_page(client):
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 3}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get("/api/v1/films/", params=params)
+        seen.extend(film["film_id"] for film in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+    assert seen == list(range(1, 8))
+
+    from src.core.pagination import encode_cursor
+    response = client.get("/api/v1/films/", params={"cursor": encode_cursor([{"a": 1}])})
+    assert response.status_code == 400
+
+def test_unified_search_reports_each_source(client):
+    body = client.get("/unified/search", params={"q": "Film 3", "category": "films"}).json()
+    assert [f["id"] for f in body["films"]] == [3]
+    assert body["sources"]["films"]["status"] == "ok"
+    assert set(body["sources"]) == {"films"}
+
+def test_full_text_search_tracks_writes(client, db_session_factory):
+    from src.services.film_search import film_search
+    assert film_search.ensure_index(db_session_factory.kw["bind"])
+
+    created = client.post("/unified/films", params={"title": "Galaxy Quest", "description": "Space comedy"}).json()
+    client.post("/unified/films", params={"title": "Comedy Club", "description": "A comedy about a comedy club"})
+    assert [f["film_id"] for f in client.get("/api/v1/films/", params={"search": "galax"}).json()] == [created["id"]]
+
+    ranked = client.get("/api/v1/films/", params={"search": "comedy"}).json()
+    assert [f["title"] for f in ranked] == ["Comedy Club", "Galaxy Quest"]
+
+    client.delete(f"/unified/films/{created['id']}")
+    assert client.get("/api/v1/films/", params={"search": "galaxy"}).json() == []
+
+def test_total_count_is_opt_in(client):
+    assert "X-Total-Count" not in client.get("/api/v1/films/").headers
+    for mode in ("exact", "estimated", "cached"):
+        response = client.get("/api/v1/films/", params={"count": mode, "rating": "PG", "limit": 2})
+        assert response.headers["X-Total-Count"] == "4"
+
+def test_stats_cache_invalidated_by_writes(client, auth_headers):
+    headers = auth_headers()
+
+    def counters():
+        return client.get("/api/v1/metrics/cache", headers=headers).json()["routes"].get("films.stats", {"hits": 0, "misses": 0})
+
+    before = counters()
+    assert client.get("/api/v1/films/stats").json()["total_films"] == 7
+    assert client.get("/api/v1/films/stats").json()["total_films"] == 7
+    after = counters()
+    assert (after["hits"] - before["hits"], after["misses"] - before["misses"]) == (1, 1)
+
+    client.post("/unified/films", params={"title": "Brand New"})
+    assert client.get("/api/v1/films/stats").json()["total_films"] == 8
+
+def test_conditional_get_on_catalog(client):
+    first = client.get("/api/v1/films/all")
+    etag = first.headers["ETag"]
+    assert first.status_code == 200 and len(first.json()) == 7
+
+    unchanged = client.get("/api/v1/films/all", headers={"If-None-Match": etag})
+    assert unchanged.status_code == 304 and unchanged.content == b""
+    assert client.get("/api/v1/films/all", params={"stream": "ndjson"}, headers={"If-None-Match": etag}).status_code == 304
+
+    client.put("/unified/films/3", params={"title": "Renamed"})
+    changed = client.get("/api/v1/films/all", headers={"If-None-Match": etag})
+    assert changed.status_code == 200 and changed.headers["ETag"] != etag
+    assert client.get("/api/v1/films/all", headers={"If-Modified-Since": changed.headers["Last-Modified"]}).status_code == 304
+    # "-0000" parses to a naive datetime
+    minus_zero = changed.headers["Last-Modified"].replace("GMT", "-0000")
+    assert client.get("/api/v1/films/all", headers={"If-Modified-Since": minus_zero}).status_code == 304
+    assert client.get("/api/v1/films/all", headers={"If-Modified-Since": "Sat, 01 Jan 2000 00:00:00 -0000"}).status_code == 200
+
+def test_sparse_fieldsets_select_only_requested_columns(client, db_session_factory):
+    statements = []
+    event.listen(db_session_factory.kw["bind"], "before_cursor_execute",
+                 lambda conn, cursor, statement, *args: statements.append(statement))
+
+    page = client.get("/api/v1/films/", params={"fields": "title,rating", "limit": 3})
+    assert page.json()[0] == {"film_id": 1, "title": "Film 1", "rating": "PG"}
+    assert "description" not in statements[-1]
+
+    following = client.get("/api/v1/films/", params={"fields": "title", "cursor": page.headers["X-Next-Cursor"]})
+    assert [f["film_id"] for f in following.json()] == [4, 5, 6, 7]
+
+    assert client.get("/api/v1/products/3", params={"fields": "rental_rate"}).json() == {"film_id": 3, "rental_rate": "0.99"}
+    assert client.get("/unified/films/2", params={"fields": "rating,title"}).json() == {"title": "Film 2", "rating": "G"}
+    assert client.get("/api/v1/films/", params={"fields": "title,budget"}).status_code == 400
+
+def test_streaming_film_ingest_reports_per_batch(client):
+    body = "\n".join([
+        '{"title": "Alpha", "release_year": 1999, "rental_rate": "1.99"}',
+        '{"title": "Beta", "length": "long"}',
+        'not json',
+        '',
+        '{"title": "Gamma"}',
+    ])
+    report = client.post("/unified/bulk/films/ingest", params={"batch_size": 2}, content=body,
+                         headers={"Content-Type": "application/x-ndjson"}).json()
+    assert report["inserted"] == 2 and report["failed"] == 2
+    assert [(b["first_line"], b["inserted"]) for b in report["batches"]] == [(1, 1), (3, 1)]
+    assert report["batches"][0]["errors"][0]["line"] == 2
+    assert [client.get(f"/api/v1/films/{i}").json()["title"] for i in report["ids"]] == ["Alpha", "Gamma"]
+
+    csv_body = 'title,description,rating\n"Delta","two\nlines",PG\nEpsilon,,\n'
+    report = client.post("/unified/bulk/films/ingest", content=csv_body, headers={"Content-Type": "text/csv"}).json()
+    assert report["inserted"] == 2 and report["failed"] == 0
+    delta, epsilon = (client.get(f"/api/v1/films/{i}").json() for i in report["ids"])
+    assert (delta["description"], epsilon["rating"]) == ("two\nlines", "G")
+
+def test_missing_search_index_is_reprobed(db_session_factory, monkeypatch):
+    from src.core.config import settings
+    from src.services import film_search
+    from src.services.film_search import FilmSearchService
+    engine = db_session_factory.kw["bind"]
+    search = FilmSearchService()
+    with engine.begin() as conn:
+        conn.exec_driver_sql("DROP TABLE IF EXISTS film_fts")
+
+    monkeypatch.setattr(settings, "film_search_probe_seconds", 3600)
+    assert not search.is_available(engine)
+    # A migration run by another process is not seen until the miss expires
+    FilmSearchService().ensure_index(engine)
+    assert not search.is_available(engine)
+
+    now = film_search.time.monotonic()
+    monkeypatch.setattr(film_search.time, "monotonic", lambda: now + 3601)
+    assert search.is_available(engine)
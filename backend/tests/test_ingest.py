@@ -0,0 +1,54 @@
+import asyncio
+
+from bson import ObjectId
+from pymongo.errors import BulkWriteError
+from pymongo.results import InsertManyResult
+
+from src.core.ingest import iter_ndjson
+from src.services.document_ingest import document_ingest, review_document
+
+class RecordingCollection:
+    """Minimal async collection: rejects reviews titled "dup" like a unique index would"""
+
+    name = "reviews"
+
+    def __init__(self):
+        self.stored, self.in_flight, self.peak = [], 0, 0
+
+    async def insert_many(self, documents, ordered=True):
+        assert ordered is False
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        errors = []
+        for index, document in enumerate(documents):
+            document["_id"] = ObjectId()
+            if document["title"] == "dup":
+                errors.append({"index": index, "errmsg": "E11000 duplicate key"})
+            else:
+                self.stored.append(document)
+        if errors:
+            raise BulkWriteError({"writeErrors": errors, "nInserted": len(documents) - len(errors)})
+        return InsertManyResult([document["_id"] for document in documents], acknowledged=True)
+
+async def _body(lines):
+    for line in lines:
+        yield line.encode() + b"\n"
+
+def test_review_ingest_is_unordered_batched_and_concurrent():
+    lines = [f'{{"title": "r{i}", "rating": 9, "created_at": "2020-01-02T03:04:05Z"}}' for i in range(10)]
+    lines[3] = '{"title": "dup"}'
+    lines[6] = '{"rating": "five"}'
+    collection = RecordingCollection()
+
+    report = asyncio.run(document_ingest.ingest(
+        collection, iter_ndjson(_body(lines)), review_document, batch_size=4, concurrency=2, return_ids=True
+    ))
+
+    assert (report["inserted"], report["failed"]) == (8, 2)
+    assert [(b["inserted"], b["failed"]) for b in report["batches"]] == [(3, 1), (3, 1), (2, 0)]
+    assert [e["line"] for b in report["batches"] for e in b["errors"]] == [4, 7]
+    assert len(report["batches"][0]["ids"]) == 3
+    assert collection.peak == 2
+    assert {d["rating"] for d in collection.stored} == {5} and collection.stored[0]["created_at"].year == 2020
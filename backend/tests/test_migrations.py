@@ -0,0 +1,21 @@
+from sqlalchemy import create_engine, inspect
+from sqlalchemy.pool import StaticPool
+
+from src.db.migrations import MIGRATIONS, migration_runner
+
+def test_migrations_apply_once_and_create_hot_path_indexes():
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+
+    assert [m.version for m in migration_runner.upgrade(engine)] == [m.version for m in MIGRATIONS]
+    assert migration_runner.upgrade(engine) == []
+    assert set(migration_runner.applied(engine)) == {m.version for m in MIGRATIONS}
+    assert migration_runner.verify(engine) == []
+
+    inspector = inspect(engine)
+    film_indexes = {index["name"]: index["column_names"] for index in inspector.get_indexes("film")}
+    assert film_indexes["idx_film_rating_film_id"] == ["rating", "film_id"]
+    assert "film_fts" in inspector.get_table_names()
+
+    with engine.begin() as conn:
+        conn.exec_driver_sql("DROP INDEX idx_payment_customer_id_payment_date")
+    assert migration_runner.verify(engine) == ["payment.idx_payment_customer_id_payment_date"]
@@ -0,0 +1,94 @@
+import pytest
+from pymongo.errors import ServerSelectionTimeoutError
+
+from src.core.config import settings
+from src.db import mongo_catalog as catalog_module
+from src.db.mongo_catalog import MongoCatalog
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(catalog_module.time, "monotonic", clock)
+    return clock
+
+def discovering(*results):
+    """A _discover stand-in returning (or raising) ``results`` in turn and counting calls"""
+    results = list(results)
+
+    def discover():
+        discover.calls += 1
+        result = results.pop(0) if len(results) > 1 else results[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
+    discover.calls = 0
+    return discover
+
+def test_catalog_is_reused_until_ttl_or_refresh(clock):
+    catalog = MongoCatalog()
+    catalog._discover = discovering({"app": ["publications"]}, {"app": ["publications", "reviews"]})
+
+    assert catalog.publication_collections() == [("app", "publications")]
+    clock.now += settings.mongo_catalog_ttl_seconds - 1
+    assert catalog.databases() == {"app": ["publications"]}
+    assert catalog._discover.calls == 1
+
+    assert catalog.refresh() == {"app": ["publications", "reviews"]}
+    assert catalog._discover.calls == 2
+
+    clock.now += settings.mongo_catalog_ttl_seconds + 1
+    catalog.databases()
+    assert catalog._discover.calls == 3
+
+def test_failed_refresh_serves_stale_catalog_and_backs_off(clock):
+    catalog = MongoCatalog()
+    down = ServerSelectionTimeoutError("down")
+    catalog._discover = discovering({"app": ["publications"]}, down, down, {"app": ["reviews"]})
+    catalog.databases()
+
+    clock.now += settings.mongo_catalog_ttl_seconds + 1
+    for _ in range(3):
+        assert catalog.databases() == {"app": ["publications"]}
+    assert catalog._discover.calls == 2
+
+    clock.now += settings.mongo_retry_after_seconds + 1
+    assert catalog.databases() == {"app": ["publications"]}
+    assert catalog._discover.calls == 3
+
+    clock.now += settings.mongo_retry_after_seconds + 1
+    assert catalog.databases() == {"app": ["reviews"]}
+
+def test_failed_first_discovery_raises_without_retrying(clock):
+    catalog = MongoCatalog()
+    catalog._discover = discovering(ServerSelectionTimeoutError("down"))
+
+    for _ in range(2):
+        with pytest.raises(ServerSelectionTimeoutError):
+            catalog.databases()
+    assert catalog._discover.calls == 1
+
+def test_failed_forced_refresh_raises(clock):
+    catalog = MongoCatalog()
+    catalog._discover = discovering({"app": ["publications"]}, ServerSelectionTimeoutError("down"))
+    catalog.databases()
+
+    with pytest.raises(ServerSelectionTimeoutError):
+        catalog.refresh()
+    assert catalog.databases() == {"app": ["publications"]}
+
+def test_refresh_endpoint_is_admin_only_and_reports_outages(client, auth_headers, monkeypatch):
+    def down():
+        raise ServerSelectionTimeoutError("down")
+    monkeypatch.setattr(catalog_module.mongo_catalog, "_discover", down)
+    monkeypatch.setattr(catalog_module.mongo_catalog, "_state", catalog_module.mongo_catalog._state)  # restored afterwards
+
+    assert client.post("/unified/catalog/refresh").status_code == 401
+    assert client.post("/unified/catalog/refresh", headers=auth_headers(is_admin=False)).status_code == 403
+    assert client.post("/unified/catalog/refresh", headers=auth_headers()).status_code == 503
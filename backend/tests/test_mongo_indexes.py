@@ -0,0 +1,32 @@
+from src.core.config import settings
+from src.db.mongo_indexes import _stages, declared_indexes, mongo_indexes
+
+class IndexedCollection:
+    def __init__(self, info):
+        self.info = info
+
+    def index_information(self):
+        return self.info
+
+def test_diff_reports_missing_extra_and_changed_indexes():
+    collections = {}
+    for (db_name, collection_name), indexes in declared_indexes().items():
+        info = {"_id_": {"key": [("_id", 1)]}}
+        info.update({index.document["name"]: {"key": list(index.document["key"].items())} for index in indexes})
+        collections.setdefault(db_name, {})[collection_name] = IndexedCollection(info)
+    reviews = collections[settings.mongo_database]["reviews"].info
+    del reviews["reviews_user"]
+    reviews["reviews_product_created"] = {"key": [("product_id", 1.0), ("created_at", 1.0)]}
+    reviews["legacy_rating"] = {"key": [("rating", 1)]}
+
+    report = mongo_indexes.diff(collections)
+    assert report[f"{settings.mongo_database}.reviews"] == {
+        "missing": ["reviews_user"], "extra": ["legacy_rating"], "changed": ["reviews_product_created"],
+    }
+    assert report[f"{settings.publications_database}.{settings.publications_collection}"] == {
+        "missing": [], "extra": [], "changed": [],
+    }
+
+def test_explain_stages_find_nested_collscan():
+    plan = {"stage": "LIMIT", "inputStage": {"stage": "SORT", "inputStage": {"stage": "COLLSCAN"}}}
+    assert _stages({"queryPlan": plan}) == ["LIMIT", "SORT", "COLLSCAN"]
@@ -0,0 +1,44 @@
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from src.core.pagination import apply_keyset, decode_cursor, encode_cursor
+from src.db.models import Base, Film
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    session.add_all([Film(film_id=i, title=f"Film {i}", rating="PG" if i % 2 else "G") for i in range(1, 26)])
+    session.commit()
+    yield session
+    session.close()
+
+def test_cursor_round_trip():
+    assert decode_cursor(encode_cursor(["PG", 42]), 2) == ["PG", 42]
+
+def test_invalid_cursor_rejected():
+    with pytest.raises(HTTPException):
+        decode_cursor("not-a-cursor", 1)
+    with pytest.raises(HTTPException):
+        decode_cursor(encode_cursor([1, 2]), 1)
+    # Well-formed JSON, but not something a column can be compared with
+    for values in ([{"a": 1}, 2], ["PG", [1]]):
+        with pytest.raises(HTTPException) as exc:
+            decode_cursor(encode_cursor(values), 2)
+        assert exc.value.status_code == 400
+
+def test_keyset_pages_match_offset_pages(db):
+    keyset = [Film.rating, Film.film_id]
+    expected = [f.film_id for f in db.query(Film).order_by(*keyset).all()]
+
+    seen, cursor = [], None
+    while True:
+        page = apply_keyset(db.query(Film), keyset, cursor).limit(7).all()
+        seen.extend(f.film_id for f in page)
+        if len(page) < 7:
+            break
+        cursor = encode_cursor([page[-1].rating, page[-1].film_id])
+
+    assert seen == expected
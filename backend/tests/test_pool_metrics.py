@@ -0,0 +1,36 @@
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeout
+
+from src.db.pool_metrics import InstrumentedQueuePool, pool_metrics
+
+def test_pool_metrics_count_overflow_timeouts_and_lifetimes(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool, pool_size=1, max_overflow=1, pool_timeout=0.05,
+    )
+    pool_metrics.reset()
+    pool_metrics.instrument(engine)
+
+    first, second = engine.connect(), engine.connect()
+    first.execute(text("SELECT 1"))
+    assert len(pool_metrics.checked_out()) == 2
+    with pytest.raises(PoolTimeout):
+        engine.connect()
+    second.close()  # overflow connection: closed on checkin, not kept
+    first.close()
+
+    stats = pool_metrics.stats(engine)
+    assert (stats["checkouts"], stats["overflow_checkouts"], stats["timeouts"]) == (2, 1, 1)
+    assert stats["pool"]["size"] == 1 and stats["pool"]["checked_out"] == 0
+    assert stats["wait_ms"]["count"] == 3 and stats["wait_ms"]["max"] >= 50
+    assert stats["held_ms"]["count"] == 2
+    assert (stats["connects"], stats["closed"], stats["connection_lifetime_s"]["count"]) == (2, 1, 1)
+    assert pool_metrics.checked_out() == []
+    engine.dispose()
+
+def test_pool_metrics_are_admin_only(client, auth_headers):
+    assert client.get("/api/v1/metrics/db-pool").status_code == 401
+    assert client.get("/api/v1/metrics/db-pool", headers=auth_headers(is_admin=False)).status_code == 403
+    response = client.get("/api/v1/metrics/db-pool/connections", headers=auth_headers())
+    assert response.status_code == 200 and "checked_out" in response.json()
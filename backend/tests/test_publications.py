@@ -0,0 +1,55 @@
+from types import SimpleNamespace
+
+from src.api import publications
+
+class Cursor:
+    def __init__(self, documents):
+        self.documents = documents
+
+    def sort(self, *args):
+        return self
+
+    def skip(self, n):
+        return self
+
+    def limit(self, n):
+        return self
+
+    async def to_list(self, length):
+        return self.documents
+
+class Publications:
+    """Motor-style collection that records count calls"""
+
+    def __init__(self):
+        self.database = SimpleNamespace(name="research")
+        self.name = "publications_unfiltered"
+        self.counted = []
+
+    async def index_information(self):
+        return {}
+
+    async def count_documents(self, filter):
+        self.counted.append(filter)
+        return 1
+
+    async def estimated_document_count(self):
+        return 364908
+
+    def find(self, query, projection=None):
+        return Cursor([{"_id": 1, "title": "Big data"}])
+
+def test_filtered_lists_are_only_counted_on_request(client, monkeypatch):
+    collection = Publications()
+
+    async def get_collection():
+        return collection
+    monkeypatch.setattr(publications, "get_publications_collection", get_collection)
+
+    assert client.get("/api/v1/publications/", params={"search": "data"}).json()["total"] is None
+    assert client.get("/api/v1/publications/", params={"type_filter": "Journal"}).json()["total"] is None
+    assert collection.counted == []
+    assert client.get("/api/v1/publications/").json()["total"] == 364908
+
+    assert client.get("/api/v1/publications/", params={"search": "data", "count": "exact"}).json()["total"] == 1
+    assert len(collection.counted) == 1
@@ -0,0 +1,49 @@
+from datetime import datetime
+
+import pytest
+from bson import ObjectId
+from fastapi import HTTPException
+
+from src.services.review_feed import feed_query, next_cursor
+
+def test_feed_cursor_seeks_past_last_review():
+    last_id = ObjectId()
+    page = [{"_id": ObjectId(), "created_at": datetime(2024, 3, 1)}, {"_id": last_id, "created_at": datetime(2024, 2, 1)}]
+
+    query, order = feed_query(7, "newest", None)
+    assert query == {"product_id": 7} and order == [("created_at", -1), ("_id", -1)]
+    assert next_cursor(page, "newest", limit=3) is None
+
+    query, _ = feed_query(7, "newest", next_cursor(page, "newest", limit=2))
+    assert query["product_id"] == 7
+    assert query["$or"][:2] == [
+        {"created_at": {"$lt": datetime(2024, 2, 1)}},
+        {"created_at": datetime(2024, 2, 1), "_id": {"$lt": last_id}},
+    ]
+
+    # Reviews without helpful_count sort last and are paged by _id alone
+    query, _ = feed_query(7, "helpful", next_cursor([{"_id": last_id}], "helpful", limit=1))
+    assert query == {"product_id": 7, "helpful_count": None, "_id": {"$lt": last_id}}
+
+    with pytest.raises(HTTPException):
+        feed_query(7, "newest", next_cursor([{"_id": "nope", "created_at": None}], "newest", limit=1))
+
+def test_feed_cursor_carries_the_sort_key_type():
+    from src.core.pagination import encode_cursor
+    last_id = ObjectId()
+
+    # Past a dated review the seek continues into reviews stored with a string created_at
+    query, _ = feed_query(7, "newest", next_cursor([{"_id": last_id, "created_at": datetime(2024, 2, 1)}], "newest", limit=1))
+    assert {"created_at": {"$type": ["number", "string"]}} in query["$or"]
+
+    query, _ = feed_query(7, "newest", next_cursor([{"_id": last_id, "created_at": "2023-05-01"}], "newest", limit=1))
+    assert query["$or"][:2] == [
+        {"created_at": {"$lt": "2023-05-01"}},
+        {"created_at": "2023-05-01", "_id": {"$lt": last_id}},
+    ]
+    assert {"created_at": {"$type": ["number"]}} in query["$or"]
+
+    for bad in (["date", "yesterday", str(last_id)], ["number", "5", str(last_id)], ["object", {}, str(last_id)]):
+        with pytest.raises(HTTPException) as exc:
+            feed_query(7, "newest", encode_cursor(bad))
+        assert exc.value.status_code == 400
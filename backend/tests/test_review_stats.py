@@ -0,0 +1,78 @@
+from datetime import datetime
+
+from src.db.mongo import get_mongo_db
+from src.main import app
+from src.services.review_stats import REVIEW_STATS_COLLECTION, review_stats, star
+
+class StatsCollection:
+    """Applies the $inc/$max upserts review_stats sends, like MongoDB would"""
+
+    def __init__(self):
+        self.documents, self.queries = {}, 0
+
+    def bulk_write(self, ops, ordered=True):
+        for op in ops:
+            document = self.documents.setdefault(op._filter["_id"], {"_id": op._filter["_id"]})
+            for path, amount in op._doc.get("$inc", {}).items():
+                target = document
+                *parents, leaf = path.split(".")
+                for name in parents:
+                    target = target.setdefault(name, {})
+                target[leaf] = target.get(leaf, 0) + amount
+            for name, value in op._doc.get("$max", {}).items():
+                document[name] = max(document.get(name, value), value)
+
+    def find_one(self, query):
+        return self.documents.get(query["_id"])
+
+    def find(self, query):
+        self.queries += 1
+        return [self.documents[i] for i in query["_id"]["$in"] if i in self.documents]
+
+def test_rollup_tracks_create_update_delete():
+    db = {REVIEW_STATS_COLLECTION: StatsCollection()}
+    first = {"product_id": 7, "rating": 5, "created_at": datetime(2024, 1, 1)}
+    second = {"product_id": 7, "rating": 3, "created_at": datetime(2024, 2, 1)}
+    review_stats.record_created(db, first, second, {"product_id": None, "rating": 1})
+
+    summary = review_stats.summary(db, 7)
+    assert (summary["total_reviews"], summary["average_rating"]) == (2, 4.0)
+    assert summary["rating_distribution"] == {"1": 0, "2": 0, "3": 1, "4": 0, "5": 1}
+    assert summary["last_review_at"] == datetime(2024, 2, 1)
+
+    review_stats.record_updated(db, second, {**second, "rating": 1})
+    review_stats.record_deleted(db, first)
+    summary = review_stats.summary(db, 7)
+    assert (summary["total_reviews"], summary["average_rating"]) == (1, 1.0)
+    assert summary["rating_distribution"] == {"1": 1, "2": 0, "3": 0, "4": 0, "5": 0}
+
+    assert review_stats.summary(db, 8)["total_reviews"] == 0
+
+def test_batch_summaries_are_one_in_query(client):
+    stats = StatsCollection()
+    db = {REVIEW_STATS_COLLECTION: stats}
+    review_stats.record_created(db, {"product_id": 1, "rating": 4}, {"product_id": 3, "rating": 2})
+    app.dependency_overrides[get_mongo_db] = lambda: db
+
+    response = client.get("/api/v1/reviews/summaries?product_ids=3,2,1,3")
+    assert response.status_code == 200
+    assert [(s["product_id"], s["total_reviews"]) for s in response.json()] == [(3, 1), (2, 0), (1, 1)]
+    assert stats.queries == 1
+
+    response = client.post("/api/v1/reviews/summaries", json=[1, 2])
+    assert [s["average_rating"] for s in response.json()] == [4.0, 0]
+    assert client.post("/api/v1/reviews/summaries", json=list(range(501))).status_code == 400
+
+def test_summary_and_feed_fail_honestly_without_mongo(client):
+    app.dependency_overrides[get_mongo_db] = lambda: None
+    assert client.get("/api/v1/reviews/product/7/summary").status_code == 503
+    assert client.get("/api/v1/reviews/product/7").status_code == 503
+
+def test_ratings_are_normalised_like_the_rebuild():
+    assert [star(r) for r in (4, 4.0, "5", 4.5, "4_0", True, None, 6)] == [4, 4, 5, None, None, None, None, None]
+
+    db = {REVIEW_STATS_COLLECTION: StatsCollection()}
+    review_stats.record_created(db, *({"product_id": 7, "rating": r} for r in (4.0, "5", "bad", None)))
+    summary = review_stats.summary(db, 7)
+    assert (summary["total_reviews"], summary["average_rating"]) == (4, 4.5)
+    assert summary["rating_distribution"] == {"1": 0, "2": 0, "3": 0, "4": 1, "5": 1}
@@ -0,0 +1,29 @@
+from decimal import Decimal
+from typing import List
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.db.models import Film
+from src.schemas import FilmResponse
+
+def test_fast_path_matches_response_model_bytes(client, db_session_factory):
+    session = db_session_factory()
+    session.add(Film(
+        film_id=50, title='Ünïcode "quotes" \\ tab\t – ✓', description="line\nbreak\x01",
+        rental_rate=Decimal("10.50"), rating=None,
+    ))
+    session.commit()
+    session.close()
+
+    # Reference: the default FastAPI path over ORM objects
+    reference = FastAPI()
+
+    @reference.get("/films", response_model=List[FilmResponse])
+    def films():
+        with db_session_factory() as db:
+            return db.query(Film).all()
+
+    expected = TestClient(reference).get("/films").content
+    assert client.get("/api/v1/films/all").content == expected
+    assert client.get("/api/v1/products/all").content == expected
@@ -0,0 +1,35 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.auth import get_current_admin
+from src.core.startup import LazyRouter, LazyRouters, startup_profile
+
+def test_lazy_routers_load_on_first_use_and_for_docs():
+    app = FastAPI()
+    app.dependency_overrides[get_current_admin] = lambda: None
+    lazy = LazyRouters(app, [
+        LazyRouter("src.api.metrics", "/metrics", ["Metrics"], "/metrics"),
+        LazyRouter("src.api.debug", "/unified", ["Debug"], "/unified/debug"),
+    ])
+    client = TestClient(app)
+    assert len(lazy.pending) == 2
+
+    response = client.get("/metrics/startup")
+    assert response.status_code == 200
+    assert [r.module for r in lazy.pending] == ["src.api.debug"]
+    assert any(phase["name"] == "import src.api.metrics" for phase in response.json()["phases"])
+
+    assert "/unified/debug/mongodb" in client.get("/openapi.json").json()["paths"]
+    assert lazy.pending == []
+    assert startup_profile.format().splitlines()[0].startswith("phase")
+
+def test_openapi_is_built_once_with_every_lazy_router():
+    app = FastAPI()
+    lazy = LazyRouters(app, [LazyRouter("src.api.debug", "/unified", ["Debug"], "/unified/debug")])
+    routes = app.router.routes
+
+    schema = app.openapi()
+    assert "/unified/debug/mongodb" in schema["paths"] and lazy.pending == []
+    assert app.router.routes is not routes and len(routes) < len(app.router.routes)  # swapped in, not mutated
+    TestClient(app).get("/health")
+    assert app.openapi() is schema
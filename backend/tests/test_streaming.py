@@ -0,0 +1,14 @@
+import json
+
+def test_stream_ndjson_matches_plain_response(client):
+    plain = client.get("/api/v1/films/all").json()
+    response = client.get("/api/v1/films/all?stream=ndjson")
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert [json.loads(line) for line in response.text.splitlines()] == plain
+
+def test_stream_json_array_matches_plain_response(client):
+    plain = client.get("/api/v1/films/all").json()
+    assert client.get("/api/v1/films/all?stream=json").json() == plain
+
+def test_stream_rejects_unknown_format(client):
+    assert client.get("/api/v1/films/all?stream=csv").status_code == 422
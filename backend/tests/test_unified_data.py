@@ -0,0 +1,118 @@
+from types import SimpleNamespace
+
+from src.api import unified_data
+from src.core.cache import response_cache
+from src.core.config import settings
+from src.db.mongo import get_mongo_db
+from src.main import app
+from src.services.publication_search import publication_index
+
+class Cursor(list):
+    time_limits = []
+
+    def sort(self, *args):
+        return self
+
+    def skip(self, n):
+        return self
+
+    def limit(self, n):
+        return self
+
+    def max_time_ms(self, ms):
+        self.time_limits.append(ms)
+        return self
+
+class Collection:
+    def __init__(self, db_name, name, documents=()):
+        self.database = SimpleNamespace(name=db_name)
+        self.name = name
+        self.documents = list(documents)
+        self.filters = []
+
+    def find(self, filter, projection=None):
+        self.filters.append(filter)
+        return Cursor(self.documents)
+
+class Database:
+    def __init__(self, collections, name):
+        self.collections, self.name = collections, name
+
+    def __getitem__(self, name):
+        return self.collections[(self.name, name)]
+
+    def __getattr__(self, name):
+        return self[name]
+
+class Client:
+    """Just enough of a pymongo client for the publication search helper"""
+
+    def __init__(self, *collections):
+        self.collections = {(c.database.name, c.name): c for c in collections}
+
+    def __getitem__(self, db_name):
+        return Database(self.collections, db_name)
+
+def test_publication_search_uses_text_index_fallback(monkeypatch):
+    app_publications = Collection(settings.mongo_database, "publications")
+    research = Collection(settings.publications_database, settings.publications_collection, [
+        {"_id": 1, "title": "Big data", "type": "Journal", "groups": ["Physics"], "score": 2.5},
+    ])
+    monkeypatch.setattr(unified_data, "get_mongo_db", lambda: object())
+    monkeypatch.setattr(unified_data, "get_sync_client", lambda: Client(app_publications, research))
+    publication_index.mark_ready(research)
+
+    results = unified_data._search_publications(None, "data", 0, 10, 1.0)
+
+    assert [r["title"] for r in results] == ["Big data"]
+    assert research.filters == [{"$text": {"$search": "data"}}]
+    assert "$or" in app_publications.filters[0]
+
+def test_publication_search_shares_one_budget(monkeypatch):
+    clock = [100.0]
+    class SlowCursor(Cursor):
+        def max_time_ms(self, ms):
+            clock[0] += 0.5  # every query runs for 500ms
+            return super().max_time_ms(ms)
+
+    class SlowCollection(Collection):
+        def find(self, filter, projection=None):
+            return SlowCursor(super().find(filter, projection))
+
+        def index_information(self):
+            return {}
+
+    empty = [
+        SlowCollection(settings.mongo_database, "publications"),
+        SlowCollection(settings.publications_database, settings.publications_collection),
+        SlowCollection("archive", "publications"),
+    ]
+    monkeypatch.setattr(unified_data, "get_mongo_db", lambda: object())
+    monkeypatch.setattr(unified_data, "get_sync_client", lambda: Client(*empty))
+    monkeypatch.setattr(unified_data.mongo_catalog, "publication_collections", lambda: [("archive", "publications")])
+    monkeypatch.setattr(unified_data.time, "perf_counter", lambda: clock[0])
+    monkeypatch.setattr(Cursor, "time_limits", [])
+
+    assert unified_data._search_publications(None, "data", 0, 10, 1.0) == []
+    # Each query gets what is left of the 1s budget; the last option is never tried
+    assert Cursor.time_limits == [1000, 500]
+    assert empty[2].filters == []
+
+def test_stats_are_not_cached_while_mongo_is_down(client):
+    app.dependency_overrides[get_mongo_db] = lambda: None
+    cache_stats = lambda: response_cache.stats()["routes"].get("unified.stats", {"hits": 0, "misses": 0})
+
+    for _ in range(2):
+        response = client.get("/unified/stats")
+        assert response.status_code == 200
+        assert response.json()["mongodb"] == {"publications": 0, "reviews": 0}
+    assert cache_stats() == {"hits": 0, "misses": 2}
+
+def test_sql_sources_set_a_postgres_statement_timeout():
+    statements = []
+    session = SimpleNamespace(
+        get_bind=lambda: SimpleNamespace(dialect=SimpleNamespace(name="postgresql")),
+        execute=lambda statement, params: statements.append((str(statement), params)),
+    )
+    unified_data._statement_timeout(session, 1.5)
+    assert statements == [("SELECT set_config('statement_timeout', :ms, true)", {"ms": "1500"})]